@@ -0,0 +1,612 @@
+#!/usr/bin/env python3
+"""
+Benchmarks the consumer latency pipeline against an in-process fake Kafka cluster.
+
+    python -m benchmarks.consumer_latency --groups 1000 --partitions 64 --max-workers 32
+
+Every admin request and every consumer fetch waits `--request-latency` seconds before it
+resolves, so the results show how the pipeline overlaps round trips rather than how fast
+a real broker is.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import random
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Mapping
+from unittest.mock import patch
+
+import click
+from confluent_kafka import (  # type: ignore[import-untyped]
+    TIMESTAMP_CREATE_TIME,
+    ConsumerGroupTopicPartitions,
+    KafkaError,
+    TopicPartition,
+)
+from confluent_kafka.admin import (  # type: ignore[import-untyped]
+    ConsumerGroupListing,
+    ListConsumerGroupsResult,
+    ListOffsetsResultInfo,
+)
+
+from sentry_kafka_management.actions.latency.consumer_latency import (
+    DEFAULT_MAX_WORKERS,
+    ClusterLatencyScanner,
+    Concurrency,
+    ScanEngine,
+)
+from sentry_kafka_management.actions.latency.metrics import (
+    COLLECTOR_METRICS_PREFIX,
+    Metric,
+    MetricsBackend,
+    Tags,
+)
+from sentry_kafka_management.actions.latency.sampling import SamplingPolicy
+from sentry_kafka_management.actions.latency.timestamp_cache import OffsetTimestampCache
+from sentry_kafka_management.brokers import ClusterConfig, KafkaConfig, TopicConfig
+
+HIGH_WATERMARK = 1_000
+# How far apart in time consecutive messages of a fake partition were produced.
+MESSAGE_INTERVAL_MS = 10
+# How often the thread sampler checks how many threads are alive.
+THREAD_SAMPLE_INTERVAL = 0.005
+
+
+class _DelayedResults:
+    """
+    Resolves futures after a delay from a single timer thread, so thousands of requests
+    can be in flight at once like they are in librdkafka.
+    """
+
+    def __init__(self) -> None:
+        self.__cond = threading.Condition()
+        self.__pending: list[tuple[float, int, Future[Any], Any]] = []
+        self.__seq = itertools.count()
+        self.__closed = False
+        self.__thread = threading.Thread(target=self.__run, name="fake-kafka", daemon=True)
+        self.__thread.start()
+
+    def resolve_later(self, value: Any, delay: float) -> Future[Any]:
+        future: Future[Any] = Future()
+        with self.__cond:
+            heapq.heappush(
+                self.__pending, (time.monotonic() + delay, next(self.__seq), future, value)
+            )
+            self.__cond.notify()
+        return future
+
+    def close(self) -> None:
+        with self.__cond:
+            self.__closed = True
+            self.__cond.notify()
+        self.__thread.join()
+
+    def __run(self) -> None:
+        while True:
+            with self.__cond:
+                while not self.__closed and (
+                    not self.__pending or self.__pending[0][0] > time.monotonic()
+                ):
+                    wait = self.__pending[0][0] - time.monotonic() if self.__pending else None
+                    self.__cond.wait(wait)
+                if self.__closed:
+                    return
+                _, _, future, value = heapq.heappop(self.__pending)
+            future.set_result(value)
+
+
+class FakeMessage:
+    def __init__(
+        self,
+        topic: str,
+        partition: int,
+        offset: int,
+        timestamp_ms: int,
+        error: KafkaError | None = None,
+    ) -> None:
+        self.__topic = topic
+        self.__partition = partition
+        self.__offset = offset
+        self.__timestamp_ms = timestamp_ms
+        self.__error = error
+
+    def topic(self) -> str:
+        return self.__topic
+
+    def partition(self) -> int:
+        return self.__partition
+
+    def offset(self) -> int:
+        return self.__offset
+
+    def error(self) -> KafkaError | None:
+        return self.__error
+
+    def timestamp(self) -> tuple[int, int]:
+        return TIMESTAMP_CREATE_TIME, self.__timestamp_ms
+
+
+class FakeKafkaCluster:
+    """
+    An in-process cluster of `groups` consumer groups, each committed on every partition
+    of `topics` topics with `partitions` partitions.
+
+    A `lag_fraction` share of group partitions are committed behind the high watermark;
+    the rest are caught up.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        groups: int,
+        topics: int,
+        partitions: int,
+        request_latency: float,
+        lag_fraction: float,
+        seed: int = 0,
+    ) -> None:
+        self.name = name
+        self.request_latency = request_latency
+        self.requests: Counter[str] = Counter()
+        self.topics = [f"topic-{i}" for i in range(topics)]
+        self.partitions = partitions
+        self.group_ids = [f"group-{i}" for i in range(groups)]
+        self.__lock = threading.Lock()
+        self.__results = _DelayedResults()
+        self.__produced_at_ms = int(time.time() * 1000)
+
+        rng = random.Random(seed)
+        self.committed = {
+            group_id: [
+                TopicPartition(
+                    topic,
+                    partition,
+                    (
+                        HIGH_WATERMARK - rng.randint(1, HIGH_WATERMARK - 1)
+                        if rng.random() < lag_fraction
+                        else HIGH_WATERMARK
+                    ),
+                )
+                for topic in self.topics
+                for partition in range(partitions)
+            ]
+            for group_id in self.group_ids
+        }
+
+    @property
+    def bootstrap_servers(self) -> str:
+        return f"{self.name}:9092"
+
+    def cluster_config(self) -> ClusterConfig:
+        return ClusterConfig(
+            brokers=[self.bootstrap_servers],
+            security_protocol=None,
+            sasl_mechanism=None,
+            sasl_username=None,
+            sasl_password=None,
+            password_is_plaintext=False,
+        )
+
+    def topics_config(self) -> dict[str, TopicConfig]:
+        return {
+            topic: TopicConfig(
+                partitions=self.partitions,
+                placement=None,
+                replication_factor=1,
+                settings={},
+            )
+            for topic in self.topics
+        }
+
+    def count(self, kind: str, n: int = 1) -> None:
+        with self.__lock:
+            self.requests[kind] += n
+
+    def message_at(self, topic: str, partition: int, offset: int) -> FakeMessage:
+        if offset >= HIGH_WATERMARK:
+            return FakeMessage(topic, partition, offset, -1, KafkaError(KafkaError._PARTITION_EOF))
+        age_ms = (HIGH_WATERMARK - offset) * MESSAGE_INTERVAL_MS
+        return FakeMessage(topic, partition, offset, self.__produced_at_ms - age_ms)
+
+    # AdminClient API
+
+    def list_consumer_groups(self, **_kwargs: Any) -> Future[ListConsumerGroupsResult]:
+        self.count("ListGroups")
+        result = ListConsumerGroupsResult()
+        result.valid = [
+            ConsumerGroupListing(group_id=group_id, is_simple_consumer_group=False)
+            for group_id in self.group_ids
+        ]
+        result.errors = []
+        return self.__results.resolve_later(result, self.request_latency)
+
+    def list_consumer_group_offsets(
+        self, requests: list[ConsumerGroupTopicPartitions], **_kwargs: Any
+    ) -> dict[str, Future[ConsumerGroupTopicPartitions]]:
+        self.count("OffsetFetch")
+        (request,) = requests
+        group_id = request.group_id
+        return {
+            group_id: self.__results.resolve_later(
+                ConsumerGroupTopicPartitions(group_id, self.committed[group_id]),
+                self.request_latency,
+            )
+        }
+
+    def list_offsets(
+        self, requests: Mapping[TopicPartition, Any], **_kwargs: Any
+    ) -> dict[TopicPartition, Future[ListOffsetsResultInfo]]:
+        self.count("ListOffsets")
+        return {
+            tp: self.__results.resolve_later(
+                ListOffsetsResultInfo(offset=HIGH_WATERMARK, timestamp=-1, leader_epoch=-1),
+                self.request_latency,
+            )
+            for tp in requests
+        }
+
+    def close(self) -> None:
+        self.__results.close()
+
+
+class FakeConsumer:
+    """
+    Serves the message at each assigned offset once, one fetch round trip per consume().
+    """
+
+    def __init__(self, cluster: FakeKafkaCluster) -> None:
+        self.__cluster = cluster
+        self.__assigned: dict[tuple[str, int], int] = {}
+        self.__paused: set[tuple[str, int]] = set()
+        cluster.count("ConsumerCreate")
+
+    def assign(self, partitions: list[TopicPartition]) -> None:
+        self.__assigned = {(tp.topic, tp.partition): tp.offset for tp in partitions}
+        self.__paused = set()
+
+    def unassign(self) -> None:
+        self.__assigned = {}
+        self.__paused = set()
+
+    def pause(self, partitions: list[TopicPartition]) -> None:
+        self.__paused.update((tp.topic, tp.partition) for tp in partitions)
+
+    def get_watermark_offsets(
+        self, partition: TopicPartition, timeout: float = -1, cached: bool = False
+    ) -> tuple[int, int]:
+        return 0, HIGH_WATERMARK
+
+    def consume(self, num_messages: int = 1, timeout: float = -1) -> list[FakeMessage]:
+        ready = [key for key in self.__assigned if key not in self.__paused]
+        if not ready:
+            time.sleep(max(timeout, 0))
+            return []
+        self.__cluster.count("Fetch")
+        time.sleep(min(self.__cluster.request_latency, max(timeout, 0)))
+        return [
+            self.__cluster.message_at(topic, partition, self.__assigned[(topic, partition)])
+            for topic, partition in ready[:num_messages]
+        ]
+
+    def close(self) -> None:
+        pass
+
+
+class FakeKafkaConfig(KafkaConfig):
+    def __init__(self, clusters: list[FakeKafkaCluster]) -> None:
+        self.__clusters = {cluster.name: cluster for cluster in clusters}
+
+    def get_clusters(self) -> Mapping[str, ClusterConfig]:
+        return {name: cluster.cluster_config() for name, cluster in self.__clusters.items()}
+
+    def get_topics_config(self, cluster_name: str) -> Mapping[str, TopicConfig]:
+        return self.__clusters[cluster_name].topics_config()
+
+
+class CountingMetricsBackend(MetricsBackend):
+    """
+    Counts consumer latency points, leaving out offset lag and the collector's own
+    metrics.
+    """
+
+    def __init__(self) -> None:
+        self.points = 0
+
+    def histogram(self, name: str, value: int | float, tags: Tags | None = None) -> None:
+        if not name.startswith(COLLECTOR_METRICS_PREFIX):
+            self.points += 1
+
+    def gauge(self, name: str, value: int | float, tags: Tags | None = None) -> None:
+        if name != Metric.CONSUMER_OFFSET_LAG.value and not name.startswith(
+            COLLECTOR_METRICS_PREFIX
+        ):
+            self.points += 1
+
+
+class _ThreadSampler:
+    def __init__(self) -> None:
+        self.peak = threading.active_count()
+        self.__stop = threading.Event()
+        self.__thread = threading.Thread(target=self.__run, name="thread-sampler", daemon=True)
+
+    def __enter__(self) -> _ThreadSampler:
+        self.__thread.start()
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.__stop.set()
+        self.__thread.join()
+
+    def __run(self) -> None:
+        while not self.__stop.wait(THREAD_SAMPLE_INTERVAL):
+            self.peak = max(self.peak, threading.active_count())
+
+
+@dataclass
+class BenchmarkResult:
+    iteration: int
+    wall_seconds: float
+    requests: dict[str, int]
+    peak_threads: int
+    peak_memory_bytes: int
+    points: int
+    errors: int = 0
+    error_samples: list[str] = field(default_factory=list)
+
+
+def run_consumer_latency_benchmark(
+    groups: int,
+    partitions: int,
+    topics: int = 1,
+    clusters: int = 1,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    request_latency: float = 0.005,
+    lag_fraction: float = 0.1,
+    timeout: int = 10,
+    scan_engine: ScanEngine = ScanEngine.CONSUME,
+    concurrency: Concurrency = Concurrency.THREADS,
+    total_workers: int | None = None,
+    iterations: int = 1,
+    seed: int = 0,
+    sampling: SamplingPolicy | None = None,
+    adaptive_latency_target: float | None = None,
+) -> list[BenchmarkResult]:
+    """
+    Scan every fake cluster at once through the `ClusterLatencyScanner` each cluster's
+    loop in the collector uses, and measure each iteration.
+
+    The scanners, with their consumer pools, sampling state and adaptive limits, and the
+    timestamp cache live across iterations like they do in the long-running collector,
+    so later iterations show the steady state.
+    """
+    fake_clusters = [
+        FakeKafkaCluster(
+            f"cluster-{i}", groups, topics, partitions, request_latency, lag_fraction, seed + i
+        )
+        for i in range(clusters)
+    ]
+    by_bootstrap = {cluster.bootstrap_servers: cluster for cluster in fake_clusters}
+
+    def admin_client(config: ClusterConfig) -> FakeKafkaCluster:
+        return by_bootstrap[",".join(config["brokers"])]
+
+    def consumer(config: Mapping[str, Any]) -> FakeConsumer:
+        return FakeConsumer(by_bootstrap[config["bootstrap.servers"]])
+
+    config = FakeKafkaConfig(fake_clusters)
+    metrics = CountingMetricsBackend()
+    timestamp_cache = OffsetTimestampCache()
+    scan_executor = (
+        ThreadPoolExecutor(max_workers=total_workers, thread_name_prefix="latency-scan")
+        if total_workers is not None and concurrency == Concurrency.THREADS
+        else None
+    )
+    stop_event = threading.Event()
+    results: list[BenchmarkResult] = []
+    scanners: list[ClusterLatencyScanner] = []
+    try:
+        with (
+            patch(
+                "sentry_kafka_management.actions.latency.consumer_latency.get_admin_client",
+                admin_client,
+            ),
+            patch("sentry_kafka_management.actions.latency.consumer_pool.Consumer", consumer),
+            ThreadPoolExecutor(
+                max_workers=clusters, thread_name_prefix="latency-cluster"
+            ) as cluster_executor,
+        ):
+            scanners.extend(
+                ClusterLatencyScanner(
+                    config,
+                    cluster.name,
+                    metrics,
+                    timeout,
+                    max_workers,
+                    timestamp_cache=timestamp_cache,
+                    scan_engine=scan_engine,
+                    executor=scan_executor,
+                    concurrency=concurrency,
+                    sampling=sampling or SamplingPolicy(),
+                    adaptive_latency_target=adaptive_latency_target,
+                )
+                for cluster in fake_clusters
+            )
+            for iteration in range(iterations):
+                for cluster in fake_clusters:
+                    cluster.requests.clear()
+                metrics.points = 0
+                tracemalloc.start()
+                try:
+                    with _ThreadSampler() as sampler:
+                        t0 = time.monotonic()
+                        errors = [
+                            error
+                            for result, _ in cluster_executor.map(
+                                lambda scanner: scanner.scan(stop_event), scanners
+                            )
+                            for error in result.errors
+                        ]
+                        wall_seconds = time.monotonic() - t0
+                    _, peak_memory = tracemalloc.get_traced_memory()
+                finally:
+                    tracemalloc.stop()
+
+                requests: Counter[str] = Counter()
+                for cluster in fake_clusters:
+                    requests.update(cluster.requests)
+                results.append(
+                    BenchmarkResult(
+                        iteration=iteration,
+                        wall_seconds=wall_seconds,
+                        requests=dict(sorted(requests.items())),
+                        peak_threads=sampler.peak,
+                        peak_memory_bytes=peak_memory,
+                        points=metrics.points,
+                        errors=len(errors),
+                        error_samples=[str(e) for e in errors[:3]],
+                    )
+                )
+    finally:
+        for scanner in scanners:
+            scanner.close()
+        if scan_executor is not None:
+            scan_executor.shutdown()
+        for cluster in fake_clusters:
+            cluster.close()
+    return results
+
+
+@click.command(name="consumer-latency-benchmark")
+@click.option("--groups", default=100, type=click.IntRange(min=1), help="Groups per cluster.")
+@click.option("--partitions", default=16, type=click.IntRange(min=1), help="Partitions per topic.")
+@click.option("--topics", default=1, type=click.IntRange(min=1), help="Topics per cluster.")
+@click.option("--clusters", default=1, type=click.IntRange(min=1), help="Number of clusters.")
+@click.option(
+    "-w",
+    "--max-workers",
+    default=DEFAULT_MAX_WORKERS,
+    type=click.IntRange(min=1),
+    help="Maximum concurrent partition scans per cluster.",
+)
+@click.option(
+    "--total-workers",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Maximum concurrent partition scans shared by all clusters.",
+)
+@click.option(
+    "--request-latency",
+    default=0.005,
+    type=click.FloatRange(min=0.0),
+    help="Seconds every fake admin request and consumer fetch takes. Defaults to 5ms.",
+)
+@click.option(
+    "--lag-fraction",
+    default=0.1,
+    type=click.FloatRange(min=0.0, max=1.0),
+    help="Share of group partitions committed behind the high watermark. Defaults to 0.1.",
+)
+@click.option(
+    "--scan-engine",
+    default=ScanEngine.CONSUME.value,
+    type=click.Choice([engine.value for engine in ScanEngine]),
+)
+@click.option(
+    "--concurrency",
+    default=Concurrency.THREADS.value,
+    type=click.Choice([mode.value for mode in Concurrency]),
+)
+@click.option(
+    "--iterations",
+    default=2,
+    type=click.IntRange(min=1),
+    help="Scans to run back to back, sharing pools and caches. Defaults to 2.",
+)
+@click.option("--seed", default=0, type=int, help="Seed for the committed offset layout.")
+@click.option(
+    "--group-budget",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Most consumer groups scanned per cluster per iteration. Defaults to every group.",
+)
+@click.option(
+    "--max-partitions-per-group",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Most partitions scanned per group per iteration. Defaults to every partition.",
+)
+@click.option(
+    "--adaptive-latency-target",
+    default=None,
+    type=click.FloatRange(min=0.0, min_open=True),
+    help="Seconds a batch read may take before its cluster reads fewer batches at once.",
+)
+def main(
+    groups: int,
+    partitions: int,
+    topics: int,
+    clusters: int,
+    max_workers: int,
+    total_workers: int | None,
+    request_latency: float,
+    lag_fraction: float,
+    scan_engine: str,
+    concurrency: str,
+    iterations: int,
+    seed: int,
+    group_budget: int | None,
+    max_partitions_per_group: int | None,
+    adaptive_latency_target: float | None,
+) -> None:
+    """
+    Report wall time, requests issued, peak threads and peak memory of consumer latency
+    scans of N groups x M partitions.
+    """
+    click.echo(
+        f"clusters={clusters} groups={groups} topics={topics} partitions={partitions} "
+        f"max_workers={max_workers} total_workers={total_workers or 'unbounded'} "
+        f"request_latency={request_latency * 1000:.1f}ms lag_fraction={lag_fraction} "
+        f"scan_engine={scan_engine} concurrency={concurrency} "
+        f"group_budget={group_budget or 'unbounded'} "
+        f"max_partitions_per_group={max_partitions_per_group or 'unbounded'} "
+        f"adaptive_latency_target={adaptive_latency_target or 'off'}"
+    )
+    results = run_consumer_latency_benchmark(
+        groups=groups,
+        partitions=partitions,
+        topics=topics,
+        clusters=clusters,
+        max_workers=max_workers,
+        total_workers=total_workers,
+        request_latency=request_latency,
+        lag_fraction=lag_fraction,
+        scan_engine=ScanEngine(scan_engine),
+        concurrency=Concurrency(concurrency),
+        iterations=iterations,
+        seed=seed,
+        sampling=SamplingPolicy(
+            group_budget=group_budget, max_partitions_per_group=max_partitions_per_group
+        ),
+        adaptive_latency_target=adaptive_latency_target,
+    )
+    for result in results:
+        requests = " ".join(f"{kind}={count}" for kind, count in result.requests.items())
+        click.echo(
+            f"iteration={result.iteration} wall={result.wall_seconds:.3f}s "
+            f"points={result.points} errors={result.errors} "
+            f"peak_threads={result.peak_threads} "
+            f"peak_memory={result.peak_memory_bytes / 1024 / 1024:.1f}MiB requests: {requests}"
+        )
+        for sample in result.error_samples:
+            click.echo(f"  error: {sample}", err=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,11 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Mapping, MutableMapping, Sequence
+from typing import Any, Callable, Iterable, Mapping, MutableMapping, Sequence
 
+from confluent_kafka import KafkaError, KafkaException  # type: ignore[import-untyped]
 from confluent_kafka.admin import (  # type: ignore[import-untyped]
     AdminClient,
     AlterConfigOpType,
@@ -11,9 +15,24 @@ from confluent_kafka.admin import (  # type: ignore[import-untyped]
 )
 
 from sentry_kafka_management.actions.clusters import describe_cluster
-from sentry_kafka_management.actions.conf import ALLOWED_CONFIGS, KAFKA_TIMEOUT
+from sentry_kafka_management.actions.conf import (
+    ALLOWED_CONFIGS,
+    ALTER_CONFIGS_MAX_IN_FLIGHT,
+    KAFKA_TIMEOUT,
+)
 from sentry_kafka_management.actions.local.filesystem import record_config
 
+# Errors a broker returns for a request because of the configs in it, which bisecting the
+# request can pin on a single change. Other errors, such as timeouts, apply to the request
+# as a whole and would only recur on every half.
+CONFIG_ERROR_CODES = frozenset(
+    {
+        KafkaError.INVALID_CONFIG,
+        KafkaError.POLICY_VIOLATION,
+        KafkaError.INVALID_REQUEST,
+    }
+)
+
 
 @dataclass
 class ConfigChange:
@@ -48,12 +67,35 @@ class ConfigChange:
         }
 
 
+class DescribeBrokerConfigsError(Exception):
+    """
+    Raised when describing the configs of one or more brokers fails.
+
+    The configs of every broker that was described are still available on `configs`.
+    """
+
+    def __init__(
+        self,
+        errors: Mapping[str, Exception],
+        configs: Sequence[Mapping[str, Any]],
+    ) -> None:
+        formatted = "; ".join(f"broker {broker_id}: {e}" for broker_id, e in errors.items())
+        super().__init__(f"Failed to describe configs of {len(errors)} broker(s): {formatted}")
+        self.errors = dict(errors)
+        self.configs = list(configs)
+
+
 def describe_broker_configs(
     admin_client: AdminClient,
 ) -> Sequence[Mapping[str, Any]]:
     """
     Returns configuration for all brokers in a cluster.
 
+    Kafka only accepts one broker per DescribeConfigs request, so every broker's request
+    is sent before waiting on any of them, and the cluster is described in about one round
+    trip. If any broker fails, the rest are still described and a
+    `DescribeBrokerConfigsError` carrying their configs is raised.
+
     The source field represents whether the config value was set statically or dynamically.
     For the complete list of possible enum values see
     https://github.com/confluentinc/confluent-kafka-python/blob/55b55550acabc51cb75c7ac78190d6db71706690/src/confluent_kafka/admin/_config.py#L47-L59
@@ -62,14 +104,21 @@ def describe_broker_configs(
         ConfigResource(ConfigResource.Type.BROKER, f"{id}")
         for id in admin_client.list_topics().brokers
     ]
+    futures = [
+        (broker_resource, future)
+        for broker_resource in broker_resources
+        for _, future in admin_client.describe_configs([broker_resource]).items()
+    ]
 
     all_configs = []
+    errors: dict[str, Exception] = {}
 
-    for broker_resource in broker_resources:
-        configs = {
-            k: v.result(KAFKA_TIMEOUT)
-            for (k, v) in admin_client.describe_configs([broker_resource]).items()
-        }[broker_resource]
+    for broker_resource, future in futures:
+        try:
+            configs = future.result(KAFKA_TIMEOUT)
+        except Exception as e:
+            errors[broker_resource.name] = e
+            continue
 
         for k, v in configs.items():
             # the confluent library returns the raw int value of the enum instead of a
@@ -86,25 +135,177 @@ def describe_broker_configs(
             }
             all_configs.append(config_item)
 
+    if errors:
+        raise DescribeBrokerConfigsError(errors, all_configs)
+
     return all_configs
 
 
-def _get_config_from_list(
-    config_list: Sequence[Mapping[str, Any]],
-    config_name: str,
+class BrokerConfigSnapshot:
+    """
+    Every broker's configs as returned by `describe_broker_configs`, indexed by broker
+    and config name so each lookup is O(1) however large the cluster.
+
+    Rows are kept per broker and shared with the described list rather than copied.
+    Brokers that could not be described are in `errors` instead.
+    """
+
+    def __init__(
+        self,
+        configs: Iterable[Mapping[str, Any]],
+        errors: Mapping[str, Exception] | None = None,
+    ) -> None:
+        self.__by_broker: dict[str, dict[str, Mapping[str, Any]]] = {}
+        for config in configs:
+            self.__by_broker.setdefault(config["broker"], {})[config["config"]] = config
+        self.errors = dict(errors or {})
+
+    @classmethod
+    def describe(cls, admin_client: AdminClient) -> "BrokerConfigSnapshot":
+        """
+        Describes every broker's configs, keeping the errors of brokers that could not
+        be described rather than raising them.
+        """
+        try:
+            return cls(describe_broker_configs(admin_client))
+        except DescribeBrokerConfigsError as e:
+            return cls(e.configs, e.errors)
+
+    def get(self, broker_id: str, config_name: str) -> Mapping[str, Any] | None:
+        """
+        Returns a config's status on a specific broker, or None if it isn't set there.
+        """
+        return self.__by_broker.get(broker_id, {}).get(config_name)
+
+
+ResultCallback = Callable[[dict[str, Any]], None]
+
+
+class _RateLimiter:
+    """
+    Spaces out calls so there are at most `rate` per second, across every thread.
+    """
+
+    def __init__(self, rate: float) -> None:
+        self.__interval = 1 / rate
+        self.__lock = threading.Lock()
+        self.__next = 0.0
+
+    def wait(self) -> None:
+        with self.__lock:
+            now = time.monotonic()
+            scheduled = max(now, self.__next)
+            self.__next = scheduled + self.__interval
+        time.sleep(scheduled - now)
+
+
+def _submit_config_changes(
+    admin_client: AdminClient,
     broker_id: str,
-) -> Mapping[str, Any] | None:
+    config_changes: Sequence[ConfigChange],
+    update_type: AlterConfigOpType,
+    rate_limiter: _RateLimiter | None = None,
+) -> Future[None]:
     """
-    Helper function for finding a config's status on a specific broker
-    from a list of all configs across all brokers.
+    Sends one request altering all of the given configs on a broker, without waiting for it.
     """
-    return next(
-        (
-            config
-            for config in config_list
-            if config["config"] == config_name and config["broker"] == broker_id
-        ),
-        None,
+    config_resource = ConfigResource(
+        restype=ConfigResource.Type.BROKER,
+        name=broker_id,
+        incremental_configs=[
+            ConfigEntry(
+                name=config_change.config_name,
+                value=config_change.to_value,
+                incremental_operation=update_type,
+            )
+            for config_change in config_changes
+        ],
+    )
+    if rate_limiter is not None:
+        rate_limiter.wait()
+    future: Future[None] = admin_client.incremental_alter_configs([config_resource])[
+        config_resource
+    ]
+    return future
+
+
+def _is_config_error(error: Exception) -> bool:
+    """
+    Whether a failed alter request was rejected because of the configs in it.
+    """
+    if not isinstance(error, KafkaException) or not error.args:
+        return False
+    kafka_error = error.args[0]
+    return isinstance(kafka_error, KafkaError) and kafka_error.code() in CONFIG_ERROR_CODES
+
+
+def _resolve_config_changes(
+    admin_client: AdminClient,
+    broker_id: str,
+    config_changes: Sequence[ConfigChange],
+    update_type: AlterConfigOpType,
+    future: Future[None],
+    rate_limiter: _RateLimiter | None = None,
+) -> list[tuple[ConfigChange, Exception | None]]:
+    """
+    Waits for a request altering a broker's configs, returning each change with its error.
+
+    A broker applies all of a request's configs or none of them, and reports one error for
+    the whole request. So when a request of several changes is rejected because of its
+    configs, it is split in half and each half is sent again, until every failing change
+    has its own error. Any other error is reported on every change of the request.
+    """
+    try:
+        future.result(timeout=KAFKA_TIMEOUT)
+        return [(config_change, None) for config_change in config_changes]
+    except Exception as e:
+        if len(config_changes) == 1 or not _is_config_error(e):
+            return [(config_change, e) for config_change in config_changes]
+
+    middle = len(config_changes) // 2
+    halves = [config_changes[:middle], config_changes[middle:]]
+    submitted: list[tuple[Sequence[ConfigChange], Future[None] | Exception]] = []
+    for half in halves:
+        try:
+            half_future = _submit_config_changes(
+                admin_client, broker_id, half, update_type, rate_limiter
+            )
+        except Exception as e:
+            submitted.append((half, e))
+        else:
+            submitted.append((half, half_future))
+
+    outcomes: list[tuple[ConfigChange, Exception | None]] = []
+    for half, submit_result in submitted:
+        if isinstance(submit_result, Exception):
+            outcomes.extend((config_change, submit_result) for config_change in half)
+        else:
+            outcomes.extend(
+                _resolve_config_changes(
+                    admin_client, broker_id, half, update_type, submit_result, rate_limiter
+                )
+            )
+    return outcomes
+
+
+def _alter_broker_configs(
+    admin_client: AdminClient,
+    broker_id: str,
+    config_changes: Sequence[ConfigChange],
+    update_type: AlterConfigOpType,
+    rate_limiter: _RateLimiter | None = None,
+) -> list[tuple[ConfigChange, Exception | None]]:
+    """
+    Alters all of the given configs on a broker, returning each change with its error.
+    """
+    try:
+        future = _submit_config_changes(
+            admin_client, broker_id, config_changes, update_type, rate_limiter
+        )
+    except Exception as e:
+        return [(config_change, e) for config_change in config_changes]
+    return _resolve_config_changes(
+        admin_client, broker_id, config_changes, update_type, future, rate_limiter
     )
 
 
@@ -113,48 +314,64 @@ def _update_configs(
     config_changes: list[ConfigChange],
     update_type: AlterConfigOpType,
     configs_record_dir: Path | None = None,
+    max_in_flight: int = ALTER_CONFIGS_MAX_IN_FLIGHT,
+    max_requests_per_second: float | None = None,
+    on_result: ResultCallback | None = None,
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
     """
     Performs the given update operation on the given brokers
     for the given config changes.
+
+    Kafka only accepts one broker per request, so each broker gets a single request with
+    all of its changes. Up to `max_in_flight` brokers are altered at once, and if
+    `max_requests_per_second` is set, requests are spaced out to protect the brokers.
+    `on_result` is called with each success or error as soon as its broker is done.
     """
-    success: list[dict[str, Any]] = []
-    error: list[dict[str, Any]] = []
+    changes_by_broker: dict[str, list[ConfigChange]] = {}
+    for config_change in config_changes:
+        changes_by_broker.setdefault(config_change.broker_id, []).append(config_change)
 
-    change_list: list[tuple[ConfigChange, ConfigResource]] = []
+    rate_limiter = (
+        _RateLimiter(max_requests_per_second) if max_requests_per_second is not None else None
+    )
+    results_by_broker: dict[str, list[dict[str, Any]]] = {}
+    with ThreadPoolExecutor(
+        max_workers=max_in_flight, thread_name_prefix="alter-configs"
+    ) as executor:
+        futures = {
+            executor.submit(
+                _alter_broker_configs,
+                admin_client,
+                broker_id,
+                changes,
+                update_type,
+                rate_limiter,
+            ): broker_id
+            for broker_id, changes in changes_by_broker.items()
+        }
+        for future in as_completed(futures):
+            results = results_by_broker[futures[future]] = []
+            for config_change, exception in future.result():
+                if exception is not None:
+                    result = config_change.to_error(str(exception))
+                else:
+                    # record the applied value, if we applied a new value and it succeeded
+                    if configs_record_dir and config_change.config_name and config_change.to_value:
+                        record_config(
+                            config_change.config_name,
+                            config_change.to_value,
+                            configs_record_dir,
+                        )
+                    result = config_change.to_success()
+                results.append(result)
+                if on_result is not None:
+                    on_result(result)
 
-    for config_change in config_changes:
-        broker_id = config_change.broker_id
-        config_entry = ConfigEntry(
-            name=config_change.config_name,
-            value=config_change.to_value,
-            incremental_operation=update_type,
-        )
-        config_resource = ConfigResource(
-            restype=ConfigResource.Type.BROKER,
-            name=broker_id,
-            incremental_configs=[config_entry],
-        )
-        change_list.append((config_change, config_resource))
-
-    for config_change, config_resource in change_list:
-        # we make an AdminClient request for each config change to get better error messages
-        # since incremental_alter_configs returns None or throws a generic KafkaException
-        # for all config changes if we batch them together
-        futures = admin_client.incremental_alter_configs([config_resource])
-        for _, future in futures.items():
-            try:
-                future.result(timeout=KAFKA_TIMEOUT)
-                # record the applied value, if we applied a new value and it succeeded
-                if configs_record_dir and config_change.config_name and config_change.to_value:
-                    record_config(
-                        config_change.config_name,
-                        config_change.to_value,
-                        configs_record_dir,
-                    )
-                success.append(config_change.to_success())
-            except Exception as e:
-                error.append(config_change.to_error(str(e)))
+    success: list[dict[str, Any]] = []
+    error: list[dict[str, Any]] = []
+    for broker_id in changes_by_broker:
+        for result in results_by_broker[broker_id]:
+            (success if result["status"] == "success" else error).append(result)
     return success, error
 
 
@@ -164,6 +381,9 @@ def apply_configs(
     broker_ids: Sequence[str] | None = None,
     configs_record_dir: Path | None = None,
     dry_run: bool = False,
+    max_in_flight: int = ALTER_CONFIGS_MAX_IN_FLIGHT,
+    max_requests_per_second: float | None = None,
+    on_result: ResultCallback | None = None,
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
     """
     Apply a configuration change to a broker.
@@ -175,6 +395,11 @@ def apply_configs(
             be applied to all brokers in the cluster.
         configs_record_dir: Directory to record config changes in.
         dry_run: Whether to dry run the config changes, only performs validation
+        max_in_flight: Most brokers to alter at once.
+        max_requests_per_second: Optional cap on alter requests per second, to protect \
+            the brokers.
+        on_result: Called with each success or error as soon as it is known, to report \
+            progress while the changes are applied.
 
     Returns:
         List of dictionaries with operation details for each config change.
@@ -188,14 +413,24 @@ def apply_configs(
     config_change_list: list[ConfigChange] = []
     validation_errors: list[dict[str, Any]] = []
     valid_broker_ids = [broker["id"] for broker in describe_cluster(admin_client)]
-    current_configs = describe_broker_configs(admin_client)
+    current_configs = BrokerConfigSnapshot.describe(admin_client)
     for broker_id in broker_ids:
         for config_name, new_value in config_changes.items():
-            current_config = _get_config_from_list(
-                current_configs,
-                config_name,
-                broker_id,
-            )
+            if broker_id in current_configs.errors:
+                validation_errors.append(
+                    ConfigChange(
+                        broker_id=broker_id,
+                        config_name=config_name,
+                        is_sensitive=True,
+                        op="apply",
+                        to_value=new_value,
+                    ).to_error(
+                        f"Failed to describe configs on broker {broker_id}: "
+                        f"{current_configs.errors[broker_id]}"
+                    )
+                )
+                continue
+            current_config = current_configs.get(broker_id, config_name)
             if current_config:
                 from_value = current_config["value"]
                 is_sensitive = current_config["isSensitive"]
@@ -251,14 +486,18 @@ def apply_configs(
                 )
             )
 
+    _report(validation_errors, on_result)
     if dry_run:
-        return [c.to_success() for c in config_change_list], validation_errors
+        return _report([c.to_success() for c in config_change_list], on_result), validation_errors
 
     success, errors = _update_configs(
         admin_client=admin_client,
         config_changes=config_change_list,
         update_type=AlterConfigOpType.SET,
         configs_record_dir=configs_record_dir,
+        max_in_flight=max_in_flight,
+        max_requests_per_second=max_requests_per_second,
+        on_result=on_result,
     )
 
     return success, errors + validation_errors
@@ -269,6 +508,9 @@ def remove_dynamic_configs(
     configs_to_remove: Sequence[str],
     broker_ids: Sequence[str] | None = None,
     dry_run: bool = False,
+    max_in_flight: int = ALTER_CONFIGS_MAX_IN_FLIGHT,
+    max_requests_per_second: float | None = None,
+    on_result: ResultCallback | None = None,
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
     """
     Removes any dynamically set values from the given configs
@@ -276,11 +518,19 @@ def remove_dynamic_configs(
     * the static value defined in `server.properties`, if one exists
     * the config default value, if there's no static value defined for it
 
+    Only per-broker dynamic values are removed. Configs set as a cluster-wide default
+    are reported as errors, since the client can't address the cluster-default resource.
+
     Args:
         admin_client: AdminClient instance
         configs_to_remove: List of config changes to remove dynamic configs from
         broker_ids: List of broker IDs to remove the given dynamic configs from
         dry_run: Whether to dry run the config removals, only performs validation
+        max_in_flight: Most brokers to alter at once.
+        max_requests_per_second: Optional cap on alter requests per second, to protect \
+            the brokers.
+        on_result: Called with each success or error as soon as it is known, to report \
+            progress while the configs are removed.
 
     Returns:
         List of dictionaries with details on each config change.
@@ -294,14 +544,23 @@ def remove_dynamic_configs(
     config_change_list: list[ConfigChange] = []
     valid_broker_ids = [broker["id"] for broker in describe_cluster(admin_client)]
     validation_errors: list[dict[str, Any]] = []
-    current_configs = describe_broker_configs(admin_client)
+    current_configs = BrokerConfigSnapshot.describe(admin_client)
     for broker_id in broker_ids:
         for config_name in configs_to_remove:
-            current_config = _get_config_from_list(
-                current_configs,
-                config_name,
-                broker_id,
-            )
+            if broker_id in current_configs.errors:
+                validation_errors.append(
+                    ConfigChange(
+                        broker_id=broker_id,
+                        config_name=config_name,
+                        is_sensitive=True,
+                        op="remove",
+                    ).to_error(
+                        f"Failed to describe configs on broker {broker_id}: "
+                        f"{current_configs.errors[broker_id]}"
+                    )
+                )
+                continue
+            current_config = current_configs.get(broker_id, config_name)
             if current_config:
                 from_value = current_config["value"]
                 is_sensitive = current_config["isSensitive"]
@@ -337,6 +596,25 @@ def remove_dynamic_configs(
                     ).to_error(f"Config '{config_name}' not found on broker {broker_id}")
                 )
                 continue
+            if current_config["source"] == ConfigSource.DYNAMIC_DEFAULT_BROKER_CONFIG.name:
+                # librdkafka can't address the cluster-default resource (a BROKER resource
+                # with an empty name), so cluster-wide defaults can only be changed with
+                # `kafka-configs --entity-default`.
+                validation_errors.append(
+                    ConfigChange(
+                        broker_id=broker_id,
+                        config_name=config_name,
+                        is_sensitive=is_sensitive,
+                        op="remove",
+                        from_value=from_value,
+                        to_value=None,
+                    ).to_error(
+                        f"Config '{config_name}' is set as a cluster-wide default, not on "
+                        f"broker {broker_id}. Cluster-wide defaults can't be removed per "
+                        "broker, use `kafka-configs --entity-default` instead"
+                    )
+                )
+                continue
             if current_config["source"] != ConfigSource.DYNAMIC_BROKER_CONFIG.name:
                 validation_errors.append(
                     ConfigChange(
@@ -362,18 +640,31 @@ def remove_dynamic_configs(
                 )
             )
 
+    _report(validation_errors, on_result)
     if dry_run:
-        return [c.to_success() for c in config_change_list], validation_errors
+        return _report([c.to_success() for c in config_change_list], on_result), validation_errors
 
     success, error = _update_configs(
         admin_client=admin_client,
         config_changes=config_change_list,
         update_type=AlterConfigOpType.DELETE,
+        max_in_flight=max_in_flight,
+        max_requests_per_second=max_requests_per_second,
+        on_result=on_result,
     )
 
     return success, error + validation_errors
 
 
+def _report(
+    results: list[dict[str, Any]], on_result: ResultCallback | None
+) -> list[dict[str, Any]]:
+    if on_result is not None:
+        for result in results:
+            on_result(result)
+    return results
+
+
 def basic_validation(
     broker_id: str,
     valid_broker_ids: Sequence[str],
@@ -1,6 +1,9 @@
 # Shared configuration globals used by actions
 KAFKA_TIMEOUT = 5
 
+# How many brokers apply_configs and remove_dynamic_configs alter at once
+ALTER_CONFIGS_MAX_IN_FLIGHT = 8
+
 # Configs that are allowed to be updated on a broker with
 # apply_configs and remove_dynamic_configs actions
 ALLOWED_CONFIGS = [
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+
+DEFAULT_LATENCY_TARGET = 2.0
+DEFAULT_BACKOFF_RATIO = 0.5
+# How often a scan waiting for a slot checks for shutdown, or for a freed slot from
+# an event loop.
+ACQUIRE_POLL_INTERVAL = 0.01
+
+
+class AimdLimiter:
+    """
+    Bounds how many partition batches of a cluster are read at once, adapting the bound
+    with additive increase and multiplicative decrease.
+
+    A batch that takes longer than `latency_target` seconds or fails cuts the limit by
+    `backoff_ratio`, at most once per round of batches that were already in flight, so
+    one burst of slow reads does not collapse it to `min_limit`. Every other batch adds
+    `1 / limit`, about one slot per round, up to `max_limit`. The limit starts at
+    `max_limit` and is meant to be kept across scans of the cluster.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        latency_target: float = DEFAULT_LATENCY_TARGET,
+        min_limit: int = 1,
+        backoff_ratio: float = DEFAULT_BACKOFF_RATIO,
+    ) -> None:
+        self.__max_limit = max_limit
+        self.__min_limit = min(min_limit, max_limit)
+        self.__latency_target = latency_target
+        self.__backoff_ratio = backoff_ratio
+        self.__condition = threading.Condition()
+        self.__limit = float(max_limit)
+        self.__in_flight = 0
+        self.__last_decrease = -math.inf
+
+    @property
+    def limit(self) -> int:
+        return int(self.__limit)
+
+    def try_acquire(self) -> float | None:
+        """
+        Take a slot if one is free, returning when it was taken.
+        """
+        with self.__condition:
+            if self.__in_flight >= int(self.__limit):
+                return None
+            self.__in_flight += 1
+            return time.monotonic()
+
+    def acquire(self, stop_event: threading.Event | None = None) -> float:
+        """
+        Take a slot, blocking until one is free, returning when it was taken.
+
+        Once `stop_event` is set a slot is taken regardless, so the caller can notice the
+        shutdown itself rather than wait for a slot.
+        """
+        with self.__condition:
+            while self.__in_flight >= int(self.__limit):
+                if stop_event is not None and stop_event.is_set():
+                    break
+                self.__condition.wait(ACQUIRE_POLL_INTERVAL)
+            self.__in_flight += 1
+            return time.monotonic()
+
+    async def acquire_async(self, stop_event: threading.Event | None = None) -> float:
+        """
+        The asyncio counterpart of `acquire`, which yields to the event loop while
+        waiting rather than blocking it.
+        """
+        while True:
+            started = self.try_acquire()
+            if started is not None:
+                return started
+            if stop_event is not None and stop_event.is_set():
+                return self.acquire(stop_event)
+            await asyncio.sleep(ACQUIRE_POLL_INTERVAL)
+
+    def release(self, started: float, failed: bool = False) -> None:
+        """
+        Return the slot taken at `started` and adjust the limit by how the read went.
+        """
+        now = time.monotonic()
+        with self.__condition:
+            self.__in_flight -= 1
+            if failed or now - started > self.__latency_target:
+                # Only reads started after the last cut reflect the lower limit.
+                if started >= self.__last_decrease:
+                    self.__limit = max(self.__min_limit, self.__limit * self.__backoff_ratio)
+                    self.__last_decrease = now
+            else:
+                self.__limit = min(self.__max_limit, self.__limit + 1 / self.__limit)
+            self.__condition.notify_all()
+
+    def cancel(self) -> None:
+        """
+        Return a slot that was never used for a read, leaving the limit as it is.
+        """
+        with self.__condition:
+            self.__in_flight -= 1
+            self.__condition.notify_all()
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+from enum import StrEnum
+from typing import Collection, Sequence
+
+from sentry_kafka_management.actions.latency.metrics import (
+    ConsumerLatencyResult,
+    Metric,
+    MetricsBackend,
+)
+
+TOPIC_PERCENTILES = {
+    Metric.CONSUMER_LATENCY_TOPIC_P50: 50.0,
+    Metric.CONSUMER_LATENCY_TOPIC_P99: 99.0,
+}
+
+
+class Rollup(StrEnum):
+    """
+    The levels consumer latency is emitted at.
+
+    PARTITION emits the raw histogram point of every partition of every group. TOPIC
+    emits max/p50/p99 gauges over each group's partitions of a topic, and GROUP emits the
+    max gauge over all of a group's partitions.
+    """
+
+    PARTITION = "partition"
+    TOPIC = "topic"
+    GROUP = "group"
+
+
+DEFAULT_ROLLUPS = frozenset({Rollup.PARTITION})
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """
+    The nearest-rank `q`th percentile of a non-empty, ascending sequence.
+    """
+    rank = max(math.ceil(q / 100.0 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+class ConsumerLatencyEmitter:
+    """
+    Emits one cluster scan at the requested rollup levels as its results stream in.
+
+    Partition points are emitted as soon as each partial result is added. Rollups need
+    every partition of a group, so only the latencies they are computed from are kept
+    until `finish` is called.
+    """
+
+    def __init__(
+        self, metrics: MetricsBackend, rollups: Collection[Rollup] = DEFAULT_ROLLUPS
+    ) -> None:
+        self.__metrics = metrics
+        self.__rollups = rollups
+        self.__aggregate = Rollup.TOPIC in rollups or Rollup.GROUP in rollups
+        self.__latencies: defaultdict[tuple[str, str, str], list[float]] = defaultdict(list)
+
+    def add(self, result: ConsumerLatencyResult) -> None:
+        if Rollup.PARTITION in self.__rollups:
+            self.__metrics.consumer_latency_histograms(result)
+        if self.__aggregate:
+            for scan in result.scans:
+                key = (scan.cluster_name, scan.group_id, scan.topic_name)
+                self.__latencies[key].append(scan.latency_ms)
+
+    def finish(self) -> None:
+        """
+        Emit the rollups of everything added so far and start over.
+        """
+        latencies, self.__latencies = self.__latencies, defaultdict(list)
+        group_max: dict[tuple[str, str], float] = {}
+        for (cluster, group, topic), values in latencies.items():
+            values.sort()
+            topic_max = values[-1]
+            group_key = (cluster, group)
+            group_max[group_key] = max(group_max.get(group_key, topic_max), topic_max)
+
+            if Rollup.TOPIC in self.__rollups:
+                tags = {"cluster": cluster, "consumer_group": group, "topic": topic}
+                self.__metrics.gauge(Metric.CONSUMER_LATENCY_TOPIC_MAX.value, topic_max, tags=tags)
+                for metric, q in TOPIC_PERCENTILES.items():
+                    self.__metrics.gauge(metric.value, percentile(values, q), tags=tags)
+
+        if Rollup.GROUP in self.__rollups:
+            for (cluster, group), value in group_max.items():
+                self.__metrics.gauge(
+                    Metric.CONSUMER_LATENCY_GROUP_MAX.value,
+                    value,
+                    tags={"cluster": cluster, "consumer_group": group},
+                )
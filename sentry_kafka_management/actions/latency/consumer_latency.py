@@ -1,36 +1,72 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import queue
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import nullcontext
 from dataclasses import dataclass
-from typing import Mapping
+from enum import StrEnum
+from typing import Callable, Collection, Mapping, MutableMapping
 
 from confluent_kafka import (  # type: ignore[import-untyped]
     TIMESTAMP_NOT_AVAILABLE,
     Consumer,
+    ConsumerGroupState,
     ConsumerGroupTopicPartitions,
     KafkaError,
     KafkaException,
+    Message,
     TopicPartition,
 )
 from confluent_kafka.admin import (  # type: ignore[import-untyped]
     AdminClient,
     ConsumerGroupListing,
+    OffsetSpec,
 )
 
-from sentry_kafka_management.actions.latency.metrics import (
-    MetricsBackend,
-    emit_topic_consumer_latency,
+from sentry_kafka_management.actions.latency.adaptive import AimdLimiter
+from sentry_kafka_management.actions.latency.aggregation import (
+    DEFAULT_ROLLUPS,
+    ConsumerLatencyEmitter,
+    Rollup,
+)
+from sentry_kafka_management.actions.latency.consumer_pool import ConsumerPool
+from sentry_kafka_management.actions.latency.filters import ScanFilter
+from sentry_kafka_management.actions.latency.group_cache import ConsumerGroupCache
+from sentry_kafka_management.actions.latency.instrumentation import (
+    ScanPhase,
+    ScanStats,
+    emit_scan_stats,
 )
-from sentry_kafka_management.brokers import ClusterConfig, TopicConfig, YamlKafkaConfig
+from sentry_kafka_management.actions.latency.metrics import MetricsBackend
+from sentry_kafka_management.actions.latency.sampling import SamplingPolicy, ScanSampler
+from sentry_kafka_management.actions.latency.timestamp_cache import OffsetTimestampCache
+from sentry_kafka_management.brokers import ClusterConfig, KafkaConfig, TopicConfig
 from sentry_kafka_management.connectors.admin import get_admin_client
 from sentry_kafka_management.connectors.kafka_config import build_broker_config
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_MAX_WORKERS = 128
+DEFAULT_OFFSET_FETCH_BATCH_SIZE = 512
+DEFAULT_SCAN_BATCH_SIZE = 256
+# Longest a single consume() call blocks, which bounds how quickly a scan notices shutdown.
+CONSUME_MAX_WAIT = 0.1
+# Bounds on how long an asyncio scan sleeps between non-blocking consumes that return nothing.
+ASYNC_MIN_IDLE_SLEEP = 0.005
+ASYNC_MAX_IDLE_SLEEP = 0.1
+# How often the cluster fan-out wakes up to check for shutdown and the cluster deadline.
+CLUSTER_WAIT_INTERVAL = 0.5
 
 RETRYABLE_ERRORS = frozenset(
     {
@@ -42,13 +78,39 @@ RETRYABLE_ERRORS = frozenset(
 )
 
 
+class ScanEngine(StrEnum):
+    """
+    How partition latency is measured.
+
+    CONSUME reads the message at every committed offset. LIST_OFFSETS first looks up each
+    partition's high watermark and only reads a message for partitions that are lagging.
+    """
+
+    CONSUME = "consume"
+    LIST_OFFSETS = "list-offsets"
+
+
+class Concurrency(StrEnum):
+    """
+    How a cluster's partition batches are run concurrently.
+
+    THREADS runs each batch on a worker thread that blocks in consume(). ASYNCIO drives
+    every batch from one event loop with non-blocking consumes, so `max_workers` bounds
+    the consumers polling at once rather than the number of threads.
+    """
+
+    THREADS = "threads"
+    ASYNCIO = "asyncio"
+
+
 @dataclass
 class PartitionScan:
-    group_id: str
+    group_ids: list[str]
     topic: str
     partition: int
     committed_offset: int
     retention_ms: int
+    high_watermark: int | None = None
 
 
 @dataclass
@@ -58,6 +120,13 @@ class TopicConsumerLatency:
     group_id: str
     latency_ms: float
     partition: int
+    # How many messages the group is behind the partition's high watermark, when the scan
+    # saw the high watermark.
+    offset_lag: int | None = None
+    high_watermark: int | None = None
+
+
+ScansCallback = Callable[[list[TopicConsumerLatency]], None]
 
 
 @dataclass
@@ -90,14 +159,16 @@ class ConsumerGroupListingError(Exception):
         self.valid = valid or []
 
 
-def list_consumer_group_ids(admin: AdminClient) -> list[str]:
-    """Get all consumer group IDs on the cluster."""
+def list_consumer_group_ids(
+    admin: AdminClient, skip_states: Collection[ConsumerGroupState] = ()
+) -> list[str]:
+    """Get all consumer group IDs on the cluster, leaving out groups in `skip_states`."""
     result = admin.list_consumer_groups().result()
 
     errors: list[KafkaException] = result.errors
     valid: list[ConsumerGroupListing] = result.valid
 
-    group_ids: list[str] = [listing.group_id for listing in valid]
+    group_ids = filter_consumer_group_ids(valid, skip_states)
 
     if errors:
         raise ConsumerGroupListingError(errors, valid=valid)
@@ -105,6 +176,21 @@ def list_consumer_group_ids(admin: AdminClient) -> list[str]:
     return group_ids
 
 
+def filter_consumer_group_ids(
+    listings: list[ConsumerGroupListing], skip_states: Collection[ConsumerGroupState] = ()
+) -> list[str]:
+    """
+    The IDs of the listed groups that are not in one of `skip_states`.
+
+    Listings only carry a state when the broker reported one; those are always kept.
+    """
+    return [
+        listing.group_id
+        for listing in listings
+        if getattr(listing, "state", None) not in skip_states
+    ]
+
+
 def get_committed_offsets(
     admin: AdminClient, group_ids: list[str]
 ) -> dict[str, list[TopicPartition] | Exception]:
@@ -135,41 +221,156 @@ def get_committed_offsets(
     return results
 
 
-def scan_partition_latencies(
-    consumer: Consumer,
-    scans: list[PartitionScan],
-    timeout: int,
+def fetch_committed_offsets(
+    admin: AdminClient,
+    group_ids: list[str],
+    batch_size: int = DEFAULT_OFFSET_FETCH_BATCH_SIZE,
     stop_event: threading.Event | None = None,
-) -> tuple[dict[tuple[str, int], float], list[Exception]]:
-    """Classify each partition's consumer latency from a single poll loop."""
-    latencies: dict[tuple[str, int], float] = {}
-    errors: list[Exception] = []
+) -> dict[str, list[TopicPartition] | Exception]:
+    """
+    Fetch committed offsets for every consumer group on a cluster in pipelined batches.
 
-    retention_by_key = {(scan.topic, scan.partition): scan.retention_ms for scan in scans}
-    pending = set(retention_by_key)
-    consumer.assign(
-        [TopicPartition(scan.topic, scan.partition, scan.committed_offset) for scan in scans]
+    The admin client only accepts a single group per OffsetFetch request, but it routes
+    each request to the group's coordinator itself and keeps every submitted request in
+    flight at once. Submitting a whole batch before resolving any of it costs roughly one
+    round trip per coordinator per batch instead of one round trip per group.
+    """
+    results: dict[str, list[TopicPartition] | Exception] = {}
+    for start in range(0, len(group_ids), batch_size):
+        if stop_event is not None and stop_event.is_set():
+            break
+        end = start + batch_size
+        results.update(get_committed_offsets(admin, group_ids[start:end]))
+    return results
+
+
+def get_high_watermarks(
+    admin: AdminClient, partitions: set[tuple[str, int]], timeout: int
+) -> dict[tuple[str, int], int]:
+    """
+    Look up the high watermark of every partition in one batched ListOffsets request.
+
+    Partitions whose lookup fails are left out so callers fall back to reading them.
+    """
+    if not partitions:
+        return {}
+
+    futures = admin.list_offsets(
+        {TopicPartition(topic, partition): OffsetSpec.latest() for topic, partition in partitions},
+        request_timeout=timeout,
     )
 
-    deadline = time.monotonic() + timeout
-    while pending and time.monotonic() < deadline:
-        if stop_event is not None and stop_event.is_set():
-            return latencies, errors
-        msg = consumer.poll(1.0)
-        if msg is None:
-            continue
+    high_watermarks: dict[tuple[str, int], int] = {}
+    for tp, future in futures.items():
+        try:
+            high_watermarks[(tp.topic, tp.partition)] = int(future.result().offset)
+        except Exception as e:
+            logger.warning(f"Failed to list high watermark for {tp.topic}[{tp.partition}]: {e}")
+    return high_watermarks
+
+
+def split_caught_up_partitions(
+    cluster_name: str,
+    committed_by_group: Mapping[str, list[TopicPartition]],
+    high_watermarks: Mapping[tuple[str, int], int],
+) -> tuple[list[TopicConsumerLatency], dict[str, list[TopicPartition]]]:
+    """
+    Resolve every partition committed at its high watermark to zero latency, and return
+    those results alongside the committed partitions that still need to be read.
+    """
+    caught_up: list[TopicConsumerLatency] = []
+    lagging_by_group: dict[str, list[TopicPartition]] = {}
+    for group_id, committed in committed_by_group.items():
+        lagging: list[TopicPartition] = []
+        for tp in committed:
+            high_watermark = high_watermarks.get((tp.topic, tp.partition))
+            if high_watermark is not None and int(tp.offset) >= high_watermark:
+                caught_up.append(
+                    TopicConsumerLatency(
+                        cluster_name=cluster_name,
+                        group_id=group_id,
+                        topic_name=tp.topic,
+                        latency_ms=0.0,
+                        partition=tp.partition,
+                        offset_lag=_offset_lag(high_watermark, int(tp.offset)),
+                        high_watermark=high_watermark,
+                    )
+                )
+            else:
+                lagging.append(tp)
+        lagging_by_group[group_id] = lagging
+    return caught_up, lagging_by_group
+
+
+def _cached_partitions(
+    cluster_name: str,
+    committed_by_group: Mapping[str, list[TopicPartition]],
+    timestamp_cache: OffsetTimestampCache | None,
+) -> set[tuple[str, int]]:
+    """
+    The partitions with a committed offset whose message timestamp is in `timestamp_cache`.
+    """
+    if timestamp_cache is None:
+        return set()
+    return {
+        (tp.topic, tp.partition)
+        for committed in committed_by_group.values()
+        for tp in committed
+        if timestamp_cache.get(cluster_name, tp.topic, tp.partition, int(tp.offset)) is not None
+    }
+
+
+def _offset_lag(high_watermark: int | None, committed_offset: int) -> int | None:
+    if high_watermark is None:
+        return None
+    return max(0, high_watermark - committed_offset)
+
+
+def _cached_high_watermark(consumer: Consumer, topic: str, partition: int) -> int | None:
+    """
+    The partition's high watermark as of the consumer's last fetch from it, which costs no
+    request, or None if the consumer has not fetched it yet.
+    """
+    watermarks = consumer.get_watermark_offsets(TopicPartition(topic, partition), cached=True)
+    if not isinstance(watermarks, tuple):
+        return None
+    high = watermarks[1]
+    return int(high) if isinstance(high, int) and high >= 0 else None
+
+
+class _PartitionScanState:
+    """
+    Tracks which partitions of a scan are still waiting for a message, and classifies
+    each message that arrives for them.
+    """
 
+    def __init__(
+        self,
+        scans: list[PartitionScan],
+        on_timestamp: Callable[[PartitionScan, int], None] | None = None,
+        high_watermarks: dict[tuple[str, int], int] | None = None,
+    ) -> None:
+        self.latencies: dict[tuple[str, int], float] = {}
+        self.high_watermarks = high_watermarks
+        self.errors: list[Exception] = []
+        self.scan_by_key = {(scan.topic, scan.partition): scan for scan in scans}
+        self.pending = set(self.scan_by_key)
+        self.on_timestamp = on_timestamp
+        self.polls = 0
+        self.retryable_errors = 0
+
+    def record(self, consumer: Consumer, msg: Message) -> None:
         msg_topic = msg.topic()
         msg_partition = msg.partition()
 
         key = (msg_topic, msg_partition)
-        if key not in pending:
-            continue
+        if key not in self.pending:
+            return
 
         # We only need one message per partition to record latency. Our
         # consumer is assigned every partition at once, so without
         # pausing the broker keeps fetching from partitions we've already
-        # scanned and poll() returns useless messages. These messages can
+        # scanned and consume() returns useless messages. These messages can
         # flood the queue and prevent unscanned partitions from being fetched.
         # Pausing scanned partitions prevents this blocking from happening.
 
@@ -177,97 +378,514 @@ def scan_partition_latencies(
         if error is not None:
             code = error.code()
             if code in RETRYABLE_ERRORS:
-                continue
+                self.retryable_errors += 1
+                return
             if code == KafkaError._PARTITION_EOF:
-                latencies[key] = 0.0
+                self.latencies[key] = 0.0
             elif code == KafkaError._AUTO_OFFSET_RESET:
-                latencies[key] = float(retention_by_key[key])
+                self.latencies[key] = float(self.scan_by_key[key].retention_ms)
             else:
-                errors.append(KafkaException(error))
-            pending.discard(key)
-            consumer.pause([TopicPartition(msg_topic, msg_partition)])
-            continue
+                self.errors.append(KafkaException(error))
+            self.resolve(consumer, key)
+            return
 
         ts_type, ts_ms = msg.timestamp()
         if ts_type == TIMESTAMP_NOT_AVAILABLE:
-            errors.append(ValueError(f"Timestamp not available for {key[0]}[{key[1]}]"))
+            self.errors.append(ValueError(f"Timestamp not available for {key[0]}[{key[1]}]"))
         elif ts_ms < 0:
-            errors.append(ValueError(f"Invalid timestamp {ts_ms} for {key[0]}[{key[1]}]"))
+            self.errors.append(ValueError(f"Invalid timestamp {ts_ms} for {key[0]}[{key[1]}]"))
         else:
-            latencies[key] = float(int(time.time() * 1000) - int(ts_ms))
-        pending.discard(key)
-        consumer.pause([TopicPartition(msg_topic, msg_partition)])
+            self.latencies[key] = float(int(time.time() * 1000) - int(ts_ms))
+            if self.on_timestamp is not None:
+                self.on_timestamp(self.scan_by_key[key], int(ts_ms))
+        self.resolve(consumer, key)
+
+    def resolve(self, consumer: Consumer, key: tuple[str, int]) -> None:
+        self.pending.discard(key)
+        consumer.pause([TopicPartition(*key)])
+        if self.high_watermarks is not None:
+            # The fetch that returned this message also carried the high watermark.
+            high_watermark = _cached_high_watermark(consumer, *key)
+            if high_watermark is not None:
+                self.high_watermarks[key] = high_watermark
+
+    def report(self, stats: ScanStats | None, timeouts: int = 0) -> None:
+        if stats is not None:
+            stats.add(polls=self.polls, timeouts=timeouts, retryable_errors=self.retryable_errors)
+
+    def finish(
+        self, stats: ScanStats | None = None
+    ) -> tuple[dict[tuple[str, int], float], list[Exception]]:
+        for topic, partition in self.pending:
+            self.errors.append(
+                TimeoutError(f"Timed out reading timestamp for {topic}[{partition}]")
+            )
+        self.report(stats, timeouts=len(self.pending))
+        return self.latencies, self.errors
+
+
+def scan_partition_latencies(
+    consumer: Consumer,
+    scans: list[PartitionScan],
+    timeout: int,
+    stop_event: threading.Event | None = None,
+    on_timestamp: Callable[[PartitionScan, int], None] | None = None,
+    stats: ScanStats | None = None,
+    high_watermarks: dict[tuple[str, int], int] | None = None,
+) -> tuple[dict[tuple[str, int], float], list[Exception]]:
+    """
+    Classify each partition's consumer latency from a single consume loop.
 
-    for topic, partition in pending:
-        errors.append(TimeoutError(f"Timed out reading timestamp for {topic}[{partition}]"))
+    `on_timestamp` is called with the scan and message timestamp of every partition
+    whose latency was read from a real message. Polls, timeouts and retryable errors are
+    counted in `stats` if given. The high watermark the consumer saw for every partition
+    resolved is put in `high_watermarks` if given.
+    """
+    state = _PartitionScanState(scans, on_timestamp, high_watermarks)
+    consumer.assign(
+        [TopicPartition(scan.topic, scan.partition, scan.committed_offset) for scan in scans]
+    )
 
-    return latencies, errors
+    deadline = time.monotonic() + timeout
+    while state.pending:
+        if stop_event is not None and stop_event.is_set():
+            state.report(stats)
+            return state.latencies, state.errors
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        state.polls += 1
+        # Ask for one message per unresolved partition so consume() returns as soon as
+        # they have all arrived, rather than waiting out a fixed poll interval.
+        for msg in consumer.consume(
+            num_messages=len(state.pending), timeout=min(remaining, CONSUME_MAX_WAIT)
+        ):
+            state.record(consumer, msg)
 
+    return state.finish(stats)
 
-def get_consumer_group_latency(
-    admin: AdminClient,
-    consumer_config: Mapping[str, object],
-    cluster_name: str,
-    group_id: str,
+
+async def scan_partition_latencies_async(
+    consumer: Consumer,
+    scans: list[PartitionScan],
+    timeout: int,
+    stop_event: threading.Event | None = None,
+    on_timestamp: Callable[[PartitionScan, int], None] | None = None,
+    stats: ScanStats | None = None,
+    high_watermarks: dict[tuple[str, int], int] | None = None,
+) -> tuple[dict[tuple[str, int], float], list[Exception]]:
+    """
+    The asyncio counterpart of `scan_partition_latencies`.
+
+    Consumes without blocking and yields to the event loop whenever no message is ready, so
+    a single thread can drive many consumers at once. The idle sleep doubles on every
+    empty batch, up to ASYNC_MAX_IDLE_SLEEP, to keep idle consumers cheap.
+    """
+    state = _PartitionScanState(scans, on_timestamp, high_watermarks)
+    consumer.assign(
+        [TopicPartition(scan.topic, scan.partition, scan.committed_offset) for scan in scans]
+    )
+
+    idle_sleep = ASYNC_MIN_IDLE_SLEEP
+    deadline = time.monotonic() + timeout
+    while state.pending and time.monotonic() < deadline:
+        if stop_event is not None and stop_event.is_set():
+            state.report(stats)
+            return state.latencies, state.errors
+        state.polls += 1
+        msgs = consumer.consume(num_messages=len(state.pending), timeout=0)
+        if not msgs:
+            await asyncio.sleep(min(idle_sleep, max(0.0, deadline - time.monotonic())))
+            idle_sleep = min(idle_sleep * 2, ASYNC_MAX_IDLE_SLEEP)
+            continue
+        idle_sleep = ASYNC_MIN_IDLE_SLEEP
+        for msg in msgs:
+            state.record(consumer, msg)
+
+    return state.finish(stats)
+
+
+def plan_partition_scans(
+    committed_by_group: Mapping[str, list[TopicPartition]],
     retentions_by_topic: Mapping[str, int],
+    batch_size: int = DEFAULT_SCAN_BATCH_SIZE,
+    high_watermarks: Mapping[tuple[str, int], int] | None = None,
+) -> list[list[PartitionScan]]:
+    """
+    Collapse every group's committed offsets into the unique reads needed to cover them.
+
+    Groups committed at the same offset of the same partition share a single read. A consumer
+    can only be assigned a partition once, so reads of different offsets on the same partition
+    are spread across separate batches, and each batch is capped at `batch_size` partitions.
+    Any already known `high_watermarks` are carried on the scans for their offset lag.
+    """
+    high_watermarks = high_watermarks or {}
+    unique: dict[tuple[str, int, int], PartitionScan] = {}
+    for group_id, committed in committed_by_group.items():
+        for tp in committed:
+            if tp.topic not in retentions_by_topic:
+                continue
+            key = (tp.topic, tp.partition, int(tp.offset))
+            existing = unique.get(key)
+            if existing is not None:
+                existing.group_ids.append(group_id)
+                continue
+            unique[key] = PartitionScan(
+                group_ids=[group_id],
+                topic=tp.topic,
+                partition=tp.partition,
+                committed_offset=int(tp.offset),
+                retention_ms=retentions_by_topic[tp.topic],
+                high_watermark=high_watermarks.get((tp.topic, tp.partition)),
+            )
+
+    layers: list[list[PartitionScan]] = []
+    depth_by_partition: dict[tuple[str, int], int] = {}
+    for scan in unique.values():
+        depth = depth_by_partition.get((scan.topic, scan.partition), 0)
+        depth_by_partition[(scan.topic, scan.partition)] = depth + 1
+        if depth == len(layers):
+            layers.append([])
+        layers[depth].append(scan)
+
+    batches: list[list[PartitionScan]] = []
+    for layer in layers:
+        for start in range(0, len(layer), batch_size):
+            end = start + batch_size
+            batches.append(layer[start:end])
+    return batches
+
+
+def get_partition_batch_latency(
+    pool: ConsumerPool,
+    cluster_name: str,
+    batch: list[PartitionScan],
     timeout: int,
     stop_event: threading.Event | None = None,
+    timestamp_cache: OffsetTimestampCache | None = None,
+    stats: ScanStats | None = None,
+    queued_at: float | None = None,
+    limiter: AimdLimiter | None = None,
+    acquired: float | None = None,
 ) -> ConsumerLatencyResult:
     """
-    Scan every partition for a single consumer group on one dedicated consumer.
+    Read one batch of unique partition offsets on a pooled consumer and fan each
+    latency back out to every consumer group committed at that offset.
+
+    Offsets whose message timestamp is already in `timestamp_cache` are not read again.
+    If `queued_at` is given, how long the batch waited for a consumer since then is
+    recorded in `stats`. If `limiter` is given, the read waits for one of its slots and
+    reports back how long it took and whether it failed. Pass `acquired` when the caller
+    already took the slot at that time; it is given back unused if nothing is read.
     """
-    scans: list[TopicConsumerLatency] = []
+    try:
+        if not batch or (stop_event is not None and stop_event.is_set()):
+            return ConsumerLatencyResult(scans=[])
+
+        latencies, to_read, on_timestamp = _resolve_cached_timestamps(
+            cluster_name, batch, timestamp_cache
+        )
+        errors: list[Exception] = []
+        high_watermarks: dict[tuple[str, int], int] = {}
+        if to_read:
+            if acquired is not None:
+                started, acquired = acquired, None
+            else:
+                started = limiter.acquire(stop_event) if limiter is not None else 0.0
+            failed = True
+            try:
+                with pool.acquire() as consumer:
+                    _record_batch_wait(stats, queued_at)
+                    read, scan_errors = scan_partition_latencies(
+                        consumer, to_read, timeout, stop_event, on_timestamp, stats, high_watermarks
+                    )
+                failed = _is_overloaded(scan_errors)
+            finally:
+                if limiter is not None:
+                    limiter.release(started, failed)
+            latencies.update(read)
+            errors.extend(scan_errors)
+
+        return ConsumerLatencyResult(
+            scans=_fan_out(cluster_name, batch, latencies, high_watermarks), errors=errors
+        )
+    finally:
+        if limiter is not None and acquired is not None:
+            limiter.cancel()
+
+
+async def get_partition_batch_latency_async(
+    pool: ConsumerPool,
+    cluster_name: str,
+    batch: list[PartitionScan],
+    timeout: int,
+    in_flight: asyncio.Semaphore,
+    stop_event: threading.Event | None = None,
+    timestamp_cache: OffsetTimestampCache | None = None,
+    stats: ScanStats | None = None,
+    queued_at: float | None = None,
+    limiter: AimdLimiter | None = None,
+) -> ConsumerLatencyResult:
+    """
+    The asyncio counterpart of `get_partition_batch_latency`; `in_flight` bounds how many
+    batches hold a consumer at once.
+    """
+    if not batch or (stop_event is not None and stop_event.is_set()):
+        return ConsumerLatencyResult(scans=[])
+
+    latencies, to_read, on_timestamp = _resolve_cached_timestamps(
+        cluster_name, batch, timestamp_cache
+    )
     errors: list[Exception] = []
+    high_watermarks: dict[tuple[str, int], int] = {}
+    if to_read:
+        async with in_flight:
+            started = await limiter.acquire_async(stop_event) if limiter is not None else 0.0
+            failed = True
+            try:
+                with pool.acquire() as consumer:
+                    _record_batch_wait(stats, queued_at)
+                    read, scan_errors = await scan_partition_latencies_async(
+                        consumer,
+                        to_read,
+                        timeout,
+                        stop_event,
+                        on_timestamp,
+                        stats,
+                        high_watermarks,
+                    )
+                failed = _is_overloaded(scan_errors)
+            finally:
+                if limiter is not None:
+                    limiter.release(started, failed)
+        latencies.update(read)
+        errors.extend(scan_errors)
 
-    if stop_event is not None and stop_event.is_set():
-        return ConsumerLatencyResult(scans=scans, errors=errors)
+    return ConsumerLatencyResult(
+        scans=_fan_out(cluster_name, batch, latencies, high_watermarks), errors=errors
+    )
 
-    committed = get_committed_offsets(admin, [group_id])[group_id]
-    if isinstance(committed, Exception):
-        errors.append(committed)
-        return ConsumerLatencyResult(scans=scans, errors=errors)
 
-    group_scans = [
-        PartitionScan(
-            group_id=group_id,
-            topic=tp.topic,
-            partition=tp.partition,
-            committed_offset=int(tp.offset),
-            retention_ms=retentions_by_topic[tp.topic],
-        )
-        for tp in committed
-        if tp.topic in retentions_by_topic
-    ]
+def scan_partition_batches(
+    executor: Executor,
+    pool: ConsumerPool,
+    cluster_name: str,
+    batches: list[list[PartitionScan]],
+    timeout: int,
+    max_in_flight: int,
+    stop_event: threading.Event | None = None,
+    timestamp_cache: OffsetTimestampCache | None = None,
+    on_scans: ScansCallback | None = None,
+    stats: ScanStats | None = None,
+    limiter: AimdLimiter | None = None,
+) -> ConsumerLatencyResult:
+    """
+    Scan every batch on `executor` with at most `max_in_flight` batches submitted at once,
+    and no more than `limiter` currently allows.
 
-    if not group_scans:
-        return ConsumerLatencyResult(scans=scans, errors=errors)
+    A batch is only submitted once it has a slot, taken here rather than on the worker,
+    and more are submitted as earlier ones finish. So workers shared with other clusters
+    never sit blocked waiting on this cluster, and a cluster cannot queue up the shared
+    workers ahead of the others.
 
-    consumer = Consumer(dict(consumer_config))
+    If `on_scans` is given, each batch's scans are handed to it as soon as the batch
+    completes and are left out of the returned result.
+    """
+    scans: list[TopicConsumerLatency] = []
+    errors: list[Exception] = []
+    remaining = deque(batches)
+    in_flight: dict[Future[ConsumerLatencyResult], float | None] = {}
     try:
-        latencies, scan_errors = scan_partition_latencies(
-            consumer, group_scans, timeout, stop_event
-        )
-        errors.extend(scan_errors)
-        for item in group_scans:
-            latency_ms = latencies.get((item.topic, item.partition))
-            if latency_ms is None:
-                continue
+        while remaining or in_flight:
+            if stop_event is not None and stop_event.is_set():
+                break
+            while remaining and len(in_flight) < max_in_flight:
+                acquired = None
+                if limiter is not None:
+                    # Only wait for a slot when nothing in flight is going to free one up.
+                    acquired = limiter.try_acquire() if in_flight else limiter.acquire(stop_event)
+                    if acquired is None:
+                        break
+                future = executor.submit(
+                    get_partition_batch_latency,
+                    pool,
+                    cluster_name,
+                    remaining.popleft(),
+                    timeout,
+                    stop_event,
+                    timestamp_cache,
+                    stats,
+                    time.monotonic(),
+                    limiter,
+                    acquired,
+                )
+                in_flight[future] = acquired
+
+            done, _ = wait(in_flight, timeout=CLUSTER_WAIT_INTERVAL, return_when=FIRST_COMPLETED)
+            for future in done:
+                del in_flight[future]
+                try:
+                    result = future.result()
+                    errors.extend(result.errors)
+                    if on_scans is None:
+                        scans.extend(result.scans)
+                    elif result.scans:
+                        on_scans(result.scans)
+                except Exception as e:
+                    errors.append(e)
+    finally:
+        for future, acquired in in_flight.items():
+            # A batch cancelled before it ran never gives its slot back itself.
+            if future.cancel() and limiter is not None and acquired is not None:
+                limiter.cancel()
+    return ConsumerLatencyResult(scans=scans, errors=errors)
+
+
+async def scan_partition_batches_async(
+    pool: ConsumerPool,
+    cluster_name: str,
+    batches: list[list[PartitionScan]],
+    timeout: int,
+    max_in_flight: int,
+    stop_event: threading.Event | None = None,
+    timestamp_cache: OffsetTimestampCache | None = None,
+    on_scans: ScansCallback | None = None,
+    stats: ScanStats | None = None,
+    limiter: AimdLimiter | None = None,
+) -> ConsumerLatencyResult:
+    """
+    Scan every batch on the current event loop with at most `max_in_flight` consumers
+    polling at once.
+
+    If `on_scans` is given, each batch's scans are handed to it as soon as the batch
+    completes and are left out of the returned result.
+    """
+    in_flight = asyncio.Semaphore(max_in_flight)
+    scans: list[TopicConsumerLatency] = []
+    errors: list[Exception] = []
+    queued_at = time.monotonic()
+    for next_result in asyncio.as_completed(
+        [
+            get_partition_batch_latency_async(
+                pool,
+                cluster_name,
+                batch,
+                timeout,
+                in_flight,
+                stop_event,
+                timestamp_cache,
+                stats,
+                queued_at,
+                limiter,
+            )
+            for batch in batches
+        ]
+    ):
+        try:
+            result = await next_result
+        except Exception as e:
+            errors.append(e)
+            continue
+        errors.extend(result.errors)
+        if on_scans is None:
+            scans.extend(result.scans)
+        elif result.scans:
+            on_scans(result.scans)
+    return ConsumerLatencyResult(scans=scans, errors=errors)
+
+
+def _is_overloaded(errors: list[Exception]) -> bool:
+    """
+    Whether a batch's errors suggest the brokers are struggling, rather than something
+    wrong with the messages read.
+    """
+    return any(isinstance(error, (TimeoutError, KafkaException)) for error in errors)
+
+
+def _record_batch_wait(stats: ScanStats | None, queued_at: float | None) -> None:
+    if stats is not None and queued_at is not None:
+        stats.record_batch_wait(time.monotonic() - queued_at)
+
+
+def _resolve_cached_timestamps(
+    cluster_name: str,
+    batch: list[PartitionScan],
+    timestamp_cache: OffsetTimestampCache | None,
+) -> tuple[
+    dict[tuple[str, int], float],
+    list[PartitionScan],
+    Callable[[PartitionScan, int], None] | None,
+]:
+    """
+    Split a batch into latencies already known from `timestamp_cache` and the scans
+    that still need a read, plus the callback that caches what those reads find.
+    """
+    if timestamp_cache is None:
+        return {}, batch, None
+
+    cache = timestamp_cache
+    latencies: dict[tuple[str, int], float] = {}
+    to_read: list[PartitionScan] = []
+    now_ms = int(time.time() * 1000)
+    for item in batch:
+        ts_ms = cache.get(cluster_name, item.topic, item.partition, item.committed_offset)
+        if ts_ms is None:
+            to_read.append(item)
+        else:
+            latencies[(item.topic, item.partition)] = float(now_ms - ts_ms)
+
+    def cache_timestamp(item: PartitionScan, ts_ms: int) -> None:
+        cache.put(cluster_name, item.topic, item.partition, item.committed_offset, ts_ms)
+
+    return latencies, to_read, cache_timestamp
+
+
+def _fan_out(
+    cluster_name: str,
+    batch: list[PartitionScan],
+    latencies: Mapping[tuple[str, int], float],
+    high_watermarks: Mapping[tuple[str, int], int],
+) -> list[TopicConsumerLatency]:
+    scans: list[TopicConsumerLatency] = []
+    for item in batch:
+        latency_ms = latencies.get((item.topic, item.partition))
+        if latency_ms is None:
+            continue
+        # Prefer what the read saw over the ListOffsets lookup made before it.
+        high_watermark = high_watermarks.get((item.topic, item.partition), item.high_watermark)
+        offset_lag = _offset_lag(high_watermark, item.committed_offset)
+        for group_id in item.group_ids:
             scans.append(
                 TopicConsumerLatency(
                     cluster_name=cluster_name,
-                    group_id=item.group_id,
+                    group_id=group_id,
                     topic_name=item.topic,
                     latency_ms=latency_ms,
                     partition=item.partition,
+                    offset_lag=offset_lag,
+                    high_watermark=high_watermark,
                 )
             )
-    finally:
-        try:
-            consumer.close()
-        except Exception as e:
-            errors.append(e)
+    return scans
 
-    return ConsumerLatencyResult(scans=scans, errors=errors)
+
+def build_latency_consumer_config(cluster_name: str, config: ClusterConfig) -> dict[str, object]:
+    """
+    Builds the config for the consumers that read committed offsets on a cluster.
+    """
+    # enable.partition.eof: ensures that _PARTITION_EOF is raised on poll consumer is caught up
+    # auto.offset.reset: ensures _AUTO_OFFSET_RESET is raised on poll consumer is out of retention
+    return {
+        "enable.auto.commit": False,
+        "enable.partition.eof": True,
+        "auto.offset.reset": "error",
+        "group.id": _latency_consumer_group_id(cluster_name),
+        **build_broker_config(config),
+    }
+
+
+def _latency_consumer_group_id(cluster_name: str) -> str:
+    return f"consumer-latency-group-{cluster_name}"
 
 
 def get_cluster_latency(
@@ -277,103 +895,399 @@ def get_cluster_latency(
     timeout: int,
     max_workers: int = DEFAULT_MAX_WORKERS,
     stop_event: threading.Event | None = None,
+    consumer_pool: ConsumerPool | None = None,
+    timestamp_cache: OffsetTimestampCache | None = None,
+    scan_engine: ScanEngine = ScanEngine.CONSUME,
+    executor: Executor | None = None,
+    concurrency: Concurrency = Concurrency.THREADS,
+    on_scans: ScansCallback | None = None,
+    stats: ScanStats | None = None,
+    group_cache: ConsumerGroupCache | None = None,
+    skip_group_states: Collection[ConsumerGroupState] = (),
+    scan_filter: ScanFilter | None = None,
+    sampler: ScanSampler | None = None,
+    limiter: AimdLimiter | None = None,
 ) -> ConsumerLatencyResult:
-    consumer_group_id = f"consumer-latency-group-{cluster_name}"
+    """
+    Scan consumer latency for every consumer group on a cluster.
+
+    Pass a long-lived `consumer_pool` to reuse consumers across calls; otherwise a pool is
+    created for this call only and closed before returning. Pass a long-lived
+    `timestamp_cache` to skip reading offsets whose timestamps are already known. Pass an
+    `executor` to run partition scans on workers shared with other clusters instead of a
+    dedicated pool of `max_workers` threads. With `Concurrency.ASYNCIO` the partition scans
+    run on an event loop in the calling thread instead and `executor` is not used.
+
+    Pass `on_scans` to stream results: it is called from the calling thread with each
+    batch of scans as soon as that batch completes, and the returned result then only
+    carries errors.
+
+    Pass `stats` to find out what the scan did and how long each phase of it took. Pass a
+    long-lived `group_cache` to list the cluster's groups on its refresh cadence rather
+    than on every call. Groups in one of `skip_group_states`, such as groups with no
+    members left, are not scanned. Groups and topics left out by `scan_filter` are
+    dropped before any offset is fetched or consumer created. Pass the cluster's
+    long-lived `sampler` to scan only the groups and partitions its policy picks. Pass the
+    cluster's long-lived `limiter` to adapt how many batches are read at once, below
+    `max_workers`, to how the cluster is coping.
+    """
+    stats = stats if stats is not None else ScanStats()
+    consumer_group_id = _latency_consumer_group_id(cluster_name)
     scans: list[TopicConsumerLatency] = []
     errors: list[Exception] = []
 
+    def collect(completed: list[TopicConsumerLatency]) -> None:
+        if sampler is not None:
+            sampler.record(completed)
+        if on_scans is None:
+            scans.extend(completed)
+        elif completed:
+            on_scans(completed)
+
+    scan_filter = scan_filter or ScanFilter()
     retentions_by_topic: dict[str, int] = {}
 
     for topic_name, topic_config in topics.items():
+        if not scan_filter.topics.matches(topic_name):
+            continue
         retention_ms = topic_config["settings"].get("retention.ms")
         if retention_ms is None:
             retentions_by_topic[topic_name] = 604800000
         else:
             retentions_by_topic[topic_name] = int(retention_ms)
 
-    # enable.partition.eof: ensures that _PARTITION_EOF is raised on poll consumer is caught up
-    # auto.offset.reset: ensures _AUTO_OFFSET_RESET is raised on poll consumer is out of retention
-
-    consumer_config = {
-        "enable.auto.commit": False,
-        "enable.partition.eof": True,
-        "auto.offset.reset": "error",
-        "group.id": consumer_group_id,
-        **build_broker_config(config),
-    }
+    owns_pool = consumer_pool is None
+    pool = consumer_pool or ConsumerPool(
+        build_latency_consumer_config(cluster_name, config), max_size=max_workers
+    )
 
     t0 = time.monotonic()
+    pool_stats = pool.stats()
 
     try:
         admin = get_admin_client(config)
 
-        try:
-            group_ids = list_consumer_group_ids(admin)
-        except ConsumerGroupListingError as e:
-            errors.extend(e.errors)
-            group_ids = [listing.group_id for listing in e.valid]
+        def list_group_ids() -> list[str]:
+            stats.add(admin_requests=1)
+            return list_consumer_group_ids(admin, skip_group_states)
 
-        scan_group_ids = [g for g in group_ids if g != consumer_group_id]
+        with stats.phase(ScanPhase.LIST_GROUPS):
+            try:
+                if group_cache is not None:
+                    group_ids = group_cache.get(cluster_name, list_group_ids)
+                else:
+                    group_ids = list_group_ids()
+            except ConsumerGroupListingError as e:
+                errors.append(e)
+                group_ids = filter_consumer_group_ids(e.valid, skip_group_states)
+
+        scan_group_ids = [
+            g for g in group_ids if g != consumer_group_id and scan_filter.groups.matches(g)
+        ]
+        if sampler is not None:
+            scan_group_ids = sampler.select_groups(scan_group_ids)
+        stats.groups = len(scan_group_ids)
 
         if not scan_group_ids:
             return ConsumerLatencyResult(scans=scans, errors=errors)
 
-        with ThreadPoolExecutor(
-            max_workers=max_workers,
-            thread_name_prefix=f"latency-{cluster_name}",
-        ) as executor:
-            futures = [
-                executor.submit(
-                    get_consumer_group_latency,
-                    admin,
-                    consumer_config,
-                    cluster_name,
-                    group_id,
-                    retentions_by_topic,
-                    timeout,
-                    stop_event,
+        # Fetch every group's committed offsets up front so the coordinator round trips
+        # are pipelined, rather than serialized behind each worker's partition scan.
+        committed_by_group: dict[str, list[TopicPartition]] = {}
+        with stats.phase(ScanPhase.FETCH_OFFSETS):
+            committed_offsets = fetch_committed_offsets(
+                admin, scan_group_ids, stop_event=stop_event
+            )
+        stats.add(admin_requests=len(committed_offsets))
+        for group_id, committed in committed_offsets.items():
+            if isinstance(committed, Exception):
+                errors.append(committed)
+            else:
+                committed_by_group[group_id] = [
+                    tp for tp in committed if tp.topic in retentions_by_topic
+                ]
+        if sampler is not None:
+            committed_by_group = sampler.select_partitions(committed_by_group)
+        stats.partitions = sum(len(committed) for committed in committed_by_group.values())
+
+        if scan_engine == ScanEngine.LIST_OFFSETS:
+            # Most partitions are caught up; one ListOffsets request resolves all of those
+            # without reading a message, leaving only lagging partitions to scan.
+            partitions = {
+                (tp.topic, tp.partition) for tps in committed_by_group.values() for tp in tps
+            }
+            with stats.phase(ScanPhase.LIST_OFFSETS):
+                high_watermarks = get_high_watermarks(admin, partitions, timeout)
+            if partitions:
+                stats.add(admin_requests=1)
+            caught_up, committed_by_group = split_caught_up_partitions(
+                cluster_name, committed_by_group, high_watermarks
+            )
+            collect(caught_up)
+
+        else:
+            # Offsets whose timestamps are cached are not read again, so no read reports
+            # their high watermark; look those up in one ListOffsets request instead.
+            partitions = _cached_partitions(cluster_name, committed_by_group, timestamp_cache)
+            high_watermarks = {}
+            if partitions:
+                with stats.phase(ScanPhase.LIST_OFFSETS):
+                    high_watermarks = get_high_watermarks(admin, partitions, timeout)
+                stats.add(admin_requests=1)
+
+        # Groups that sit at the same offset (replays, shadows, canaries) share one read.
+        batches = plan_partition_scans(
+            committed_by_group, retentions_by_topic, high_watermarks=high_watermarks
+        )
+
+        if concurrency == Concurrency.ASYNCIO:
+            with stats.phase(ScanPhase.READ_PARTITIONS):
+                batch_result = asyncio.run(
+                    scan_partition_batches_async(
+                        pool,
+                        cluster_name,
+                        batches,
+                        timeout,
+                        max_workers,
+                        stop_event,
+                        timestamp_cache,
+                        collect,
+                        stats,
+                        limiter,
+                    )
                 )
-                for group_id in scan_group_ids
-            ]
-            try:
-                for future in as_completed(futures):
-                    if stop_event is not None and stop_event.is_set():
-                        break
-                    try:
-                        group_result = future.result()
-                        scans.extend(group_result.scans)
-                        errors.extend(group_result.errors)
-                    except Exception as e:
-                        errors.append(e)
-            finally:
-                if stop_event is not None and stop_event.is_set():
-                    for future in futures:
-                        future.cancel()
+            scans.extend(batch_result.scans)
+            errors.extend(batch_result.errors)
+            return ConsumerLatencyResult(scans=scans, errors=errors)
+
+        with (
+            stats.phase(ScanPhase.READ_PARTITIONS),
+            (
+                nullcontext(executor)
+                if executor is not None
+                else ThreadPoolExecutor(
+                    max_workers=max_workers,
+                    thread_name_prefix=f"latency-{cluster_name}",
+                )
+            ) as scan_executor,
+        ):
+            batch_result = scan_partition_batches(
+                scan_executor,
+                pool,
+                cluster_name,
+                batches,
+                timeout,
+                max_workers,
+                stop_event,
+                timestamp_cache,
+                collect,
+                stats,
+                limiter,
+            )
+        errors.extend(batch_result.errors)
     except Exception as e:
         errors.append(e)
+    finally:
+        if owns_pool:
+            pool.close()
+        closed_stats = pool.stats()
+        stats.consumers_created = closed_stats.created - pool_stats.created
+        stats.consumers_closed = closed_stats.evicted - pool_stats.evicted
+        stats.duration = time.monotonic() - t0
+        if limiter is not None:
+            stats.concurrency_limit = limiter.limit
 
     logger.info(f"Time taken to scan cluster {cluster_name}: {time.monotonic() - t0:.3f}s")
 
     return ConsumerLatencyResult(scans=scans, errors=errors)
 
 
+def _scan_failed(result: ConsumerLatencyResult, scanned: int) -> bool:
+    """
+    Whether a scan failed as a whole: it could not list the cluster's groups, or it
+    reported errors without any latency, as it does when it raises.
+    """
+    if any(isinstance(error, ConsumerGroupListingError) for error in result.errors):
+        return True
+    return bool(result.errors) and scanned == 0
+
+
+class ClusterLatencyScanner:
+    """
+    Scans one cluster's consumer latency, emitting each batch of scans as it is read and
+    the rollups and collector metrics once the scan finishes.
+
+    Keeps what should outlive a single scan of the cluster: its consumers, rollups,
+    `sampling` state and adaptive concurrency limit. Neither a failing `on_scans` callback
+    nor a failing metrics backend fails a scan.
+
+    Pass a long-lived `consumer_pool` to keep consumers beyond the scanner; otherwise the
+    scanner creates its own and closes it in `close`.
+    """
+
+    def __init__(
+        self,
+        config: KafkaConfig,
+        cluster_name: str,
+        metrics: MetricsBackend,
+        timeout: int,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        consumer_pool: ConsumerPool | None = None,
+        timestamp_cache: OffsetTimestampCache | None = None,
+        scan_engine: ScanEngine = ScanEngine.CONSUME,
+        executor: Executor | None = None,
+        concurrency: Concurrency = Concurrency.THREADS,
+        rollups: Collection[Rollup] = DEFAULT_ROLLUPS,
+        on_scans: ScansCallback | None = None,
+        group_cache: ConsumerGroupCache | None = None,
+        skip_group_states: Collection[ConsumerGroupState] = (),
+        scan_filter: ScanFilter | None = None,
+        sampling: SamplingPolicy | None = None,
+        adaptive_latency_target: float | None = None,
+    ) -> None:
+        self.__config = config
+        self.__cluster_name = cluster_name
+        self.__cluster_config = config.get_clusters()[cluster_name]
+        self.__metrics = metrics
+        self.__timeout = timeout
+        self.__max_workers = max_workers
+        self.__owns_pool = consumer_pool is None
+        self.__pool = consumer_pool or ConsumerPool(
+            build_latency_consumer_config(cluster_name, self.__cluster_config),
+            max_size=max_workers,
+        )
+        self.__timestamp_cache = timestamp_cache
+        self.__scan_engine = scan_engine
+        self.__executor = executor
+        self.__concurrency = concurrency
+        self.__emitter = ConsumerLatencyEmitter(metrics, rollups)
+        self.__on_scans = on_scans
+        self.__group_cache = group_cache
+        self.__skip_group_states = skip_group_states
+        self.__scan_filter = scan_filter
+        self.__sampler = ScanSampler(sampling) if sampling is not None else None
+        self.__limiter = (
+            AimdLimiter(max_workers, adaptive_latency_target)
+            if adaptive_latency_target is not None
+            else None
+        )
+        self.__abandoned = threading.Event()
+
+    def scan(self, stop_event: threading.Event) -> tuple[ConsumerLatencyResult, bool]:
+        """
+        Scan the cluster once, returning the scan's errors and whether it failed as a
+        whole rather than on some of its partitions or groups.
+        """
+        cluster_name = self.__cluster_name
+        scanned = 0
+
+        def emit(scans: list[TopicConsumerLatency]) -> None:
+            nonlocal scanned
+            if self.__abandoned.is_set():
+                return
+            scanned += len(scans)
+            self.__emitter.add(ConsumerLatencyResult(scans=scans))
+            if self.__on_scans is not None:
+                try:
+                    self.__on_scans(scans)
+                except Exception:
+                    logger.exception(f"Scans callback failed for cluster {cluster_name}")
+
+        stats = ScanStats()
+        try:
+            result = get_cluster_latency(
+                cluster_name,
+                self.__cluster_config,
+                self.__config.get_topics_config(cluster_name),
+                self.__timeout,
+                self.__max_workers,
+                stop_event,
+                self.__pool,
+                timestamp_cache=self.__timestamp_cache,
+                scan_engine=self.__scan_engine,
+                executor=self.__executor,
+                concurrency=self.__concurrency,
+                on_scans=emit,
+                stats=stats,
+                group_cache=self.__group_cache,
+                skip_group_states=self.__skip_group_states,
+                scan_filter=self.__scan_filter,
+                sampler=self.__sampler,
+                limiter=self.__limiter,
+            )
+        except Exception as e:
+            result = ConsumerLatencyResult(scans=[], errors=[e])
+
+        if not self.__abandoned.is_set():
+            try:
+                self.__emitter.finish()
+            except Exception:
+                logger.exception(f"Failed to emit latency rollups for cluster {cluster_name}")
+            try:
+                emit_scan_stats(self.__metrics, cluster_name, stats)
+            except Exception:
+                logger.exception(f"Failed to emit scan stats for cluster {cluster_name}")
+
+        return result, _scan_failed(result, scanned)
+
+    def abandon(self) -> None:
+        """
+        Give up on the scan in progress: nothing more of it is emitted, even if it carries
+        on reading in the background until it notices its stop signal.
+        """
+        self.__abandoned.set()
+
+    def close(self) -> None:
+        if self.__owns_pool:
+            self.__pool.close()
+
+
 def record_consumer_group_latency(
-    config: YamlKafkaConfig,
+    config: KafkaConfig,
     metrics: MetricsBackend,
     timeout: int = 10,
     max_workers: int = DEFAULT_MAX_WORKERS,
     stop_event: threading.Event | None = None,
     clusters: tuple[str, ...] | None = None,
+    consumer_pools: MutableMapping[str, ConsumerPool] | None = None,
+    timestamp_cache: OffsetTimestampCache | None = None,
+    scan_engine: ScanEngine = ScanEngine.CONSUME,
+    cluster_timeout: float | None = None,
+    total_workers: int | None = None,
+    concurrency: Concurrency = Concurrency.THREADS,
+    rollups: Collection[Rollup] = DEFAULT_ROLLUPS,
+    group_cache: ConsumerGroupCache | None = None,
+    skip_group_states: Collection[ConsumerGroupState] = (),
+    scan_filter: ScanFilter | None = None,
 ) -> ConsumerLatencyResult:
     """Collect and emit consumer latency for each selected cluster.
 
+    Clusters are scanned concurrently and partition latency is emitted as soon as each
+    batch of partitions is read, so the call takes as long as the slowest cluster rather
+    than the sum of all of them. Rollups are emitted once a cluster's scan finishes.
+
     Args:
         config: Kafka configuration providing the clusters and their topics.
-        metrics: Backend that per-partition latency histograms are emitted to.
+        metrics: Backend that latency metrics are emitted to.
         timeout: Seconds to wait for each Kafka request before timing out.
         max_workers: Maximum concurrent partition scans per cluster.
         stop_event: Optional shutdown signal; when set, scanning stops early.
         clusters: Names of clusters to scan; defaults to all when empty or None.
+        consumer_pools: Optional long-lived consumer pools keyed by cluster name. Pools
+            missing for a cluster are created and stored so later calls can reuse them.
+        timestamp_cache: Optional long-lived cache of message timestamps shared by every
+            cluster, so offsets that have not moved since the last call are not re-read.
+        scan_engine: How partition latency is measured.
+        cluster_timeout: Optional seconds to wait for each cluster. Clusters still scanning
+            at the deadline are told to stop, reported as a TimeoutError, and not waited on.
+        total_workers: Optional number of partition scan workers shared by all clusters.
+            When unset every cluster gets its own pool of `max_workers` workers.
+        concurrency: How each cluster's partition scans run concurrently.
+        rollups: Levels latency is emitted at; see `Rollup`.
+        group_cache: Optional long-lived cache of every cluster's consumer group IDs,
+            so groups are only listed again on the cache's refresh cadence.
+        skip_group_states: Group states whose groups are not scanned.
+        scan_filter: Optional groups and topics to scan on every cluster.
     """
     scans: list[TopicConsumerLatency] = []
     errors: list[Exception] = []
@@ -385,22 +1299,112 @@ def record_consumer_group_latency(
     else:
         cluster_items = dict(available_clusters)
 
+    if not cluster_items or (stop_event is not None and stop_event.is_set()):
+        return ConsumerLatencyResult(scans=scans, errors=errors)
+
+    # Each cluster gets its own stop signal so a cluster that misses the deadline can be
+    # stopped without stopping the others.
+    cluster_stops = {cluster_name: threading.Event() for cluster_name in cluster_items}
+    completed: queue.Queue[Future[ConsumerLatencyResult]] = queue.Queue()
+    scan_executor = (
+        ThreadPoolExecutor(max_workers=total_workers, thread_name_prefix="latency-scan")
+        if total_workers is not None
+        else None
+    )
+    cluster_executor = ThreadPoolExecutor(
+        max_workers=len(cluster_items), thread_name_prefix="latency-cluster"
+    )
+
+    scanners: dict[str, ClusterLatencyScanner] = {}
+    pending: dict[Future[ConsumerLatencyResult], str] = {}
     for cluster_name, cluster_config in cluster_items.items():
-        if stop_event is not None and stop_event.is_set():
-            break
-        try:
-            topics = config.get_topics_config(cluster_name)
-            result = get_cluster_latency(
-                cluster_name, cluster_config, topics, timeout, max_workers, stop_event
-            )
-        except Exception as e:
-            errors.append(e)
-            continue
+        pool = None
+        if consumer_pools is not None:
+            pool = consumer_pools.get(cluster_name)
+            if pool is None:
+                pool = ConsumerPool(
+                    build_latency_consumer_config(cluster_name, cluster_config),
+                    max_size=max_workers,
+                )
+                consumer_pools[cluster_name] = pool
+        cluster_scans: list[TopicConsumerLatency] = []
+        scanner = scanners[cluster_name] = ClusterLatencyScanner(
+            config,
+            cluster_name,
+            metrics,
+            timeout,
+            max_workers,
+            pool,
+            timestamp_cache=timestamp_cache,
+            scan_engine=scan_engine,
+            executor=scan_executor,
+            concurrency=concurrency,
+            rollups=rollups,
+            on_scans=cluster_scans.extend,
+            group_cache=group_cache,
+            skip_group_states=skip_group_states,
+            scan_filter=scan_filter,
+        )
+        future = cluster_executor.submit(
+            _scan_cluster, scanner, cluster_scans, cluster_stops[cluster_name]
+        )
+        pending[future] = cluster_name
+        future.add_done_callback(completed.put)
+
+    deadline = time.monotonic() + cluster_timeout if cluster_timeout is not None else None
+    try:
+        while pending:
+            if stop_event is not None and stop_event.is_set():
+                for cluster_stop in cluster_stops.values():
+                    cluster_stop.set()
+
+            wait = CLUSTER_WAIT_INTERVAL
+            if deadline is not None:
+                wait = min(wait, deadline - time.monotonic())
+                if wait <= 0:
+                    for cluster_name in pending.values():
+                        scanners[cluster_name].abandon()
+                        cluster_stops[cluster_name].set()
+                        errors.append(
+                            TimeoutError(
+                                f"Timed out scanning cluster {cluster_name} "
+                                f"after {cluster_timeout}s"
+                            )
+                        )
+                    break
+
+            try:
+                future = completed.get(timeout=wait)
+            except queue.Empty:
+                continue
 
-        for scan in result.scans:
-            emit_topic_consumer_latency(metrics, scan)
-            scans.append(scan)
-        if result.errors:
-            errors.extend(result.errors)
+            pending.pop(future)
+            try:
+                result = future.result()
+            except Exception as e:
+                errors.append(e)
+                continue
+
+            scans.extend(result.scans)
+            if result.errors:
+                errors.extend(result.errors)
+    finally:
+        # Clusters that missed the deadline keep running in the background until they
+        # notice their stop signal; don't block on them here.
+        cluster_executor.shutdown(wait=False)
+        if scan_executor is not None:
+            scan_executor.shutdown(wait=False)
 
     return ConsumerLatencyResult(scans=scans, errors=errors)
+
+
+def _scan_cluster(
+    scanner: ClusterLatencyScanner,
+    scans: list[TopicConsumerLatency],
+    stop_event: threading.Event,
+) -> ConsumerLatencyResult:
+    try:
+        result, _ = scanner.scan(stop_event)
+    finally:
+        scanner.close()
+    return ConsumerLatencyResult(scans=scans, errors=result.errors)
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Mapping
+
+from confluent_kafka import Consumer  # type: ignore[import-untyped]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 128
+DEFAULT_MAX_IDLE_SECONDS = 300.0
+
+
+@dataclass
+class ConsumerPoolStats:
+    idle: int
+    in_use: int
+    created: int
+    evicted: int
+
+
+class ConsumerPool:
+    """
+    A bounded pool of long-lived consumers for a single cluster.
+
+    Consumers outlive a single scan interval, so steady-state scans skip the connection,
+    SASL and metadata bootstrap that creating a consumer costs. A scan borrows a consumer,
+    assigns the partitions it needs, and the pool unassigns it on return. Consumers that
+    raise while borrowed, fail to unassign, or sit idle for longer than `max_idle_seconds`
+    are evicted and closed.
+    """
+
+    def __init__(
+        self,
+        consumer_config: Mapping[str, object],
+        max_size: int = DEFAULT_POOL_SIZE,
+        max_idle_seconds: float = DEFAULT_MAX_IDLE_SECONDS,
+    ) -> None:
+        self.__consumer_config = dict(consumer_config)
+        self.__max_idle_seconds = max_idle_seconds
+        self.__slots = threading.BoundedSemaphore(max_size)
+        self.__lock = threading.Lock()
+        # Idle consumers and when they were returned, oldest first.
+        self.__idle: list[tuple[Consumer, float]] = []
+        self.__in_use = 0
+        self.__created = 0
+        self.__evicted = 0
+        self.__closed = False
+
+    @contextmanager
+    def acquire(self) -> Iterator[Consumer]:
+        """
+        Borrow a consumer, blocking while `max_size` consumers are already in use.
+        """
+        self.__slots.acquire()
+        try:
+            consumer = self.__take_idle()
+            try:
+                yield consumer
+            except BaseException:
+                self.__evict(consumer)
+                raise
+            self.__release(consumer)
+        finally:
+            self.__slots.release()
+
+    def evict_idle(self) -> None:
+        """Close every idle consumer that has not been used within `max_idle_seconds`."""
+        cutoff = time.monotonic() - self.__max_idle_seconds
+        with self.__lock:
+            stale = [consumer for consumer, returned in self.__idle if returned < cutoff]
+            self.__idle = [(c, returned) for c, returned in self.__idle if returned >= cutoff]
+        for consumer in stale:
+            self.__close(consumer)
+
+    def stats(self) -> ConsumerPoolStats:
+        with self.__lock:
+            return ConsumerPoolStats(
+                idle=len(self.__idle),
+                in_use=self.__in_use,
+                created=self.__created,
+                evicted=self.__evicted,
+            )
+
+    def close(self) -> None:
+        """Close every idle consumer; consumers still in use are closed when returned."""
+        with self.__lock:
+            self.__closed = True
+            idle = [consumer for consumer, _ in self.__idle]
+            self.__idle = []
+        for consumer in idle:
+            self.__close(consumer)
+
+    def __take_idle(self) -> Consumer:
+        self.evict_idle()
+        with self.__lock:
+            self.__in_use += 1
+            if self.__idle:
+                # Reuse the most recently returned consumer so the rest can age out.
+                consumer, _ = self.__idle.pop()
+                return consumer
+            self.__created += 1
+        try:
+            return Consumer(dict(self.__consumer_config))
+        except BaseException:
+            with self.__lock:
+                self.__in_use -= 1
+            raise
+
+    def __release(self, consumer: Consumer) -> None:
+        try:
+            consumer.unassign()
+        except Exception as e:
+            logger.warning(f"Evicting consumer that failed to unassign: {e}")
+            self.__evict(consumer)
+            return
+        with self.__lock:
+            self.__in_use -= 1
+            if not self.__closed:
+                self.__idle.append((consumer, time.monotonic()))
+                return
+        self.__close(consumer)
+
+    def __evict(self, consumer: Consumer) -> None:
+        with self.__lock:
+            self.__in_use -= 1
+        self.__close(consumer)
+
+    def __close(self, consumer: Consumer) -> None:
+        with self.__lock:
+            self.__evicted += 1
+        try:
+            consumer.close()
+        except Exception as e:
+            logger.warning(f"Failed to close consumer: {e}")
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import fnmatch
+import re
+from dataclasses import dataclass, field
+from typing import Sequence
+
+
+def _compile(patterns: Sequence[str]) -> re.Pattern[str] | None:
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(pattern)})" for pattern in patterns))
+
+
+class NameFilter:
+    """
+    Matches names against include and exclude glob patterns, such as `replay-*`.
+
+    A name passes if it matches any include pattern, or there are none, and matches no
+    exclude pattern. Each side is compiled once into a single regular expression, so a
+    name is checked in one match however many patterns there are.
+    """
+
+    def __init__(self, include: Sequence[str] = (), exclude: Sequence[str] = ()) -> None:
+        self.include = tuple(include)
+        self.exclude = tuple(exclude)
+        self.__include = _compile(self.include)
+        self.__exclude = _compile(self.exclude)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, NameFilter):
+            return NotImplemented
+        return (self.include, self.exclude) == (other.include, other.exclude)
+
+    def __repr__(self) -> str:
+        return f"NameFilter(include={list(self.include)}, exclude={list(self.exclude)})"
+
+    def matches(self, name: str) -> bool:
+        if self.__include is not None and self.__include.match(name) is None:
+            return False
+        return self.__exclude is None or self.__exclude.match(name) is None
+
+
+@dataclass(frozen=True)
+class ScanFilter:
+    """
+    Which consumer groups and topics a latency scan covers.
+    """
+
+    groups: NameFilter = field(default_factory=NameFilter)
+    topics: NameFilter = field(default_factory=NameFilter)
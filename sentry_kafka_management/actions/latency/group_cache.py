@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable
+
+DEFAULT_GROUP_REFRESH_INTERVAL = 60.0
+
+
+class ConsumerGroupCache:
+    """
+    The consumer group IDs of every cluster, listed again at most every
+    `refresh_interval` seconds.
+
+    Groups come and go far less often than their offsets move, so scans in between
+    refreshes skip the cluster-wide ListConsumerGroups round trip and start fetching
+    offsets straight away. A listing that fails is not cached, so the next scan of that
+    cluster lists its groups again.
+    """
+
+    def __init__(self, refresh_interval: float = DEFAULT_GROUP_REFRESH_INTERVAL) -> None:
+        self.__refresh_interval = refresh_interval
+        self.__lock = threading.Lock()
+        self.__group_ids: dict[str, tuple[list[str], float]] = {}
+
+    def get(self, cluster_name: str, list_group_ids: Callable[[], list[str]]) -> list[str]:
+        """
+        The cluster's cached group IDs, or those returned by `list_group_ids` if they
+        were last listed more than `refresh_interval` seconds ago.
+        """
+        now = time.monotonic()
+        with self.__lock:
+            cached = self.__group_ids.get(cluster_name)
+        if cached is not None and now - cached[1] < self.__refresh_interval:
+            return cached[0]
+
+        group_ids = list_group_ids()
+        with self.__lock:
+            self.__group_ids[cluster_name] = (group_ids, now)
+        return group_ids
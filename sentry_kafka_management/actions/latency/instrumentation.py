@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from enum import StrEnum
+from typing import Iterator
+
+from sentry_kafka_management.actions.latency.metrics import Metric, MetricsBackend
+
+
+class ScanPhase(StrEnum):
+    """
+    The stages of a cluster scan that are timed separately, so a slow scan can be pinned
+    on the group coordinators, the partition leaders or the scan workers.
+    """
+
+    LIST_GROUPS = "list_groups"
+    FETCH_OFFSETS = "fetch_offsets"
+    LIST_OFFSETS = "list_offsets"
+    READ_PARTITIONS = "read_partitions"
+
+
+class ScanStats:
+    """
+    What one cluster scan did and where it spent its time.
+
+    Partition scans update it from every worker at once, so every update takes a lock.
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.duration = 0.0
+        self.groups = 0
+        self.partitions = 0
+        self.admin_requests = 0
+        self.consumers_created = 0
+        self.consumers_closed = 0
+        self.polls = 0
+        self.timeouts = 0
+        self.retryable_errors = 0
+        self.max_batch_wait = 0.0
+        self.concurrency_limit: int | None = None
+        self.phase_durations: dict[ScanPhase, float] = {}
+
+    def add(
+        self,
+        admin_requests: int = 0,
+        polls: int = 0,
+        timeouts: int = 0,
+        retryable_errors: int = 0,
+    ) -> None:
+        with self.__lock:
+            self.admin_requests += admin_requests
+            self.polls += polls
+            self.timeouts += timeouts
+            self.retryable_errors += retryable_errors
+
+    def record_batch_wait(self, seconds: float) -> None:
+        """
+        Record how long a batch of partitions waited for a scan worker.
+        """
+        with self.__lock:
+            self.max_batch_wait = max(self.max_batch_wait, seconds)
+
+    @contextmanager
+    def phase(self, phase: ScanPhase) -> Iterator[None]:
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - start
+            with self.__lock:
+                self.phase_durations[phase] = self.phase_durations.get(phase, 0.0) + elapsed
+
+
+def emit_scan_stats(metrics: MetricsBackend, cluster_name: str, stats: ScanStats) -> None:
+    """
+    Emit the collector's own metrics for one finished cluster scan.
+
+    Each scan yields a single value per metric and cluster, so everything is a gauge and
+    durations are in milliseconds.
+    """
+    tags = {"cluster": cluster_name}
+    metrics.gauge(Metric.SCAN_DURATION.value, stats.duration * 1000, tags=tags)
+    for phase, duration in stats.phase_durations.items():
+        metrics.gauge(
+            Metric.SCAN_PHASE_DURATION.value, duration * 1000, tags={**tags, "phase": phase}
+        )
+    metrics.gauge(Metric.SCAN_BATCH_WAIT.value, stats.max_batch_wait * 1000, tags=tags)
+    for metric, value in (
+        (Metric.SCAN_GROUPS, stats.groups),
+        (Metric.SCAN_PARTITIONS, stats.partitions),
+        (Metric.SCAN_ADMIN_REQUESTS, stats.admin_requests),
+        (Metric.SCAN_CONSUMERS_CREATED, stats.consumers_created),
+        (Metric.SCAN_CONSUMERS_CLOSED, stats.consumers_closed),
+        (Metric.SCAN_POLLS, stats.polls),
+        (Metric.SCAN_TIMEOUTS, stats.timeouts),
+        (Metric.SCAN_RETRYABLE_ERRORS, stats.retryable_errors),
+    ):
+        metrics.gauge(metric.value, value, tags=tags)
+
+    if stats.concurrency_limit is not None:
+        metrics.gauge(Metric.SCAN_CONCURRENCY_LIMIT.value, stats.concurrency_limit, tags=tags)
+
+    queue_depth = metrics.sender_queue_depth()
+    if queue_depth is not None:
+        metrics.gauge(Metric.SENDER_QUEUE_DEPTH.value, queue_depth)
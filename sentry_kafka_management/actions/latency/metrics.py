@@ -1,19 +1,42 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Protocol
+from typing import Protocol, Sequence
 
 from datadog.dogstatsd.base import DogStatsd
 
 Tags = dict[str, str]
 
 METRICS_PREFIX = "kafka.topic"
+# Metrics about the collector itself rather than the consumers it measures.
+COLLECTOR_METRICS_PREFIX = "collector."
 SENDER_QUEUE_SIZE = 100000
 SENDER_QUEUE_TIMEOUT = 0
+# Formatted tag lists kept for (cluster, consumer group, topic, partition) series; the
+# cache is dropped and rebuilt when it outgrows this.
+TAG_CACHE_SIZE = 500_000
 
 
 class Metric(Enum):
     CONSUMER_LATENCY = "latency"
+    CONSUMER_LATENCY_TOPIC_MAX = "latency.topic.max"
+    CONSUMER_LATENCY_TOPIC_P50 = "latency.topic.p50"
+    CONSUMER_LATENCY_TOPIC_P99 = "latency.topic.p99"
+    CONSUMER_LATENCY_GROUP_MAX = "latency.group.max"
+    CONSUMER_OFFSET_LAG = "offset_lag"
+    SCAN_DURATION = "collector.scan.duration"
+    SCAN_PHASE_DURATION = "collector.scan.phase_duration"
+    SCAN_BATCH_WAIT = "collector.scan.batch_wait"
+    SCAN_GROUPS = "collector.scan.groups"
+    SCAN_PARTITIONS = "collector.scan.partitions"
+    SCAN_ADMIN_REQUESTS = "collector.scan.admin_requests"
+    SCAN_CONSUMERS_CREATED = "collector.scan.consumers_created"
+    SCAN_CONSUMERS_CLOSED = "collector.scan.consumers_closed"
+    SCAN_POLLS = "collector.scan.polls"
+    SCAN_TIMEOUTS = "collector.scan.timeouts"
+    SCAN_RETRYABLE_ERRORS = "collector.scan.retryable_errors"
+    SCAN_CONCURRENCY_LIMIT = "collector.scan.concurrency_limit"
+    SENDER_QUEUE_DEPTH = "collector.sender.queue_depth"
 
 
 class TopicConsumerLatency(Protocol):
@@ -22,12 +45,42 @@ class TopicConsumerLatency(Protocol):
     group_id: str
     latency_ms: float
     partition: int
+    offset_lag: int | None
+    high_watermark: int | None
+
+
+class ConsumerLatencyResult(Protocol):
+    @property
+    def scans(self) -> Sequence[TopicConsumerLatency]: ...
 
 
 class MetricsBackend(Protocol):
     def histogram(self, name: str, value: int | float, tags: Tags | None = None) -> None:
         raise NotImplementedError
 
+    def gauge(self, name: str, value: int | float, tags: Tags | None = None) -> None:
+        raise NotImplementedError
+
+    def consumer_latency_histograms(self, result: ConsumerLatencyResult) -> None:
+        """
+        Emit one consumer latency histogram, and offset lag gauge where the lag is known,
+        for every scan in `result`.
+        """
+        for scan in result.scans:
+            emit_topic_consumer_latency(self, scan)
+
+    def sender_queue_depth(self) -> int | None:
+        """
+        How many packets are waiting to be sent, or None if the backend does not queue.
+        """
+        return None
+
+    def close(self) -> None:
+        """
+        Release anything the backend holds, exporting what is still buffered.
+        """
+        return None
+
 
 def _combine_tags(base_tags: Tags, tags: Tags | None = None) -> Tags:
     if tags is None:
@@ -42,12 +95,16 @@ class DatadogMetricsBackend(MetricsBackend):
             port=port,
             namespace=METRICS_PREFIX.strip("."),
             constant_tags=[],
+            # Pack points into full datagrams so the background sender queues one packet
+            # per datagram rather than one per point.
+            disable_buffering=False,
         )
         self.datadog_client.enable_background_sender(  # type: ignore[no-untyped-call]
             sender_queue_size=SENDER_QUEUE_SIZE,
             sender_queue_timeout=SENDER_QUEUE_TIMEOUT,
         )
         self.__tags = tags or {}
+        self.__consumer_latency_tags: dict[tuple[str, str, str, int], list[str]] = {}
 
     def __datadog_tags_kw(self, tags: Tags | None) -> list[str] | None:
         combined = _combine_tags(self.__tags, tags)
@@ -56,6 +113,36 @@ class DatadogMetricsBackend(MetricsBackend):
     def histogram(self, name: str, value: int | float, tags: Tags | None = None) -> None:
         self.datadog_client.histogram(name, value, tags=self.__datadog_tags_kw(tags))
 
+    def gauge(self, name: str, value: int | float, tags: Tags | None = None) -> None:
+        self.datadog_client.gauge(name, value, tags=self.__datadog_tags_kw(tags))
+
+    def consumer_latency_histograms(self, result: ConsumerLatencyResult) -> None:
+        """
+        Emit every scan in `result` with tag strings formatted once per series, then
+        flush so the batch is not held back until the next buffer flush.
+        """
+        name = Metric.CONSUMER_LATENCY.value
+        cache = self.__consumer_latency_tags
+        for scan in result.scans:
+            key = (scan.cluster_name, scan.group_id, scan.topic_name, scan.partition)
+            tags = cache.get(key)
+            if tags is None:
+                if len(cache) >= TAG_CACHE_SIZE:
+                    cache.clear()
+                tags = self.__datadog_tags_kw(create_topic_consumer_latency_tags(scan)) or []
+                cache[key] = tags
+            self.datadog_client.histogram(name, scan.latency_ms, tags=tags)
+            if scan.offset_lag is not None:
+                self.datadog_client.gauge(
+                    Metric.CONSUMER_OFFSET_LAG.value, scan.offset_lag, tags=tags
+                )
+        self.datadog_client.flush()  # type: ignore[no-untyped-call]
+
+    def sender_queue_depth(self) -> int | None:
+        # DogStatsd does not expose its background sender queue publicly.
+        sender_queue = getattr(self.datadog_client, "_queue", None)
+        return sender_queue.qsize() if sender_queue is not None else None
+
 
 def create_topic_consumer_latency_tags(scan: TopicConsumerLatency) -> Tags:
     return {
@@ -67,8 +154,7 @@ def create_topic_consumer_latency_tags(scan: TopicConsumerLatency) -> Tags:
 
 
 def emit_topic_consumer_latency(metrics: MetricsBackend, scan: TopicConsumerLatency) -> None:
-    metrics.histogram(
-        Metric.CONSUMER_LATENCY.value,
-        scan.latency_ms,
-        tags=create_topic_consumer_latency_tags(scan),
-    )
+    tags = create_topic_consumer_latency_tags(scan)
+    metrics.histogram(Metric.CONSUMER_LATENCY.value, scan.latency_ms, tags=tags)
+    if scan.offset_lag is not None:
+        metrics.gauge(Metric.CONSUMER_OFFSET_LAG.value, scan.offset_lag, tags=tags)
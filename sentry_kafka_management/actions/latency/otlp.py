@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+import urllib.request
+from pathlib import Path
+from typing import Any
+
+from sentry_kafka_management.actions.latency.metrics import (
+    METRICS_PREFIX,
+    Metric,
+    MetricsBackend,
+    Tags,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH_SIZE = 10_000
+DEFAULT_EXPORT_INTERVAL = 10.0
+DEFAULT_EXPORT_TIMEOUT = 10.0
+SCOPE_NAME = "sentry_kafka_management"
+SERVICE_NAME = "sentry-kafka-management"
+
+# UCUM units of the metrics that have one; any other metric is exported without a unit.
+METRIC_UNITS = {
+    Metric.CONSUMER_LATENCY.value: "ms",
+    Metric.CONSUMER_LATENCY_TOPIC_MAX.value: "ms",
+    Metric.CONSUMER_LATENCY_TOPIC_P50.value: "ms",
+    Metric.CONSUMER_LATENCY_TOPIC_P99.value: "ms",
+    Metric.CONSUMER_LATENCY_GROUP_MAX.value: "ms",
+    Metric.CONSUMER_OFFSET_LAG.value: "{message}",
+    Metric.SCAN_DURATION.value: "ms",
+    Metric.SCAN_PHASE_DURATION.value: "ms",
+    Metric.SCAN_BATCH_WAIT.value: "ms",
+}
+
+# (name, value, tags, time in unix nanoseconds)
+Point = tuple[str, float, Tags | None, int]
+
+
+def _attributes(tags: Tags | None) -> list[dict[str, Any]]:
+    if not tags:
+        return []
+    return [{"key": key, "value": {"stringValue": value}} for key, value in tags.items()]
+
+
+def _metric(name: str, points: list[dict[str, Any]]) -> dict[str, Any]:
+    metric: dict[str, Any] = {"name": f"{METRICS_PREFIX}.{name}"}
+    if name in METRIC_UNITS:
+        metric["unit"] = METRIC_UNITS[name]
+    metric["gauge"] = {"dataPoints": points}
+    return metric
+
+
+def encode_metrics_request(points: list[Point]) -> bytes:
+    """
+    Encodes points as an OTLP/JSON `ExportMetricsServiceRequest`, one gauge per metric
+    name holding a data point per recorded value, with the metric's unit when it has one.
+    """
+    data_points: dict[str, list[dict[str, Any]]] = {}
+    for name, value, tags, time_unix_nano in points:
+        data_points.setdefault(name, []).append(
+            {
+                "attributes": _attributes(tags),
+                "timeUnixNano": str(time_unix_nano),
+                "asDouble": value,
+            }
+        )
+
+    request = {
+        "resourceMetrics": [
+            {
+                "resource": {
+                    "attributes": [{"key": "service.name", "value": {"stringValue": SERVICE_NAME}}]
+                },
+                "scopeMetrics": [
+                    {
+                        "scope": {"name": SCOPE_NAME},
+                        "metrics": [
+                            _metric(name, points_of_name)
+                            for name, points_of_name in data_points.items()
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+    return json.dumps(request, separators=(",", ":")).encode("utf-8")
+
+
+class OtlpMetricsBackend(MetricsBackend):
+    """
+    Batches points and exports them as OTLP/JSON, either over HTTP to a collector's
+    `/v1/metrics` endpoint or as JSON lines appended to a file.
+
+    A batch is exported once it reaches `max_batch_size` points, every `export_interval`
+    seconds from a background thread, and on `close`.
+    Failed exports are logged and dropped; the next interval reports fresh values.
+    """
+
+    def __init__(
+        self,
+        endpoint: str | None = None,
+        path: Path | None = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        export_interval: float = DEFAULT_EXPORT_INTERVAL,
+        timeout: float = DEFAULT_EXPORT_TIMEOUT,
+    ) -> None:
+        if (endpoint is None) == (path is None):
+            raise ValueError("Exactly one of an OTLP endpoint or file path is required")
+        self.__endpoint = endpoint
+        self.__path = path
+        self.__max_batch_size = max_batch_size
+        self.__timeout = timeout
+        self.__lock = threading.Lock()
+        self.__export_lock = threading.Lock()
+        self.__points: list[Point] = []
+        self.__stop = threading.Event()
+        self.__thread = threading.Thread(
+            target=self.__export_periodically,
+            args=(export_interval,),
+            name="otlp-metrics",
+            daemon=True,
+        )
+        self.__thread.start()
+
+    def histogram(self, name: str, value: int | float, tags: Tags | None = None) -> None:
+        self.__record(name, value, tags)
+
+    def gauge(self, name: str, value: int | float, tags: Tags | None = None) -> None:
+        self.__record(name, value, tags)
+
+    def __record(self, name: str, value: int | float, tags: Tags | None) -> None:
+        with self.__lock:
+            self.__points.append((name, float(value), tags, time.time_ns()))
+            full = len(self.__points) >= self.__max_batch_size
+        if full:
+            self.flush()
+
+    def sender_queue_depth(self) -> int | None:
+        with self.__lock:
+            return len(self.__points)
+
+    def flush(self) -> None:
+        """
+        Export every buffered point now.
+        """
+        with self.__lock:
+            points, self.__points = self.__points, []
+        if points:
+            self.__export(encode_metrics_request(points))
+
+    def __export(self, payload: bytes) -> None:
+        try:
+            with self.__export_lock:
+                if self.__path is not None:
+                    with self.__path.open("ab") as f:
+                        f.write(payload + b"\n")
+                else:
+                    assert self.__endpoint is not None
+                    request = urllib.request.Request(
+                        self.__endpoint,
+                        data=payload,
+                        headers={"Content-Type": "application/json"},
+                        method="POST",
+                    )
+                    with urllib.request.urlopen(request, timeout=self.__timeout) as response:
+                        response.read()
+        except Exception as e:
+            logger.warning(f"Failed to export OTLP metrics: {e}")
+
+    def __export_periodically(self, interval: float) -> None:
+        while not self.__stop.wait(interval):
+            self.flush()
+
+    def close(self) -> None:
+        self.__stop.set()
+        self.__thread.join()
+        self.flush()
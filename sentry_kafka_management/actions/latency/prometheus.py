@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from sentry_kafka_management.actions.latency.metrics import (
+    METRICS_PREFIX,
+    MetricsBackend,
+    Tags,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROMETHEUS_HOST = "0.0.0.0"
+DEFAULT_PROMETHEUS_PORT = 9464
+DEFAULT_STALE_SECONDS = 300.0
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+SeriesKey = tuple[tuple[str, str], ...]
+
+
+def _metric_name(name: str) -> str:
+    return f"{METRICS_PREFIX}.{name}".replace(".", "_")
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: SeriesKey) -> str:
+    if not labels:
+        return ""
+    formatted = ",".join(f'{key}="{_escape_label_value(value)}"' for key, value in labels)
+    return f"{{{formatted}}}"
+
+
+class PrometheusMetricsBackend(MetricsBackend):
+    """
+    Keeps the latest value of every series and serves them on a Prometheus `/metrics`
+    endpoint.
+
+    Prometheus scrapes whatever was last recorded, so histogram points are exposed as
+    gauges of their latest value. Series that have not been updated for `stale_seconds`
+    are dropped on the next scrape, so groups and partitions that disappear do not keep
+    being reported.
+    """
+
+    def __init__(
+        self,
+        host: str = DEFAULT_PROMETHEUS_HOST,
+        port: int = DEFAULT_PROMETHEUS_PORT,
+        stale_seconds: float = DEFAULT_STALE_SECONDS,
+    ) -> None:
+        self.__address = (host, port)
+        self.__stale_seconds = stale_seconds
+        self.__lock = threading.Lock()
+        self.__series: dict[str, dict[SeriesKey, tuple[float, float]]] = {}
+        self.__server: ThreadingHTTPServer | None = None
+
+    def histogram(self, name: str, value: int | float, tags: Tags | None = None) -> None:
+        self.__record(name, value, tags)
+
+    def gauge(self, name: str, value: int | float, tags: Tags | None = None) -> None:
+        self.__record(name, value, tags)
+
+    def __record(self, name: str, value: int | float, tags: Tags | None) -> None:
+        key = tuple(tags.items()) if tags else ()
+        updated_at = time.monotonic()
+        with self.__lock:
+            series = self.__series.get(name)
+            if series is None:
+                series = self.__series[name] = {}
+            series[key] = (float(value), updated_at)
+
+    def render(self) -> str:
+        """
+        The exposition text of every live series, dropping stale ones.
+        """
+        stale_before = time.monotonic() - self.__stale_seconds
+        lines: list[str] = []
+        with self.__lock:
+            for name in list(self.__series):
+                series = self.__series[name]
+                metric_name = _metric_name(name)
+                samples: list[str] = []
+                for key, (value, updated_at) in list(series.items()):
+                    if updated_at < stale_before:
+                        del series[key]
+                        continue
+                    samples.append(f"{metric_name}{_format_labels(key)} {value!r}")
+                if not series:
+                    del self.__series[name]
+                    continue
+                lines.append(f"# TYPE {metric_name} gauge")
+                lines.extend(samples)
+        lines.append("")
+        return "\n".join(lines)
+
+    def start(self) -> None:
+        """
+        Serve `/metrics` from a background thread.
+        """
+        backend = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = backend.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                logger.debug(format % args)
+
+        self.__server = ThreadingHTTPServer(self.__address, Handler)
+        self.__server.daemon_threads = True
+        threading.Thread(
+            target=self.__server.serve_forever, name="prometheus-metrics", daemon=True
+        ).start()
+        logger.info(f"Serving Prometheus metrics on port {self.port}")
+
+    @property
+    def port(self) -> int:
+        """
+        The port `/metrics` is served on, which is picked by the OS when started on port 0.
+        """
+        if self.__server is None:
+            return self.__address[1]
+        return int(self.__server.server_address[1])
+
+    def close(self) -> None:
+        if self.__server is not None:
+            self.__server.shutdown()
+            self.__server.server_close()
+            self.__server = None
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import bisect
+from dataclasses import dataclass, field
+from typing import Mapping, Sequence
+
+from confluent_kafka import TopicPartition  # type: ignore[import-untyped]
+
+from sentry_kafka_management.actions.latency.filters import NameFilter
+from sentry_kafka_management.actions.latency.metrics import TopicConsumerLatency
+
+
+@dataclass(frozen=True)
+class SamplingPolicy:
+    """
+    How much of a cluster a single latency scan covers.
+
+    Fields:
+        critical_groups: Groups scanned on every scan, whatever the budget.
+        group_budget: Most other groups scanned per scan, each costing one OffsetFetch
+            request. They are scanned round-robin so each is covered every few scans.
+            Every group is scanned when unset.
+        max_partitions_per_group: Most partitions scanned per group. Wider groups are
+            scanned round-robin, always including the partition that had the highest
+            latency on the previous scan. Every partition is scanned when unset.
+    """
+
+    critical_groups: NameFilter = field(default_factory=NameFilter)
+    group_budget: int | None = None
+    max_partitions_per_group: int | None = None
+
+
+class ScanSampler:
+    """
+    Picks what each scan of one cluster covers under its `SamplingPolicy`, and
+    remembers where the last scan left off.
+
+    Meant to live as long as the cluster's scan loop, and only be used from its thread.
+    """
+
+    def __init__(self, policy: SamplingPolicy) -> None:
+        self.__policy = policy
+        self.__last_group: str | None = None
+        # The last partition scanned round-robin in every wide group.
+        self.__partition_cursors: dict[str, tuple[str, int]] = {}
+        # The highest latency partition of every group in the last scan that covered it,
+        # and in the current scan.
+        self.__hottest: dict[str, tuple[str, int]] = {}
+        self.__observed: dict[str, tuple[float, tuple[str, int]]] = {}
+
+    def select_groups(self, group_ids: Sequence[str]) -> list[str]:
+        """
+        Every critical group, plus the next `group_budget` other groups after the last
+        one scanned.
+        """
+        # Forget groups that no longer exist.
+        live = set(group_ids)
+        self.__hottest = {g: tp for g, tp in self.__hottest.items() if g in live}
+        self.__partition_cursors = {
+            g: cursor for g, cursor in self.__partition_cursors.items() if g in live
+        }
+
+        budget = self.__policy.group_budget
+        if budget is None:
+            return list(group_ids)
+
+        critical_groups = self.__policy.critical_groups
+        critical: list[str] = []
+        normal: list[str] = []
+        for group_id in group_ids:
+            if critical_groups.include and critical_groups.matches(group_id):
+                critical.append(group_id)
+            else:
+                normal.append(group_id)
+        if len(normal) <= budget:
+            return critical + normal
+
+        normal.sort()
+        start = 0 if self.__last_group is None else bisect.bisect_right(normal, self.__last_group)
+        sampled = [normal[(start + i) % len(normal)] for i in range(budget)]
+        self.__last_group = sampled[-1]
+        return critical + sampled
+
+    def select_partitions(
+        self, committed_by_group: Mapping[str, list[TopicPartition]]
+    ) -> dict[str, list[TopicPartition]]:
+        """
+        At most `max_partitions_per_group` of each group's committed partitions, starting
+        with the one that had the highest latency on the last scan of the group.
+        """
+        # Groups left out of the last scan keep the hottest partition of their last scan.
+        self.__hottest.update((group_id, tp) for group_id, (_, tp) in self.__observed.items())
+        self.__observed = {}
+
+        limit = self.__policy.max_partitions_per_group
+        if limit is None:
+            return dict(committed_by_group)
+
+        selected: dict[str, list[TopicPartition]] = {}
+        for group_id, committed in committed_by_group.items():
+            if len(committed) <= limit:
+                selected[group_id] = committed
+                continue
+
+            hottest = self.__hottest.get(group_id)
+            picked = [tp for tp in committed if (tp.topic, tp.partition) == hottest]
+            rest = sorted(
+                (tp for tp in committed if (tp.topic, tp.partition) != hottest),
+                key=lambda tp: (tp.topic, tp.partition),
+            )
+            keys = [(tp.topic, tp.partition) for tp in rest]
+            cursor = self.__partition_cursors.get(group_id)
+            start = 0 if cursor is None else bisect.bisect_right(keys, cursor)
+            window = [(start + i) % len(rest) for i in range(limit - len(picked))]
+            picked.extend(rest[i] for i in window)
+            if window:
+                self.__partition_cursors[group_id] = keys[window[-1]]
+            selected[group_id] = picked
+        return selected
+
+    def record(self, scans: Sequence[TopicConsumerLatency]) -> None:
+        """
+        Remember the highest latency partition of every group in the current scan.
+        """
+        if self.__policy.max_partitions_per_group is None:
+            return
+        for scan in scans:
+            observed = self.__observed.get(scan.group_id)
+            if observed is None or scan.latency_ms > observed[0]:
+                self.__observed[scan.group_id] = (
+                    scan.latency_ms,
+                    (scan.topic_name, scan.partition),
+                )
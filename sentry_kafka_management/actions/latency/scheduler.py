@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import functools
+import logging
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Collection, Sequence
+
+from confluent_kafka import ConsumerGroupState  # type: ignore[import-untyped]
+
+from sentry_kafka_management.actions.latency.aggregation import DEFAULT_ROLLUPS, Rollup
+from sentry_kafka_management.actions.latency.consumer_latency import (
+    DEFAULT_MAX_WORKERS,
+    ClusterLatencyScanner,
+    Concurrency,
+    ConsumerLatencyResult,
+    ScanEngine,
+    TopicConsumerLatency,
+)
+from sentry_kafka_management.actions.latency.filters import NameFilter, ScanFilter
+from sentry_kafka_management.actions.latency.group_cache import ConsumerGroupCache
+from sentry_kafka_management.actions.latency.metrics import MetricsBackend
+from sentry_kafka_management.actions.latency.sampling import SamplingPolicy
+from sentry_kafka_management.actions.latency.timestamp_cache import OffsetTimestampCache
+from sentry_kafka_management.brokers import ClusterConfig, KafkaConfig
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = 10.0
+DEFAULT_TIMEOUT = 10
+DEFAULT_MAX_BACKOFF = 300.0
+# Cluster `latency` config fields holding lists of glob patterns.
+PATTERN_FIELDS = (
+    "include_groups",
+    "exclude_groups",
+    "include_topics",
+    "exclude_topics",
+    "critical_groups",
+)
+
+ResultCallback = Callable[[str, ConsumerLatencyResult], None]
+ScansCallback = Callable[[str, list[TopicConsumerLatency]], None]
+
+
+@dataclass
+class ClusterSchedule:
+    interval: float
+    timeout: int
+    max_workers: int
+    max_backoff: float
+    scan_filter: ScanFilter = field(default_factory=ScanFilter)
+    sampling: SamplingPolicy = field(default_factory=SamplingPolicy)
+
+    def next_delay(self, consecutive_failures: int) -> float:
+        """
+        Seconds to wait before the next scan, doubling the interval for every
+        consecutive failed scan up to `max_backoff`.
+        """
+        if consecutive_failures <= 0:
+            return self.interval
+        backoff = self.interval * 2.0 ** min(consecutive_failures, 32)
+        return min(backoff, max(self.max_backoff, self.interval))
+
+
+def resolve_cluster_schedule(
+    cluster_config: ClusterConfig,
+    interval: float = DEFAULT_INTERVAL,
+    timeout: int = DEFAULT_TIMEOUT,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    max_backoff: float = DEFAULT_MAX_BACKOFF,
+    include_groups: Sequence[str] = (),
+    exclude_groups: Sequence[str] = (),
+    include_topics: Sequence[str] = (),
+    exclude_topics: Sequence[str] = (),
+    critical_groups: Sequence[str] = (),
+    group_budget: int | None = None,
+    max_partitions_per_group: int | None = None,
+) -> ClusterSchedule:
+    """
+    Builds a cluster's schedule from its `latency` config, falling back to the given
+    defaults for anything the cluster does not override.
+
+    A cluster's group and topic patterns replace the defaults rather than adding to them,
+    and are compiled once here rather than on every scan.
+
+    Raises ValueError if the cluster sets a pattern field to anything but a list of
+    strings, or a sampling limit below 1.
+    """
+    latency = cluster_config.get("latency", {})
+    for patterns in PATTERN_FIELDS:
+        value = latency.get(patterns)
+        if value is not None and (
+            not isinstance(value, list) or not all(isinstance(p, str) for p in value)
+        ):
+            raise ValueError(f"latency.{patterns} must be a list of glob patterns, got {value!r}")
+    for limit in ("group_budget", "max_partitions_per_group"):
+        if latency.get(limit) is not None and latency[limit] < 1:
+            raise ValueError(f"latency.{limit} must be at least 1, got {latency[limit]}")
+    return ClusterSchedule(
+        interval=float(latency.get("interval", interval)),
+        timeout=int(latency.get("timeout", timeout)),
+        max_workers=int(latency.get("max_workers", max_workers)),
+        max_backoff=float(latency.get("max_backoff", max_backoff)),
+        scan_filter=ScanFilter(
+            groups=NameFilter(
+                latency.get("include_groups", include_groups),
+                latency.get("exclude_groups", exclude_groups),
+            ),
+            topics=NameFilter(
+                latency.get("include_topics", include_topics),
+                latency.get("exclude_topics", exclude_topics),
+            ),
+        ),
+        sampling=SamplingPolicy(
+            critical_groups=NameFilter(latency.get("critical_groups", critical_groups)),
+            group_budget=latency.get("group_budget", group_budget),
+            max_partitions_per_group=latency.get(
+                "max_partitions_per_group", max_partitions_per_group
+            ),
+        ),
+    )
+
+
+def run_cluster_latency_loop(
+    config: KafkaConfig,
+    cluster_name: str,
+    schedule: ClusterSchedule,
+    metrics: MetricsBackend,
+    stop_event: threading.Event,
+    on_result: ResultCallback | None = None,
+    timestamp_cache: OffsetTimestampCache | None = None,
+    scan_engine: ScanEngine = ScanEngine.CONSUME,
+    executor: Executor | None = None,
+    concurrency: Concurrency = Concurrency.THREADS,
+    rollups: Collection[Rollup] = DEFAULT_ROLLUPS,
+    on_scans: ScansCallback | None = None,
+    group_cache: ConsumerGroupCache | None = None,
+    skip_group_states: Collection[ConsumerGroupState] = (),
+    adaptive_latency_target: float | None = None,
+) -> None:
+    """
+    Scan one cluster on its own timer until `stop_event` is set.
+
+    Scans are emitted, and handed to `on_scans`, batch by batch while the cluster is
+    being read; `on_result` is called once each scan finishes with its errors. The
+    collector's own metrics for the scan are emitted alongside its rollups.
+
+    Failures never end the loop: a scan that fails as a whole only pushes this cluster's
+    next scan back, following the schedule's backoff. Errors on some of the partitions or
+    groups of an otherwise working scan are reported without slowing the schedule.
+    """
+    scanner = ClusterLatencyScanner(
+        config,
+        cluster_name,
+        metrics,
+        schedule.timeout,
+        schedule.max_workers,
+        timestamp_cache=timestamp_cache,
+        scan_engine=scan_engine,
+        executor=executor,
+        concurrency=concurrency,
+        rollups=rollups,
+        on_scans=(functools.partial(on_scans, cluster_name) if on_scans is not None else None),
+        group_cache=group_cache,
+        skip_group_states=skip_group_states,
+        scan_filter=schedule.scan_filter,
+        sampling=schedule.sampling,
+        adaptive_latency_target=adaptive_latency_target,
+    )
+
+    consecutive_failures = 0
+    try:
+        while not stop_event.is_set():
+            result, failed = scanner.scan(stop_event)
+            consecutive_failures = consecutive_failures + 1 if failed else 0
+            if on_result is not None:
+                try:
+                    on_result(cluster_name, result)
+                except Exception:
+                    logger.exception(f"Result callback failed for cluster {cluster_name}")
+
+            stop_event.wait(schedule.next_delay(consecutive_failures))
+    finally:
+        scanner.close()
+
+
+def run_consumer_latency_scheduler(
+    config: KafkaConfig,
+    metrics: MetricsBackend,
+    stop_event: threading.Event,
+    schedules: dict[str, ClusterSchedule],
+    on_result: ResultCallback | None = None,
+    timestamp_cache: OffsetTimestampCache | None = None,
+    scan_engine: ScanEngine = ScanEngine.CONSUME,
+    total_workers: int | None = None,
+    concurrency: Concurrency = Concurrency.THREADS,
+    rollups: Collection[Rollup] = DEFAULT_ROLLUPS,
+    on_scans: ScansCallback | None = None,
+    group_cache: ConsumerGroupCache | None = None,
+    skip_group_states: Collection[ConsumerGroupState] = (),
+    adaptive_latency_target: float | None = None,
+) -> None:
+    """
+    Run every scheduled cluster on its own thread and timer until `stop_event` is set.
+
+    A failing or slow cluster only delays its own scans; every other cluster keeps
+    emitting on its own schedule.
+
+    Args:
+        config: Kafka configuration providing the clusters and their topics.
+        metrics: Backend that latency metrics are emitted to.
+        stop_event: Shutdown signal; every cluster loop exits once it is set.
+        schedules: Schedule for each cluster to scan, keyed by cluster name.
+        on_result: Optional callback invoked with the errors of every finished scan, from
+            the cluster's own thread.
+        timestamp_cache: Optional cache of message timestamps shared by every cluster.
+        scan_engine: How partition latency is measured.
+        total_workers: Optional number of partition scan workers shared by all clusters.
+            Not used with `Concurrency.ASYNCIO`, where each cluster runs its own event loop.
+        concurrency: How each cluster's partition scans run concurrently.
+        rollups: Levels latency is emitted at; see `Rollup`.
+        on_scans: Optional callback invoked with each batch of scans as it is read, from
+            the cluster's own thread.
+        group_cache: Optional cache of every cluster's consumer group IDs, so groups are
+            only listed again on the cache's refresh cadence.
+        skip_group_states: Group states whose groups are not scanned.
+        adaptive_latency_target: Optional seconds a batch read may take before its
+            cluster reads fewer batches at once; see `AimdLimiter`. When unset every
+            cluster always reads up to its `max_workers` batches at once.
+    """
+    executor = (
+        ThreadPoolExecutor(max_workers=total_workers, thread_name_prefix="latency-scan")
+        if total_workers is not None and concurrency == Concurrency.THREADS
+        else None
+    )
+    threads = [
+        threading.Thread(
+            target=run_cluster_latency_loop,
+            name=f"latency-{cluster_name}",
+            args=(config, cluster_name, schedule, metrics, stop_event),
+            kwargs={
+                "on_result": on_result,
+                "timestamp_cache": timestamp_cache,
+                "scan_engine": scan_engine,
+                "executor": executor,
+                "concurrency": concurrency,
+                "rollups": rollups,
+                "on_scans": on_scans,
+                "group_cache": group_cache,
+                "skip_group_states": skip_group_states,
+                "adaptive_latency_target": adaptive_latency_target,
+            },
+            daemon=True,
+        )
+        for cluster_name, schedule in schedules.items()
+    ]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
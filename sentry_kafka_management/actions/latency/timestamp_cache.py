@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+
+DEFAULT_TIMESTAMP_CACHE_SIZE = 500_000
+
+OffsetKey = tuple[str, str, int, int]
+
+
+class OffsetTimestampCache:
+    """
+    A size-bounded LRU cache of message timestamps keyed by
+    `(cluster, topic, partition, offset)`.
+
+    A message's timestamp never changes, so once an offset has been read the latency of a
+    group still committed there can be computed as `now - timestamp` without another fetch.
+    Only timestamps of real messages belong here: an offset at the end of a partition or
+    outside retention means something different on every scan.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_TIMESTAMP_CACHE_SIZE) -> None:
+        self.__max_size = max_size
+        self.__lock = threading.Lock()
+        self.__timestamps: OrderedDict[OffsetKey, int] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__timestamps)
+
+    def get(self, cluster: str, topic: str, partition: int, offset: int) -> int | None:
+        key = (cluster, topic, partition, offset)
+        with self.__lock:
+            timestamp_ms = self.__timestamps.get(key)
+            if timestamp_ms is not None:
+                self.__timestamps.move_to_end(key)
+            return timestamp_ms
+
+    def put(self, cluster: str, topic: str, partition: int, offset: int, timestamp_ms: int) -> None:
+        if self.__max_size <= 0:
+            return
+        key = (cluster, topic, partition, offset)
+        with self.__lock:
+            self.__timestamps[key] = timestamp_ms
+            self.__timestamps.move_to_end(key)
+            while len(self.__timestamps) > self.__max_size:
+                self.__timestamps.popitem(last=False)
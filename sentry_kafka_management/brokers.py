@@ -1,10 +1,42 @@
 from abc import ABC
 from pathlib import Path
-from typing import Any, Mapping, Sequence, TypedDict
+from typing import Any, Mapping, NotRequired, Sequence, TypedDict, cast
 
 import yaml
 
 
+class LatencyConfig(TypedDict, total=False):
+    """
+    Per-cluster overrides for the consumer latency collector. Any field left out
+    falls back to the collector's command line defaults.
+
+    Fields:
+        interval: How often in seconds to scan the cluster.
+        timeout: How long in seconds to wait before Kafka requests time out.
+        max_workers: Maximum concurrent partition scans on the cluster.
+        max_backoff: Longest delay in seconds between scans while the cluster keeps failing.
+        include_groups: Glob patterns of the consumer groups to scan; all when empty.
+        exclude_groups: Glob patterns of consumer groups never to scan.
+        include_topics: Glob patterns of the topics to scan; all when empty.
+        exclude_topics: Glob patterns of topics never to scan.
+        critical_groups: Glob patterns of consumer groups scanned on every scan.
+        group_budget: Most other consumer groups scanned per scan, round-robin.
+        max_partitions_per_group: Most partitions scanned per consumer group per scan.
+    """
+
+    interval: float
+    timeout: int
+    max_workers: int
+    max_backoff: float
+    include_groups: Sequence[str]
+    exclude_groups: Sequence[str]
+    include_topics: Sequence[str]
+    exclude_topics: Sequence[str]
+    critical_groups: Sequence[str]
+    group_budget: int
+    max_partitions_per_group: int
+
+
 class ClusterConfig(TypedDict):
     """
     Represents the configuration of a Kafka cluster.
@@ -21,6 +53,7 @@ class ClusterConfig(TypedDict):
                                plaintext password.
                                If False, `sasl_password` is interpreted as an environment var
                                containing the password. Defaults to False.
+        latency: Optional consumer latency collector settings for this cluster.
     """
 
     brokers: Sequence[str]
@@ -29,6 +62,7 @@ class ClusterConfig(TypedDict):
     sasl_username: str | None
     sasl_password: str | None
     password_is_plaintext: bool
+    latency: NotRequired[LatencyConfig]
 
 
 class TopicConfig(TypedDict):
@@ -86,6 +120,7 @@ class YamlKafkaConfig(KafkaConfig):
                 sasl_username=cluster.get("sasl_username"),
                 sasl_password=cluster.get("sasl_password"),
                 password_is_plaintext=cluster.get("password_is_plaintext", False),
+                latency=cast(LatencyConfig, cluster.get("latency") or {}),
             )
             for cluster in conf
         }
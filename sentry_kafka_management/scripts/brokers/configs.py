@@ -2,10 +2,13 @@
 
 import json
 from pathlib import Path
-from typing import Sequence
+from typing import Any, Mapping, Sequence
 
 import click
 
+from sentry_kafka_management.actions.brokers.configs import (
+    DescribeBrokerConfigsError,
+)
 from sentry_kafka_management.actions.brokers.configs import (
     apply_configs as apply_config_action,
 )
@@ -15,6 +18,7 @@ from sentry_kafka_management.actions.brokers.configs import (
 from sentry_kafka_management.actions.brokers.configs import (
     remove_dynamic_configs as remove_dynamic_configs_action,
 )
+from sentry_kafka_management.actions.conf import ALTER_CONFIGS_MAX_IN_FLIGHT
 from sentry_kafka_management.connectors.admin import get_admin_client
 from sentry_kafka_management.scripts.config_helpers import get_cluster_config
 
@@ -55,6 +59,10 @@ def parse_broker_ids(
         raise click.BadParameter(f"Invalid broker IDs: {e}")
 
 
+def echo_json_line(result: Mapping[str, Any]) -> None:
+    click.echo(json.dumps(result))
+
+
 @click.command()
 @click.option(
     "-c",
@@ -75,7 +83,11 @@ def describe_broker_configs(config: Path, cluster: str) -> None:
     """
     cluster_config = get_cluster_config(config, cluster)
     client = get_admin_client(cluster_config)
-    result = describe_broker_configs_action(client)
+    try:
+        result = describe_broker_configs_action(client)
+    except DescribeBrokerConfigsError as e:
+        click.echo(json.dumps(e.configs, indent=2))
+        raise click.ClickException(str(e))
     click.echo(json.dumps(result, indent=2))
 
 
@@ -124,6 +136,28 @@ def describe_broker_configs(config: Path, cluster: str) -> None:
     is_flag=True,
     help="Whether to dry run the config changes, only performs validation",
 )
+@click.option(
+    "--max-in-flight",
+    required=False,
+    default=ALTER_CONFIGS_MAX_IN_FLIGHT,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Most brokers to apply configs on at once",
+)
+@click.option(
+    "--max-requests-per-second",
+    required=False,
+    type=click.FloatRange(min=0, min_open=True),
+    help="Cap on config alter requests sent per second, to protect the brokers",
+)
+@click.option(
+    "--stream",
+    is_flag=True,
+    help=(
+        "Print each success or error as a JSON line as soon as it is known, "
+        "instead of printing them all at the end"
+    ),
+)
 def apply_configs(
     config: Path,
     cluster: str,
@@ -131,6 +165,9 @@ def apply_configs(
     broker_ids: list[str] | None = None,
     configs_record_dir: Path | None = None,
     dry_run: bool = False,
+    max_in_flight: int = ALTER_CONFIGS_MAX_IN_FLIGHT,
+    max_requests_per_second: float | None = None,
+    stream: bool = False,
 ) -> None:
     """
     Apply a configuration change to a broker.
@@ -138,6 +175,10 @@ def apply_configs(
     This command applies a dynamic configuration that takes precedence over
     static configs set by salt or other configuration management tools.
 
+    Configs are set on each broker, overriding any cluster-wide default. Cluster-wide
+    defaults can't be set through the client library this tool uses; use
+    `kafka-configs --entity-default` for those.
+
     Usage:
         kafka-scripts apply-config -c config.yml -n my-cluster
         --config-changes '{"message.max.bytes": "1048588", "max.connections": "1000"}'
@@ -152,14 +193,18 @@ def apply_configs(
         broker_ids,
         configs_record_dir,
         dry_run,
+        max_in_flight=max_in_flight,
+        max_requests_per_second=max_requests_per_second,
+        on_result=echo_json_line if stream else None,
     )
 
-    if success:
+    if success and not stream:
         click.echo("Success:")
         click.echo(json.dumps(success, indent=2))
     if error:
-        click.echo("Error:")
-        click.echo(json.dumps(error, indent=2))
+        if not stream:
+            click.echo("Error:")
+            click.echo(json.dumps(error, indent=2))
         raise click.ClickException("One or more config changes failed")
     if dry_run:
         click.echo("Dry run completed successfully")
@@ -201,12 +246,37 @@ def apply_configs(
     is_flag=True,
     help="Whether to dry run the config removals, only performs validation",
 )
+@click.option(
+    "--max-in-flight",
+    required=False,
+    default=ALTER_CONFIGS_MAX_IN_FLIGHT,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Most brokers to remove configs on at once",
+)
+@click.option(
+    "--max-requests-per-second",
+    required=False,
+    type=click.FloatRange(min=0, min_open=True),
+    help="Cap on config alter requests sent per second, to protect the brokers",
+)
+@click.option(
+    "--stream",
+    is_flag=True,
+    help=(
+        "Print each success or error as a JSON line as soon as it is known, "
+        "instead of printing them all at the end"
+    ),
+)
 def remove_dynamic_configs(
     config: Path,
     cluster: str,
     configs_to_remove: Sequence[str],
     broker_ids: list[str] | None = None,
     dry_run: bool = False,
+    max_in_flight: int = ALTER_CONFIGS_MAX_IN_FLIGHT,
+    max_requests_per_second: float | None = None,
+    stream: bool = False,
 ) -> None:
     """
     Removes dynamic configs from a broker.
@@ -229,14 +299,18 @@ def remove_dynamic_configs(
         configs_to_remove,
         broker_ids,
         dry_run,
+        max_in_flight=max_in_flight,
+        max_requests_per_second=max_requests_per_second,
+        on_result=echo_json_line if stream else None,
     )
 
-    if success:
+    if success and not stream:
         click.echo("Success:")
         click.echo(json.dumps(success, indent=2))
     if error:
-        click.echo("Error:")
-        click.echo(json.dumps(error, indent=2))
+        if not stream:
+            click.echo("Error:")
+            click.echo(json.dumps(error, indent=2))
         raise click.ClickException("One or more config removals failed")
     if dry_run:
         click.echo("Dry run completed successfully")
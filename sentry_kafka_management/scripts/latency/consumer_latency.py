@@ -8,16 +8,76 @@ from pathlib import Path
 
 import click
 import sentry_sdk
+from confluent_kafka import ConsumerGroupState  # type: ignore[import-untyped]
 
+from sentry_kafka_management.actions.latency.aggregation import Rollup
 from sentry_kafka_management.actions.latency.consumer_latency import (
     DEFAULT_MAX_WORKERS,
+    Concurrency,
+    ConsumerLatencyResult,
+    ScanEngine,
+    TopicConsumerLatency,
 )
-from sentry_kafka_management.actions.latency.consumer_latency import (
-    record_consumer_group_latency as record_consumer_group_latency_action,
+from sentry_kafka_management.actions.latency.group_cache import (
+    DEFAULT_GROUP_REFRESH_INTERVAL,
+    ConsumerGroupCache,
+)
+from sentry_kafka_management.actions.latency.metrics import (
+    DatadogMetricsBackend,
+    MetricsBackend,
+)
+from sentry_kafka_management.actions.latency.otlp import OtlpMetricsBackend
+from sentry_kafka_management.actions.latency.prometheus import (
+    DEFAULT_PROMETHEUS_HOST,
+    DEFAULT_PROMETHEUS_PORT,
+    DEFAULT_STALE_SECONDS,
+    PrometheusMetricsBackend,
+)
+from sentry_kafka_management.actions.latency.scheduler import (
+    DEFAULT_MAX_BACKOFF,
+    resolve_cluster_schedule,
+)
+from sentry_kafka_management.actions.latency.scheduler import (
+    run_consumer_latency_scheduler as run_consumer_latency_scheduler_action,
+)
+from sentry_kafka_management.actions.latency.timestamp_cache import (
+    DEFAULT_TIMESTAMP_CACHE_SIZE,
+    OffsetTimestampCache,
 )
-from sentry_kafka_management.actions.latency.metrics import DatadogMetricsBackend
 from sentry_kafka_management.brokers import YamlKafkaConfig
 
+METRICS_BACKENDS = ["datadog", "prometheus", "otlp"]
+
+
+def build_metrics_backend(
+    metrics_backend: str,
+    statsd_host: str | None,
+    statsd_port: int | None,
+    prometheus_host: str,
+    prometheus_port: int,
+    prometheus_stale_seconds: float,
+    otlp_endpoint: str | None,
+    otlp_file: Path | None,
+) -> MetricsBackend:
+    if metrics_backend == "prometheus":
+        backend = PrometheusMetricsBackend(
+            prometheus_host, prometheus_port, stale_seconds=prometheus_stale_seconds
+        )
+        backend.start()
+        return backend
+    if metrics_backend == "otlp":
+        if (otlp_endpoint is None) == (otlp_file is None):
+            raise click.UsageError(
+                "Exactly one of --otlp-endpoint or --otlp-file is required with "
+                "--metrics-backend otlp"
+            )
+        return OtlpMetricsBackend(endpoint=otlp_endpoint, path=otlp_file)
+    if statsd_host is None or statsd_port is None:
+        raise click.UsageError(
+            "--statsd-host and --statsd-port are required with --metrics-backend datadog"
+        )
+    return DatadogMetricsBackend(statsd_host, statsd_port)
+
 
 @click.command(name="consumer-latency")
 @click.option(
@@ -27,16 +87,61 @@ from sentry_kafka_management.brokers import YamlKafkaConfig
     required=True,
     help="Path to the YAML configuration file",
 )
+@click.option(
+    "--metrics-backend",
+    required=False,
+    default="datadog",
+    type=click.Choice(METRICS_BACKENDS),
+    help=(
+        "Where metrics are sent. 'datadog' emits to DogStatsD; 'prometheus' serves the "
+        "latest value of every series on /metrics; 'otlp' exports OTLP/JSON to a collector "
+        "or a file. Defaults to 'datadog'."
+    ),
+)
 @click.option(
     "--statsd-host",
-    required=True,
-    help="DogStatsD host to emit metrics to",
+    required=False,
+    help="DogStatsD host to emit metrics to. Required with the datadog backend.",
 )
 @click.option(
     "--statsd-port",
-    required=True,
+    required=False,
     type=int,
-    help="DogStatsD port to emit metrics to",
+    help="DogStatsD port to emit metrics to. Required with the datadog backend.",
+)
+@click.option(
+    "--prometheus-host",
+    required=False,
+    default=DEFAULT_PROMETHEUS_HOST,
+    help=f"Address to serve Prometheus metrics on. Defaults to {DEFAULT_PROMETHEUS_HOST}.",
+)
+@click.option(
+    "--prometheus-port",
+    required=False,
+    default=DEFAULT_PROMETHEUS_PORT,
+    type=click.IntRange(min=0),
+    help=f"Port to serve Prometheus metrics on. Defaults to {DEFAULT_PROMETHEUS_PORT}.",
+)
+@click.option(
+    "--prometheus-stale-seconds",
+    required=False,
+    default=DEFAULT_STALE_SECONDS,
+    type=click.FloatRange(min=0.0, min_open=True),
+    help=(
+        "Seconds after its last update a Prometheus series stops being served. "
+        f"Defaults to {DEFAULT_STALE_SECONDS:.0f}s."
+    ),
+)
+@click.option(
+    "--otlp-endpoint",
+    required=False,
+    help="OTLP/HTTP metrics endpoint to export to, e.g. http://localhost:4318/v1/metrics",
+)
+@click.option(
+    "--otlp-file",
+    required=False,
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="File to append OTLP/JSON metric exports to, one request per line",
 )
 @click.option(
     "-i",
@@ -44,7 +149,7 @@ from sentry_kafka_management.brokers import YamlKafkaConfig
     required=False,
     default=10.0,
     type=click.FloatRange(min=0.0, min_open=True),
-    help="How often in seconds to collect metrics. Defaults to 10s.",
+    help="How often in seconds to scan each cluster. Defaults to 10s.",
 )
 @click.option(
     "-t",
@@ -62,6 +167,177 @@ from sentry_kafka_management.brokers import YamlKafkaConfig
     type=click.IntRange(min=1),
     help="Maximum concurrent partition scans per cluster. Defaults to 128.",
 )
+@click.option(
+    "--total-workers",
+    required=False,
+    default=None,
+    type=click.IntRange(min=1),
+    help=(
+        "Maximum concurrent partition scans shared by all clusters. "
+        "Defaults to no shared limit, so each cluster uses up to --max-workers."
+    ),
+)
+@click.option(
+    "--max-backoff",
+    required=False,
+    default=DEFAULT_MAX_BACKOFF,
+    type=click.FloatRange(min=0.0, min_open=True),
+    help=(
+        "Longest delay in seconds between scans of a cluster that keeps failing. "
+        f"Defaults to {DEFAULT_MAX_BACKOFF:.0f}s."
+    ),
+)
+@click.option(
+    "--scan-engine",
+    required=False,
+    default=ScanEngine.CONSUME.value,
+    type=click.Choice([engine.value for engine in ScanEngine]),
+    help=(
+        "How partition latency is measured. 'consume' reads the message at every committed "
+        "offset; 'list-offsets' skips partitions already at their high watermark and only "
+        "reads lagging ones. Defaults to 'consume'."
+    ),
+)
+@click.option(
+    "--concurrency",
+    required=False,
+    default=Concurrency.THREADS.value,
+    type=click.Choice([mode.value for mode in Concurrency]),
+    help=(
+        "How partition scans run concurrently. 'threads' blocks one worker thread per scan; "
+        "'asyncio' drives every scan of a cluster from a single event loop, so --max-workers "
+        "bounds polling consumers rather than threads and --total-workers is ignored. "
+        "Defaults to 'threads'."
+    ),
+)
+@click.option(
+    "--adaptive-latency-target",
+    required=False,
+    default=None,
+    type=click.FloatRange(min=0.0, min_open=True),
+    help=(
+        "Adapt how many partition batches each cluster reads at once. A batch slower than "
+        "this many seconds, or one that times out, halves the cluster's limit; healthy "
+        "batches grow it back towards --max-workers. Defaults to a fixed --max-workers."
+    ),
+)
+@click.option(
+    "--rollup",
+    "rollups",
+    required=False,
+    multiple=True,
+    default=[Rollup.PARTITION.value],
+    type=click.Choice([rollup.value for rollup in Rollup]),
+    help=(
+        "Level to emit latency at. Repeatable. 'partition' emits a histogram point per "
+        "partition and group; 'topic' emits max/p50/p99 gauges per group and topic; 'group' "
+        "emits a max gauge per group. Defaults to 'partition'."
+    ),
+)
+@click.option(
+    "--timestamp-cache-size",
+    required=False,
+    default=DEFAULT_TIMESTAMP_CACHE_SIZE,
+    type=click.IntRange(min=0),
+    help=(
+        "Maximum number of message timestamps cached between iterations so unchanged "
+        "committed offsets are not re-read. 0 disables the cache. "
+        f"Defaults to {DEFAULT_TIMESTAMP_CACHE_SIZE}."
+    ),
+)
+@click.option(
+    "--group-refresh-interval",
+    required=False,
+    default=DEFAULT_GROUP_REFRESH_INTERVAL,
+    type=click.FloatRange(min=0.0),
+    help=(
+        "How often in seconds each cluster's consumer groups are listed again; scans in "
+        "between reuse the last listing. 0 lists them on every scan. "
+        f"Defaults to {DEFAULT_GROUP_REFRESH_INTERVAL:.0f}s."
+    ),
+)
+@click.option(
+    "--skip-group-state",
+    "skip_group_states",
+    required=False,
+    multiple=True,
+    type=click.Choice([state.name.lower() for state in ConsumerGroupState]),
+    help=(
+        "Group state whose groups are not scanned. Repeatable, e.g. "
+        "--skip-group-state empty --skip-group-state dead. Defaults to scanning every group."
+    ),
+)
+@click.option(
+    "--include-group",
+    "include_groups",
+    required=False,
+    multiple=True,
+    help=(
+        "Glob pattern of consumer groups to scan, e.g. 'snuba-*'. Repeatable. Defaults to "
+        "every group. A cluster's include_groups in the YAML config replaces these."
+    ),
+)
+@click.option(
+    "--exclude-group",
+    "exclude_groups",
+    required=False,
+    multiple=True,
+    help=(
+        "Glob pattern of consumer groups never to scan, e.g. 'replay-*'. Repeatable. A "
+        "cluster's exclude_groups in the YAML config replaces these."
+    ),
+)
+@click.option(
+    "--include-topic",
+    "include_topics",
+    required=False,
+    multiple=True,
+    help=(
+        "Glob pattern of topics to scan. Repeatable. Defaults to every configured topic. "
+        "A cluster's include_topics in the YAML config replaces these."
+    ),
+)
+@click.option(
+    "--exclude-topic",
+    "exclude_topics",
+    required=False,
+    multiple=True,
+    help=(
+        "Glob pattern of topics never to scan. Repeatable. A cluster's exclude_topics in "
+        "the YAML config replaces these."
+    ),
+)
+@click.option(
+    "--critical-group",
+    "critical_groups",
+    required=False,
+    multiple=True,
+    help=(
+        "Glob pattern of consumer groups scanned on every scan, whatever --group-budget "
+        "says. Repeatable. A cluster's critical_groups in the YAML config replaces these."
+    ),
+)
+@click.option(
+    "--group-budget",
+    required=False,
+    default=None,
+    type=click.IntRange(min=1),
+    help=(
+        "Most non-critical consumer groups scanned per scan, each costing one OffsetFetch "
+        "request. Groups are scanned round-robin across scans. Defaults to every group."
+    ),
+)
+@click.option(
+    "--max-partitions-per-group",
+    required=False,
+    default=None,
+    type=click.IntRange(min=1),
+    help=(
+        "Most partitions scanned per consumer group per scan. Wider groups are scanned "
+        "round-robin, always including their highest latency partition from the previous "
+        "scan. Defaults to every partition."
+    ),
+)
 @click.option(
     "-k",
     "--cluster",
@@ -80,16 +356,43 @@ from sentry_kafka_management.brokers import YamlKafkaConfig
 )
 def consumer_latency(
     config: Path,
-    statsd_host: str,
-    statsd_port: int,
+    metrics_backend: str,
+    statsd_host: str | None,
+    statsd_port: int | None,
+    prometheus_host: str,
+    prometheus_port: int,
+    prometheus_stale_seconds: float,
+    otlp_endpoint: str | None,
+    otlp_file: Path | None,
     interval: float,
     timeout: int,
     max_workers: int,
+    total_workers: int | None,
+    max_backoff: float,
+    scan_engine: str,
+    concurrency: str,
+    adaptive_latency_target: float | None,
+    rollups: tuple[str, ...],
+    timestamp_cache_size: int,
+    group_refresh_interval: float,
+    skip_group_states: tuple[str, ...],
+    include_groups: tuple[str, ...],
+    exclude_groups: tuple[str, ...],
+    include_topics: tuple[str, ...],
+    exclude_topics: tuple[str, ...],
+    critical_groups: tuple[str, ...],
+    group_budget: int | None,
+    max_partitions_per_group: int | None,
     clusters: tuple[str, ...],
     log_level: str,
 ) -> None:
     """
     Emit Kafka consumer latency metrics for configured clusters.
+
+    Every cluster is scanned on its own timer. --interval, --timeout, --max-workers,
+    --max-backoff, the group and topic patterns and the sampling options are defaults that
+    a cluster can override in the `latency` section of its YAML config. Errors are
+    reported and only delay the failing cluster's next scan.
     """
     logging.basicConfig(
         level=log_level.upper(),
@@ -97,7 +400,6 @@ def consumer_latency(
     )
 
     kafka_config = YamlKafkaConfig(config)
-    metrics_backend = DatadogMetricsBackend(statsd_host, statsd_port)
 
     available_clusters = set(kafka_config.get_clusters())
     unknown_clusters = set(clusters) - available_clusters
@@ -108,6 +410,16 @@ def consumer_latency(
             param_hint="--cluster",
         )
 
+    metrics = build_metrics_backend(
+        metrics_backend,
+        statsd_host,
+        statsd_port,
+        prometheus_host,
+        prometheus_port,
+        prometheus_stale_seconds,
+        otlp_endpoint,
+        otlp_file,
+    )
     stop_event = threading.Event()
 
     def handle_signal(signum: int, _frame: types.FrameType | None) -> None:
@@ -117,44 +429,95 @@ def consumer_latency(
     signal.signal(signal.SIGINT, handle_signal)
     signal.signal(signal.SIGTERM, handle_signal)
 
-    clusters_desc = ", ".join(clusters) if clusters else "all"
-    click.echo(
-        f"Starting consumer latency collection "
-        f"(interval={interval:.3f}s, max_workers={max_workers}, clusters={clusters_desc})"
-    )
-
-    while not stop_event.is_set():
-        try:
-            result = record_consumer_group_latency_action(
-                kafka_config,
-                metrics_backend,
+    selected_clusters = clusters or tuple(kafka_config.get_clusters())
+    try:
+        schedules = {
+            cluster_name: resolve_cluster_schedule(
+                kafka_config.get_clusters()[cluster_name],
+                interval,
                 timeout,
                 max_workers,
-                stop_event,
-                clusters=clusters,
+                max_backoff,
+                include_groups=include_groups,
+                exclude_groups=exclude_groups,
+                include_topics=include_topics,
+                exclude_topics=exclude_topics,
+                critical_groups=critical_groups,
+                group_budget=group_budget,
+                max_partitions_per_group=max_partitions_per_group,
             )
-        except Exception:
-            sentry_sdk.capture_exception()
-            raise
+            for cluster_name in selected_clusters
+        }
+    except ValueError as e:
+        raise click.ClickException(str(e)) from e
 
-        for scan in result.scans:
+    click.echo(
+        f"Starting consumer latency collection (metrics_backend={metrics_backend}, "
+        f"scan_engine={scan_engine}, "
+        f"concurrency={concurrency}, total_workers={total_workers or 'unbounded'}, "
+        f"adaptive_latency_target={adaptive_latency_target or 'off'}, "
+        f"rollups={','.join(rollups)}, group_refresh_interval={group_refresh_interval:.3f}s, "
+        f"skip_group_states={','.join(skip_group_states) or 'none'})"
+    )
+    for cluster_name, schedule in schedules.items():
+        click.echo(
+            f"Scheduling cluster={cluster_name} interval={schedule.interval:.3f}s "
+            f"timeout={schedule.timeout}s max_workers={schedule.max_workers} "
+            f"max_backoff={schedule.max_backoff:.3f}s groups={schedule.scan_filter.groups} "
+            f"topics={schedule.scan_filter.topics} "
+            f"group_budget={schedule.sampling.group_budget or 'unbounded'} "
+            f"max_partitions_per_group={schedule.sampling.max_partitions_per_group or 'unbounded'}"
+        )
+
+    # Scans stream in batch by batch from each cluster's own thread; only how many were
+    # reported is kept until the cluster's scan finishes.
+    scanned: dict[str, int] = {}
+
+    def report_scans(cluster_name: str, scans: list[TopicConsumerLatency]) -> None:
+        scanned[cluster_name] = scanned.get(cluster_name, 0) + len(scans)
+        for scan in scans:
             click.echo(
                 f"Collected latency cluster={scan.cluster_name} "
                 f"group={scan.group_id} topic={scan.topic_name} "
                 f"partition={scan.partition} latency_ms={scan.latency_ms:.1f}"
             )
 
-        if not result.scans and not result.errors:
-            click.echo("No consumer latency collected this iteration")
+    def report_result(cluster_name: str, result: ConsumerLatencyResult) -> None:
+        if not scanned.pop(cluster_name, 0) and not result.errors:
+            click.echo(f"No consumer latency collected for cluster {cluster_name}")
 
-        if result.errors:
-            for error in result.errors:
-                click.echo(f"Error: {error}", err=True)
-                sentry_sdk.capture_exception(error)
-            raise click.ClickException(
-                f"Consumer latency collection failed ({len(result.errors)} error(s))"
-            )
+        for error in result.errors:
+            click.echo(f"Error on cluster {cluster_name}: {error}", err=True)
+            sentry_sdk.capture_exception(error)
 
-        stop_event.wait(interval)
+    # Message timestamps are kept across scans so offsets that have not moved are not
+    # re-read, and group listings so groups are only listed on their own cadence; each
+    # cluster's loop keeps its own consumer pool for the same reason.
+    timestamp_cache = OffsetTimestampCache(timestamp_cache_size)
+    group_cache = ConsumerGroupCache(group_refresh_interval)
+    try:
+        run_consumer_latency_scheduler_action(
+            kafka_config,
+            metrics,
+            stop_event,
+            schedules,
+            on_result=report_result,
+            on_scans=report_scans,
+            timestamp_cache=timestamp_cache,
+            scan_engine=ScanEngine(scan_engine),
+            total_workers=total_workers,
+            concurrency=Concurrency(concurrency),
+            rollups=frozenset(Rollup(rollup) for rollup in rollups),
+            adaptive_latency_target=adaptive_latency_target,
+            group_cache=group_cache,
+            skip_group_states=frozenset(
+                ConsumerGroupState[state.upper()] for state in skip_group_states
+            ),
+        )
+    except Exception:
+        sentry_sdk.capture_exception()
+        raise
+    finally:
+        metrics.close()
 
     click.echo("Consumer latency collection stopped")
@@ -1,7 +1,12 @@
+import threading
+import time
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from typing import Any
 from unittest.mock import Mock, patch
 
+import pytest
+from confluent_kafka import KafkaError, KafkaException  # type: ignore[import-untyped]
 from confluent_kafka.admin import (  # type: ignore[import-untyped]
     AlterConfigOpType,
     ConfigResource,
@@ -9,12 +14,16 @@ from confluent_kafka.admin import (  # type: ignore[import-untyped]
 )
 
 from sentry_kafka_management.actions.brokers.configs import (
+    BrokerConfigSnapshot,
     ConfigChange,
+    DescribeBrokerConfigsError,
+    _RateLimiter,
     _update_configs,
     apply_configs,
     describe_broker_configs,
     remove_dynamic_configs,
 )
+from sentry_kafka_management.actions.conf import ALTER_CONFIGS_MAX_IN_FLIGHT
 
 
 def test_describe_broker_configs() -> None:
@@ -57,6 +66,127 @@ def test_describe_broker_configs() -> None:
     assert result == expected
 
 
+def _describe_configs_future(value: str, events: list[str]) -> Mock:
+    entry = Mock()
+    entry.value = value
+    entry.is_default = False
+    entry.is_read_only = False
+    entry.is_sensitive = False
+    entry.source = ConfigSource.DYNAMIC_BROKER_CONFIG.value
+    future = Mock()
+
+    def result(timeout: float) -> dict[str, Mock]:
+        events.append("result")
+        return {"num.network.threads": entry}
+
+    future.result.side_effect = result
+    return future
+
+
+def test_describe_broker_configs_sends_every_broker_before_waiting() -> None:
+    """Test each broker is described in its own request, all sent before any is awaited,
+    and failed brokers don't abort the rest."""
+    mock_client = Mock()
+    mock_client.list_topics.return_value.brokers = {0: Mock(), 1: Mock(), 2: Mock()}
+    events: list[str] = []
+    failed = Mock()
+    failed.result.side_effect = KafkaException("broker 1 unavailable")
+    futures = {
+        "0": _describe_configs_future("3", events),
+        "1": failed,
+        "2": _describe_configs_future("4", events),
+    }
+
+    def describe_configs(resources: list[ConfigResource]) -> dict[ConfigResource, Mock]:
+        # librdkafka only allows one BROKER resource per call
+        (resource,) = resources
+        events.append(f"describe {resource.name}")
+        return {resource: futures[resource.name]}
+
+    mock_client.describe_configs.side_effect = describe_configs
+
+    with pytest.raises(DescribeBrokerConfigsError) as excinfo:
+        describe_broker_configs(mock_client)
+
+    assert events == ["describe 0", "describe 1", "describe 2", "result", "result"]
+    assert list(excinfo.value.errors) == ["1"]
+    assert [(c["broker"], c["value"], c["source"]) for c in excinfo.value.configs] == [
+        ("0", "3", "DYNAMIC_BROKER_CONFIG"),
+        ("2", "4", "DYNAMIC_BROKER_CONFIG"),
+    ]
+
+
+def test_apply_configs_reports_brokers_that_could_not_be_described() -> None:
+    """Test brokers whose configs could not be described are reported, not changed."""
+    mock_client = Mock()
+
+    with (
+        patch(
+            "sentry_kafka_management.actions.brokers.configs.describe_cluster"
+        ) as mock_describe_cluster,
+        patch(
+            "sentry_kafka_management.actions.brokers.configs.describe_broker_configs"
+        ) as mock_describe_broker_configs,
+        patch("sentry_kafka_management.actions.brokers.configs._update_configs") as mock_update,
+    ):
+        mock_describe_cluster.return_value = [{"id": "0"}, {"id": "1"}]
+        mock_describe_broker_configs.side_effect = DescribeBrokerConfigsError(
+            {"1": KafkaException("broker 1 unavailable")},
+            [
+                {
+                    "config": "message.max.bytes",
+                    "value": "1000000",
+                    "source": "DYNAMIC_BROKER_CONFIG",
+                    "isDefault": False,
+                    "isReadOnly": False,
+                    "isSensitive": False,
+                    "broker": "0",
+                }
+            ],
+        )
+        mock_update.return_value = ([], [])
+
+        success, error = apply_configs(mock_client, {"message.max.bytes": "2000000"})
+
+    (changes,) = [call.kwargs["config_changes"] for call in mock_update.call_args_list]
+    assert [change.broker_id for change in changes] == ["0"]
+    assert len(error) == 1
+    assert error[0]["broker_id"] == "1"
+    assert error[0]["error"].startswith("Failed to describe configs on broker 1")
+
+
+def test_broker_config_snapshot_indexes_configs_by_broker_and_name() -> None:
+    """Test configs are looked up by broker and config name."""
+    configs = [
+        {"config": "message.max.bytes", "value": "1000000", "broker": "0"},
+        {"config": "max.connections", "value": "1000", "broker": "0"},
+        {"config": "message.max.bytes", "value": "2000000", "broker": "1"},
+    ]
+
+    snapshot = BrokerConfigSnapshot(configs)
+
+    assert snapshot.get("1", "message.max.bytes") is configs[2]
+    assert snapshot.get("1", "max.connections") is None
+    assert snapshot.get("2", "message.max.bytes") is None
+    assert snapshot.errors == {}
+
+
+@patch("sentry_kafka_management.actions.brokers.configs.describe_broker_configs")
+def test_broker_config_snapshot_describe_keeps_broker_errors(
+    mock_describe_broker_configs: Mock,
+) -> None:
+    """Test brokers that could not be described are kept as errors."""
+    error = KafkaException("broker 1 unavailable")
+    mock_describe_broker_configs.side_effect = DescribeBrokerConfigsError(
+        {"1": error}, [{"config": "message.max.bytes", "value": "1000000", "broker": "0"}]
+    )
+
+    snapshot = BrokerConfigSnapshot.describe(Mock())
+
+    assert snapshot.get("0", "message.max.bytes") is not None
+    assert snapshot.errors == {"1": error}
+
+
 def test_update_config_apply() -> None:
     """Test _update_configs() can set configs successfully."""
     mock_client = Mock()
@@ -102,6 +232,202 @@ def test_update_config_apply() -> None:
         mock_client.incremental_alter_configs.assert_called_once()
 
 
+def test_update_configs_batches_each_broker_and_bisects_failures() -> None:
+    """Test each broker's changes go in one request, and a failing change is isolated."""
+    mock_client = Mock()
+    requests: list[tuple[str, list[str]]] = []
+
+    def mock_incremental_alter(resources: list[ConfigResource]) -> dict[ConfigResource, Mock]:
+        (resource,) = resources
+        names = [entry.name for entry in resource.incremental_configs]
+        requests.append((resource.name, names))
+        future_mock = Mock()
+        if resource.name == "1" and "bad.config" in names:
+            future_mock.result.side_effect = KafkaException(
+                KafkaError(KafkaError.INVALID_CONFIG, "Invalid config bad.config")
+            )
+        else:
+            future_mock.result.return_value = None
+        return {resource: future_mock}
+
+    mock_client.incremental_alter_configs.side_effect = mock_incremental_alter
+
+    config_changes = [
+        ConfigChange(
+            broker_id=broker_id,
+            config_name=config_name,
+            is_sensitive=False,
+            op="apply",
+            to_value="1",
+        )
+        for broker_id in ["0", "1"]
+        for config_name in ["a.config", "b.config", "bad.config", "c.config"]
+        if broker_id == "1" or config_name != "bad.config"
+    ]
+
+    success, error = _update_configs(mock_client, config_changes, AlterConfigOpType.SET)
+
+    assert [(row["broker_id"], row["config_name"]) for row in success] == [
+        ("0", "a.config"),
+        ("0", "b.config"),
+        ("0", "c.config"),
+        ("1", "a.config"),
+        ("1", "b.config"),
+        ("1", "c.config"),
+    ]
+    assert [(row["broker_id"], row["config_name"], row["error"]) for row in error] == [
+        (
+            "1",
+            "bad.config",
+            'KafkaError{code=INVALID_CONFIG,val=40,str="Invalid config bad.config"}',
+        ),
+    ]
+    assert requests == [
+        ("0", ["a.config", "b.config", "c.config"]),
+        ("1", ["a.config", "b.config", "bad.config", "c.config"]),
+        ("1", ["a.config", "b.config"]),
+        ("1", ["bad.config", "c.config"]),
+        ("1", ["bad.config"]),
+        ("1", ["c.config"]),
+    ]
+
+
+def test_update_configs_reports_failed_bisection_resubmit_on_its_half() -> None:
+    """Test a resubmitted half that can't be sent fails only its own changes."""
+    mock_client = Mock()
+
+    def mock_incremental_alter(resources: list[ConfigResource]) -> dict[ConfigResource, Mock]:
+        (resource,) = resources
+        names = [entry.name for entry in resource.incremental_configs]
+        if names == ["bad.config"]:
+            raise ValueError("Invalid ConfigResource")
+        future_mock = Mock()
+        if resource.name == "0" and "bad.config" in names:
+            future_mock.result.side_effect = KafkaException(
+                KafkaError(KafkaError.INVALID_CONFIG, "Invalid config bad.config")
+            )
+        else:
+            future_mock.result.return_value = None
+        return {resource: future_mock}
+
+    mock_client.incremental_alter_configs.side_effect = mock_incremental_alter
+
+    config_changes = [
+        ConfigChange(
+            broker_id=broker_id,
+            config_name=config_name,
+            is_sensitive=False,
+            op="apply",
+            to_value="1",
+        )
+        for broker_id in ["0", "1"]
+        for config_name in ["a.config", "bad.config"]
+    ]
+
+    success, error = _update_configs(mock_client, config_changes, AlterConfigOpType.SET)
+
+    assert [(row["broker_id"], row["config_name"]) for row in success] == [
+        ("0", "a.config"),
+        ("1", "a.config"),
+        ("1", "bad.config"),
+    ]
+    assert [(row["broker_id"], row["config_name"], row["error"]) for row in error] == [
+        ("0", "bad.config", "Invalid ConfigResource"),
+    ]
+
+
+def test_update_configs_reports_timeout_on_whole_batch() -> None:
+    """Test a batch that times out is not bisected, and every change gets the error."""
+    mock_client = Mock()
+    future_mock = Mock()
+    future_mock.result.side_effect = KafkaException(
+        KafkaError(KafkaError._TIMED_OUT, "Request timed out")
+    )
+    mock_client.incremental_alter_configs.side_effect = lambda resources: {
+        resources[0]: future_mock
+    }
+
+    config_changes = [
+        ConfigChange(
+            broker_id="0",
+            config_name=config_name,
+            is_sensitive=False,
+            op="apply",
+            to_value="1",
+        )
+        for config_name in ["a.config", "b.config", "c.config"]
+    ]
+
+    success, error = _update_configs(mock_client, config_changes, AlterConfigOpType.SET)
+
+    assert success == []
+    assert [row["config_name"] for row in error] == ["a.config", "b.config", "c.config"]
+    assert all("Request timed out" in row["error"] for row in error)
+    mock_client.incremental_alter_configs.assert_called_once()
+
+
+def test_update_configs_bounds_brokers_in_flight_and_streams_results() -> None:
+    """Test at most `max_in_flight` brokers are altered at once, each reported when done."""
+    mock_client = Mock()
+    lock = threading.Lock()
+    in_flight = 0
+    most_in_flight = 0
+
+    def wait_for_broker(timeout: float) -> None:
+        nonlocal in_flight, most_in_flight
+        with lock:
+            in_flight += 1
+            most_in_flight = max(most_in_flight, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+
+    def mock_incremental_alter(resources: list[ConfigResource]) -> dict[ConfigResource, Mock]:
+        future_mock = Mock()
+        future_mock.result.side_effect = wait_for_broker
+        return {resources[0]: future_mock}
+
+    mock_client.incremental_alter_configs.side_effect = mock_incremental_alter
+    config_changes = [
+        ConfigChange(
+            broker_id=str(broker_id),
+            config_name="leader.replication.throttled.rate",
+            is_sensitive=False,
+            op="apply",
+            to_value="1000",
+        )
+        for broker_id in range(6)
+    ]
+    streamed: list[dict[str, Any]] = []
+
+    success, error = _update_configs(
+        mock_client,
+        config_changes,
+        AlterConfigOpType.SET,
+        max_in_flight=2,
+        on_result=streamed.append,
+    )
+
+    assert most_in_flight == 2
+    assert [row["broker_id"] for row in success] == ["0", "1", "2", "3", "4", "5"]
+    assert error == []
+    assert sorted(streamed, key=lambda row: str(row["broker_id"])) == success
+
+
+def test_rate_limiter_spaces_out_calls() -> None:
+    """Test calls beyond the rate wait for their slot."""
+    limiter = _RateLimiter(rate=4)
+
+    with (
+        patch.object(time, "monotonic", return_value=10.0),
+        patch.object(time, "sleep") as mock_sleep,
+    ):
+        for _ in range(3):
+            limiter.wait()
+
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [0.0, 0.25, 0.5]
+
+
 def test_apply_configs_success() -> None:
     mock_client = Mock()
 
@@ -166,6 +492,9 @@ def test_apply_configs_success() -> None:
             ],
             update_type=AlterConfigOpType.SET,
             configs_record_dir=None,
+            max_in_flight=ALTER_CONFIGS_MAX_IN_FLIGHT,
+            max_requests_per_second=None,
+            on_result=None,
         )
 
 
@@ -205,6 +534,9 @@ def test_apply_config_allowlist(
         ],
         update_type=AlterConfigOpType.SET,
         configs_record_dir=None,
+        max_in_flight=ALTER_CONFIGS_MAX_IN_FLIGHT,
+        max_requests_per_second=None,
+        on_result=None,
     )
 
 
@@ -323,6 +655,9 @@ def test_remove_dynamic_configs_success() -> None:
                 )
             ],
             update_type=AlterConfigOpType.DELETE,
+            max_in_flight=ALTER_CONFIGS_MAX_IN_FLIGHT,
+            max_requests_per_second=None,
+            on_result=None,
         )
 
 
@@ -364,6 +699,45 @@ def test_remove_dynamic_configs_validation() -> None:
         mock_client.incremental_alter_configs.assert_not_called()
 
 
+def test_remove_dynamic_configs_rejects_cluster_wide_defaults() -> None:
+    """Test that deletes of configs set as cluster-wide defaults are rejected per broker."""
+    mock_client = Mock()
+
+    with (
+        patch(
+            "sentry_kafka_management.actions.brokers.configs.describe_cluster"
+        ) as mock_describe_cluster,
+        patch(
+            "sentry_kafka_management.actions.brokers.configs.describe_broker_configs"
+        ) as mock_describe_broker_configs,
+        patch("sentry_kafka_management.actions.brokers.configs._update_configs") as mock_update,
+    ):
+        mock_describe_cluster.return_value = [{"id": "0"}]
+        mock_update.return_value = ([], [])
+        mock_describe_broker_configs.return_value = [
+            {
+                "config": "leader.replication.throttled.rate",
+                "value": "1000",
+                "source": "DYNAMIC_DEFAULT_BROKER_CONFIG",
+                "isDefault": False,
+                "isReadOnly": False,
+                "isSensitive": False,
+                "broker": "0",
+            }
+        ]
+
+        success, error = remove_dynamic_configs(
+            mock_client, ["leader.replication.throttled.rate"], ["0"]
+        )
+
+        assert success == []
+        assert len(error) == 1
+        assert "cluster-wide default" in error[0]["error"]
+        assert error[0]["from_value"] == "1000"
+        mock_update.assert_called_once()
+        assert mock_update.call_args.kwargs["config_changes"] == []
+
+
 def test_remove_dynamic_configs_allowlist() -> None:
     """Tests deletes of configs not found on broker should still error even if in allowlist."""
     mock_client = Mock()
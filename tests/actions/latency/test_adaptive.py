@@ -0,0 +1,95 @@
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+from sentry_kafka_management.actions.latency.adaptive import AimdLimiter
+
+
+def test_aimd_limiter_halves_limit_on_failure_and_grows_back() -> None:
+    limiter = AimdLimiter(max_limit=8, latency_target=1.0)
+
+    with patch.object(time, "monotonic", side_effect=[0.0, 0.5]):
+        limiter.release(limiter.acquire(), failed=True)
+    assert limiter.limit == 4
+
+    # Each healthy read adds 1 / limit, about one slot per round of reads.
+    with patch.object(time, "monotonic", side_effect=[t for i in range(5) for t in (i, i + 0.5)]):
+        for _ in range(5):
+            limiter.release(limiter.acquire())
+    assert limiter.limit == 5
+
+
+def test_aimd_limiter_backs_off_on_slow_reads() -> None:
+    limiter = AimdLimiter(max_limit=8, latency_target=1.0)
+
+    with patch.object(time, "monotonic", side_effect=[0.0, 2.0]):
+        limiter.release(limiter.acquire())
+
+    assert limiter.limit == 4
+
+
+def test_aimd_limiter_cuts_once_per_round_of_reads_in_flight() -> None:
+    limiter = AimdLimiter(max_limit=8, latency_target=1.0)
+
+    with patch.object(time, "monotonic", side_effect=[0.0, 0.1, 5.0, 5.1, 5.2, 6.0]):
+        first = limiter.acquire()
+        second = limiter.acquire()
+        limiter.release(first, failed=True)
+        # Started before the cut, so it says nothing about the new limit.
+        limiter.release(second, failed=True)
+        limiter.release(limiter.acquire(), failed=True)
+
+    assert limiter.limit == 2
+
+
+def test_aimd_limiter_stays_within_bounds() -> None:
+    limiter = AimdLimiter(max_limit=2, latency_target=1.0, min_limit=1)
+
+    for _ in range(5):
+        limiter.release(limiter.acquire(), failed=True)
+    assert limiter.limit == 1
+
+    for _ in range(10):
+        limiter.release(limiter.acquire())
+    assert limiter.limit == 2
+
+
+def test_aimd_limiter_blocks_at_limit_until_released_or_stopped() -> None:
+    limiter = AimdLimiter(max_limit=1)
+    started = limiter.acquire()
+
+    assert limiter.try_acquire() is None
+
+    stop_event = threading.Event()
+    stop_event.set()
+    # A stopped scan is not held up waiting for a slot.
+    limiter.release(limiter.acquire(stop_event))
+    limiter.release(started)
+
+    assert limiter.try_acquire() is not None
+
+
+def test_aimd_limiter_acquire_async_waits_for_a_slot() -> None:
+    limiter = AimdLimiter(max_limit=1)
+    held = limiter.acquire()
+
+    async def run() -> float:
+        waiter = asyncio.create_task(limiter.acquire_async())
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+        limiter.release(held)
+        return await waiter
+
+    assert asyncio.run(run()) > held
+
+
+def test_aimd_limiter_cancel_frees_slot_without_changing_limit() -> None:
+    limiter = AimdLimiter(max_limit=1, latency_target=1.0)
+
+    limiter.try_acquire()
+    assert limiter.try_acquire() is None
+    limiter.cancel()
+
+    assert limiter.try_acquire() is not None
+    assert limiter.limit == 1
@@ -0,0 +1,112 @@
+from sentry_kafka_management.actions.latency.aggregation import (
+    ConsumerLatencyEmitter,
+    Rollup,
+    percentile,
+)
+from sentry_kafka_management.actions.latency.consumer_latency import (
+    ConsumerLatencyResult,
+    TopicConsumerLatency,
+)
+from sentry_kafka_management.actions.latency.metrics import Metric, MetricsBackend, Tags
+
+
+class FakeMetricsBackend(MetricsBackend):
+    def __init__(self) -> None:
+        self.histograms: list[tuple[str, int | float, Tags | None]] = []
+        self.gauges: list[tuple[str, int | float, Tags | None]] = []
+
+    def histogram(self, name: str, value: int | float, tags: Tags | None = None) -> None:
+        self.histograms.append((name, value, tags))
+
+    def gauge(self, name: str, value: int | float, tags: Tags | None = None) -> None:
+        self.gauges.append((name, value, tags))
+
+
+RESULT = ConsumerLatencyResult(
+    scans=[
+        TopicConsumerLatency("cluster1", "topic-a", "group-a", float(latency), partition)
+        for partition, latency in enumerate(range(100, 1100, 100))
+    ]
+    + [
+        TopicConsumerLatency("cluster1", "topic-b", "group-a", 5000.0, 0),
+        TopicConsumerLatency("cluster1", "topic-a", "group-b", 7.0, 0),
+    ]
+)
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    values = [float(v) for v in range(1, 101)]
+
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile(values, 100) == 100.0
+    assert percentile([3.0], 50) == 3.0
+    assert percentile([1.0, 2.0], 0) == 1.0
+
+
+def test_consumer_latency_emitter_defaults_to_partition_points() -> None:
+    metrics = FakeMetricsBackend()
+
+    emitter = ConsumerLatencyEmitter(metrics)
+    emitter.add(RESULT)
+    emitter.finish()
+
+    assert len(metrics.histograms) == len(RESULT.scans)
+    assert metrics.gauges == []
+
+
+def test_consumer_latency_emitter_rolls_up_by_topic() -> None:
+    metrics = FakeMetricsBackend()
+
+    emitter = ConsumerLatencyEmitter(metrics, rollups={Rollup.TOPIC})
+    emitter.add(RESULT)
+    emitter.finish()
+
+    assert metrics.histograms == []
+    topic_a = {"cluster": "cluster1", "consumer_group": "group-a", "topic": "topic-a"}
+    assert [gauge for gauge in metrics.gauges if gauge[2] == topic_a] == [
+        (Metric.CONSUMER_LATENCY_TOPIC_MAX.value, 1000.0, topic_a),
+        (Metric.CONSUMER_LATENCY_TOPIC_P50.value, 500.0, topic_a),
+        (Metric.CONSUMER_LATENCY_TOPIC_P99.value, 1000.0, topic_a),
+    ]
+    assert len(metrics.gauges) == 3 * 3
+
+
+def test_consumer_latency_emitter_rolls_up_by_group_alongside_partitions() -> None:
+    metrics = FakeMetricsBackend()
+
+    emitter = ConsumerLatencyEmitter(metrics, rollups={Rollup.PARTITION, Rollup.GROUP})
+    emitter.add(RESULT)
+    emitter.finish()
+
+    assert len(metrics.histograms) == len(RESULT.scans)
+    assert metrics.gauges == [
+        (
+            Metric.CONSUMER_LATENCY_GROUP_MAX.value,
+            5000.0,
+            {"cluster": "cluster1", "consumer_group": "group-a"},
+        ),
+        (
+            Metric.CONSUMER_LATENCY_GROUP_MAX.value,
+            7.0,
+            {"cluster": "cluster1", "consumer_group": "group-b"},
+        ),
+    ]
+
+
+def test_consumer_latency_emitter_streams_points_and_rolls_up_on_finish() -> None:
+    metrics = FakeMetricsBackend()
+    emitter = ConsumerLatencyEmitter(metrics, rollups={Rollup.PARTITION, Rollup.GROUP})
+
+    emitter.add(ConsumerLatencyResult(scans=RESULT.scans[:5]))
+    assert len(metrics.histograms) == 5
+    assert metrics.gauges == []
+
+    emitter.add(ConsumerLatencyResult(scans=RESULT.scans[5:]))
+    emitter.finish()
+
+    assert len(metrics.histograms) == len(RESULT.scans)
+    assert [value for _, value, _ in metrics.gauges] == [5000.0, 7.0]
+
+    emitter.finish()
+    assert len(metrics.gauges) == 2
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import threading
-from concurrent.futures import Future
-from unittest.mock import MagicMock, Mock, patch
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 from confluent_kafka import (  # type: ignore[import-untyped]
     TIMESTAMP_CREATE_TIME,
     TIMESTAMP_LOG_APPEND_TIME,
     TIMESTAMP_NOT_AVAILABLE,
+    ConsumerGroupState,
     ConsumerGroupTopicPartitions,
     KafkaError,
     KafkaException,
@@ -17,20 +20,38 @@ from confluent_kafka import (  # type: ignore[import-untyped]
 from confluent_kafka.admin import (  # type: ignore[import-untyped]
     ConsumerGroupListing,
     ListConsumerGroupsResult,
+    ListOffsetsResultInfo,
 )
 
+from sentry_kafka_management.actions.latency.adaptive import AimdLimiter
 from sentry_kafka_management.actions.latency.consumer_latency import (
+    ASYNC_MIN_IDLE_SLEEP,
+    Concurrency,
     ConsumerGroupListingError,
     ConsumerLatencyResult,
     PartitionScan,
+    ScanEngine,
     TopicConsumerLatency,
+    fetch_committed_offsets,
     get_cluster_latency,
     get_committed_offsets,
+    get_high_watermarks,
+    get_partition_batch_latency,
     list_consumer_group_ids,
+    plan_partition_scans,
     record_consumer_group_latency,
+    scan_partition_batches,
     scan_partition_latencies,
+    scan_partition_latencies_async,
+    split_caught_up_partitions,
 )
+from sentry_kafka_management.actions.latency.consumer_pool import ConsumerPool
+from sentry_kafka_management.actions.latency.filters import NameFilter, ScanFilter
+from sentry_kafka_management.actions.latency.group_cache import ConsumerGroupCache
+from sentry_kafka_management.actions.latency.instrumentation import ScanPhase, ScanStats
 from sentry_kafka_management.actions.latency.metrics import MetricsBackend, Tags
+from sentry_kafka_management.actions.latency.sampling import SamplingPolicy, ScanSampler
+from sentry_kafka_management.actions.latency.timestamp_cache import OffsetTimestampCache
 from sentry_kafka_management.brokers import ClusterConfig, TopicConfig
 
 RETENTION_MS = 86_400_000
@@ -58,13 +79,19 @@ CLUSTER_CONFIG = ClusterConfig(
 class FakeMetricsBackend(MetricsBackend):
     def __init__(self) -> None:
         self.histograms: list[tuple[str, int | float, Tags | None]] = []
+        self.gauges: list[tuple[str, int | float, Tags | None]] = []
 
     def histogram(self, name: str, value: int | float, tags: Tags | None = None) -> None:
         self.histograms.append((name, value, tags))
 
+    def gauge(self, name: str, value: int | float, tags: Tags | None = None) -> None:
+        self.gauges.append((name, value, tags))
 
-def _make_group_listing(group_id: str) -> ConsumerGroupListing:
-    return ConsumerGroupListing(group_id=group_id, is_simple_consumer_group=False)
+
+def _make_group_listing(
+    group_id: str, state: ConsumerGroupState | None = None
+) -> ConsumerGroupListing:
+    return ConsumerGroupListing(group_id=group_id, is_simple_consumer_group=False, state=state)
 
 
 def _make_list_groups_result(
@@ -93,6 +120,12 @@ def _make_errored_committed_offsets_future(exc: Exception) -> Future[ConsumerGro
     return future
 
 
+def _make_list_offsets_future(offset: int) -> Future[ListOffsetsResultInfo]:
+    future: Future[ListOffsetsResultInfo] = Future()
+    future.set_result(ListOffsetsResultInfo(offset=offset, timestamp=-1, leader_epoch=-1))
+    return future
+
+
 def _make_errored_topic_partition(topic: str, partition: int, offset: int) -> Mock:
     bad_tp = Mock(spec=["topic", "partition", "offset", "error"])
     bad_tp.topic = topic
@@ -117,6 +150,16 @@ def _make_message(
     return msg
 
 
+def _stream(
+    result: ConsumerLatencyResult, on_scans: object = None, **_kwargs: object
+) -> ConsumerLatencyResult:
+    """Hand a fake cluster scan's results to `on_scans` like `get_cluster_latency` does."""
+    assert callable(on_scans)
+    if result.scans:
+        on_scans(result.scans)
+    return ConsumerLatencyResult(scans=[], errors=result.errors)
+
+
 def _scan(
     topic: str = "topic-a",
     partition: int = 0,
@@ -124,7 +167,7 @@ def _scan(
     retention_ms: int = RETENTION_MS,
 ) -> PartitionScan:
     return PartitionScan(
-        group_id="group-a",
+        group_ids=["group-a"],
         topic=topic,
         partition=partition,
         committed_offset=committed_offset,
@@ -142,6 +185,24 @@ def test_list_consumer_group_ids_returns_all_ids() -> None:
     admin.list_consumer_groups.assert_called_once()
 
 
+def test_list_consumer_group_ids_skips_groups_in_skipped_states() -> None:
+    admin = Mock()
+    admin.list_consumer_groups.return_value = _make_list_groups_result(
+        valid=[
+            _make_group_listing("stable", ConsumerGroupState.STABLE),
+            _make_group_listing("empty", ConsumerGroupState.EMPTY),
+            _make_group_listing("dead", ConsumerGroupState.DEAD),
+            _make_group_listing("unknown"),
+        ],
+    )
+
+    group_ids = list_consumer_group_ids(
+        admin, skip_states={ConsumerGroupState.EMPTY, ConsumerGroupState.DEAD}
+    )
+
+    assert group_ids == ["stable", "unknown"]
+
+
 def test_list_consumer_group_ids_returns_empty_when_no_groups() -> None:
     admin = Mock()
     admin.list_consumer_groups.return_value = _make_list_groups_result(valid=[])
@@ -207,9 +268,88 @@ def test_get_committed_offsets(
         assert result["group-a"] == expected
 
 
+def test_fetch_committed_offsets_fetches_every_group_in_batches() -> None:
+    admin = Mock()
+    admin.list_consumer_group_offsets.side_effect = lambda reqs: {
+        reqs[0].group_id: _make_committed_offsets_future(
+            reqs[0].group_id, [TopicPartition("topic-a", 0, 1)]
+        )
+    }
+
+    result = fetch_committed_offsets(admin, ["group-a", "group-b", "group-c"], batch_size=2)
+
+    assert set(result) == {"group-a", "group-b", "group-c"}
+    assert admin.list_consumer_group_offsets.call_count == 3
+    requested = [
+        call.args[0][0].group_id for call in admin.list_consumer_group_offsets.call_args_list
+    ]
+    assert requested == ["group-a", "group-b", "group-c"]
+
+
+def test_fetch_committed_offsets_stops_between_batches() -> None:
+    admin = Mock()
+    stop_event = threading.Event()
+
+    def list_offsets(
+        reqs: list[ConsumerGroupTopicPartitions],
+    ) -> dict[str, Future[ConsumerGroupTopicPartitions]]:
+        stop_event.set()
+        group_id = reqs[0].group_id
+        return {group_id: _make_committed_offsets_future(group_id, [])}
+
+    admin.list_consumer_group_offsets.side_effect = list_offsets
+
+    result = fetch_committed_offsets(
+        admin, ["group-a", "group-b"], batch_size=1, stop_event=stop_event
+    )
+
+    assert result == {"group-a": []}
+
+
+def test_plan_partition_scans_collapses_groups_at_the_same_offset() -> None:
+    committed_by_group = {
+        "group-a": [TopicPartition("topic-a", 0, 50), TopicPartition("topic-a", 1, 60)],
+        "group-b": [TopicPartition("topic-a", 0, 50), TopicPartition("topic-a", 1, 60)],
+    }
+
+    batches = plan_partition_scans(committed_by_group, {"topic-a": RETENTION_MS})
+
+    assert batches == [
+        [
+            PartitionScan(["group-a", "group-b"], "topic-a", 0, 50, RETENTION_MS),
+            PartitionScan(["group-a", "group-b"], "topic-a", 1, 60, RETENTION_MS),
+        ]
+    ]
+
+
+def test_plan_partition_scans_splits_offsets_of_one_partition_across_batches() -> None:
+    committed_by_group = {
+        "group-a": [TopicPartition("topic-a", 0, 50)],
+        "group-b": [TopicPartition("topic-a", 0, 70)],
+        "group-c": [TopicPartition("topic-a", 0, 50), TopicPartition("other-topic", 0, 1)],
+    }
+
+    batches = plan_partition_scans(committed_by_group, {"topic-a": RETENTION_MS})
+
+    assert batches == [
+        [PartitionScan(["group-a", "group-c"], "topic-a", 0, 50, RETENTION_MS)],
+        [PartitionScan(["group-b"], "topic-a", 0, 70, RETENTION_MS)],
+    ]
+
+
+def test_plan_partition_scans_caps_batch_size() -> None:
+    committed_by_group = {"group-a": [TopicPartition("topic-a", p, 5) for p in range(5)]}
+
+    batches = plan_partition_scans(committed_by_group, {"topic-a": RETENTION_MS}, batch_size=2)
+
+    assert [[scan.partition for scan in batch] for batch in batches] == [[0, 1], [2, 3], [4]]
+
+
 def test_scan_partition_latencies_returns_latency_from_create_time() -> None:
     consumer = Mock()
-    consumer.poll.return_value = _make_message(timestamp=(TIMESTAMP_CREATE_TIME, 1_700_000_000_000))
+    consumer.consume.return_value = [
+        _make_message(timestamp=(TIMESTAMP_CREATE_TIME, 1_700_000_000_000))
+    ]
 
     with patch("time.time", return_value=1_700_000_000.5):
         latencies, errors = scan_partition_latencies(
@@ -225,9 +365,9 @@ def test_scan_partition_latencies_returns_latency_from_create_time() -> None:
 
 def test_scan_partition_latencies_returns_latency_from_log_append_time() -> None:
     consumer = Mock()
-    consumer.poll.return_value = _make_message(
-        timestamp=(TIMESTAMP_LOG_APPEND_TIME, 1_700_000_000_500)
-    )
+    consumer.consume.return_value = [
+        _make_message(timestamp=(TIMESTAMP_LOG_APPEND_TIME, 1_700_000_000_500))
+    ]
 
     with patch("time.time", return_value=1_700_000_001.0):
         latencies, errors = scan_partition_latencies(consumer, [_scan()], timeout=10)
@@ -238,9 +378,11 @@ def test_scan_partition_latencies_returns_latency_from_log_append_time() -> None
 
 def test_scan_partition_latencies_caught_up_partition_is_zero() -> None:
     consumer = Mock()
-    consumer.poll.return_value = _make_message(
-        error=KafkaError(KafkaError._PARTITION_EOF, "reached end of partition"),
-    )
+    consumer.consume.return_value = [
+        _make_message(
+            error=KafkaError(KafkaError._PARTITION_EOF, "reached end of partition"),
+        )
+    ]
 
     latencies, errors = scan_partition_latencies(consumer, [_scan()], timeout=10)
 
@@ -250,9 +392,11 @@ def test_scan_partition_latencies_caught_up_partition_is_zero() -> None:
 
 def test_scan_partition_latencies_aged_out_uses_retention() -> None:
     consumer = Mock()
-    consumer.poll.return_value = _make_message(
-        error=KafkaError(KafkaError._AUTO_OFFSET_RESET, "Offset out of range"),
-    )
+    consumer.consume.return_value = [
+        _make_message(
+            error=KafkaError(KafkaError._AUTO_OFFSET_RESET, "Offset out of range"),
+        )
+    ]
 
     latencies, errors = scan_partition_latencies(consumer, [_scan(retention_ms=5_000)], timeout=10)
 
@@ -262,9 +406,9 @@ def test_scan_partition_latencies_aged_out_uses_retention() -> None:
 
 def test_scan_partition_latencies_assigns_all_partitions_in_one_batch() -> None:
     consumer = Mock()
-    consumer.poll.side_effect = [
-        _make_message(timestamp=(TIMESTAMP_CREATE_TIME, 10), partition=0),
-        _make_message(timestamp=(TIMESTAMP_CREATE_TIME, 20), partition=1),
+    consumer.consume.side_effect = [
+        [_make_message(timestamp=(TIMESTAMP_CREATE_TIME, 10), partition=0)],
+        [_make_message(timestamp=(TIMESTAMP_CREATE_TIME, 20), partition=1)],
     ]
 
     scans = [_scan(partition=0, committed_offset=5), _scan(partition=1, committed_offset=7)]
@@ -278,26 +422,56 @@ def test_scan_partition_latencies_assigns_all_partitions_in_one_batch() -> None:
     assert assigned == [TopicPartition("topic-a", 0, 5), TopicPartition("topic-a", 1, 7)]
 
 
-def test_scan_partition_latencies_skips_empty_polls_then_returns() -> None:
+def test_scan_partition_latencies_skips_empty_batches_then_returns() -> None:
     consumer = Mock()
-    consumer.poll.side_effect = [
-        None,
-        None,
-        _make_message(timestamp=(TIMESTAMP_CREATE_TIME, 5)),
+    consumer.consume.side_effect = [
+        [],
+        [],
+        [_make_message(timestamp=(TIMESTAMP_CREATE_TIME, 5))],
     ]
 
     with patch("time.time", return_value=1.0):
         latencies, errors = scan_partition_latencies(consumer, [_scan()], timeout=10)
 
     assert latencies == {("topic-a", 0): 995.0}
-    assert consumer.poll.call_count == 3
+    assert consumer.consume.call_count == 3
+
+
+def test_scan_partition_latencies_returns_once_one_batch_resolves_every_partition() -> None:
+    consumer = Mock()
+    consumer.consume.return_value = [
+        _make_message(timestamp=(TIMESTAMP_CREATE_TIME, 10), partition=0),
+        _make_message(error=KafkaError(KafkaError._PARTITION_EOF, "eof"), partition=1),
+    ]
+
+    scans = [_scan(partition=0), _scan(partition=1)]
+    with patch("time.time", return_value=1.0):
+        latencies, errors = scan_partition_latencies(consumer, scans, timeout=10)
+
+    assert latencies == {("topic-a", 0): 990.0, ("topic-a", 1): 0.0}
+    assert errors == []
+    consumer.consume.assert_called_once()
+    assert consumer.consume.call_args.kwargs["num_messages"] == 2
+
+
+def test_scan_partition_latencies_waits_no_longer_than_the_deadline() -> None:
+    consumer = Mock()
+    consumer.consume.return_value = []
+
+    with patch("time.monotonic", side_effect=[0.0, 0.95, 1.0]):
+        scan_partition_latencies(consumer, [_scan()], timeout=1)
+
+    assert consumer.consume.call_args.kwargs["timeout"] == pytest.approx(0.05)
+    assert consumer.consume.call_args.kwargs["num_messages"] == 1
 
 
 def test_scan_partition_latencies_records_message_error() -> None:
     consumer = Mock()
-    consumer.poll.return_value = _make_message(
-        error=KafkaError(KafkaError.UNKNOWN, "fetch failed"),
-    )
+    consumer.consume.return_value = [
+        _make_message(
+            error=KafkaError(KafkaError.UNKNOWN, "fetch failed"),
+        )
+    ]
 
     latencies, errors = scan_partition_latencies(consumer, [_scan()], timeout=10)
 
@@ -308,9 +482,9 @@ def test_scan_partition_latencies_records_message_error() -> None:
 
 def test_scan_partition_latencies_retries_on_retryable_error() -> None:
     consumer = Mock()
-    consumer.poll.side_effect = [
-        _make_message(error=KafkaError(KafkaError.REQUEST_TIMED_OUT, "request timed out")),
-        _make_message(timestamp=(TIMESTAMP_CREATE_TIME, 9)),
+    consumer.consume.side_effect = [
+        [_make_message(error=KafkaError(KafkaError.REQUEST_TIMED_OUT, "request timed out"))],
+        [_make_message(timestamp=(TIMESTAMP_CREATE_TIME, 9))],
     ]
 
     with patch("time.time", return_value=1.0):
@@ -318,12 +492,12 @@ def test_scan_partition_latencies_retries_on_retryable_error() -> None:
 
     assert latencies == {("topic-a", 0): 991.0}
     assert errors == []
-    assert consumer.poll.call_count == 2
+    assert consumer.consume.call_count == 2
 
 
 def test_scan_partition_latencies_records_timestamp_not_available() -> None:
     consumer = Mock()
-    consumer.poll.return_value = _make_message(timestamp=(TIMESTAMP_NOT_AVAILABLE, 0))
+    consumer.consume.return_value = [_make_message(timestamp=(TIMESTAMP_NOT_AVAILABLE, 0))]
 
     latencies, errors = scan_partition_latencies(consumer, [_scan()], timeout=10)
 
@@ -335,7 +509,7 @@ def test_scan_partition_latencies_records_timestamp_not_available() -> None:
 
 def test_scan_partition_latencies_records_negative_timestamp() -> None:
     consumer = Mock()
-    consumer.poll.return_value = _make_message(timestamp=(TIMESTAMP_CREATE_TIME, -1))
+    consumer.consume.return_value = [_make_message(timestamp=(TIMESTAMP_CREATE_TIME, -1))]
 
     latencies, errors = scan_partition_latencies(consumer, [_scan()], timeout=10)
 
@@ -347,9 +521,9 @@ def test_scan_partition_latencies_records_negative_timestamp() -> None:
 
 def test_scan_partition_latencies_pauses_each_partition_once_resolved() -> None:
     consumer = Mock()
-    consumer.poll.side_effect = [
-        _make_message(timestamp=(TIMESTAMP_CREATE_TIME, 10), partition=0),
-        _make_message(error=KafkaError(KafkaError._PARTITION_EOF, "eof"), partition=1),
+    consumer.consume.side_effect = [
+        [_make_message(timestamp=(TIMESTAMP_CREATE_TIME, 10), partition=0)],
+        [_make_message(error=KafkaError(KafkaError._PARTITION_EOF, "eof"), partition=1)],
     ]
 
     scans = [_scan(partition=0, committed_offset=5), _scan(partition=1, committed_offset=9)]
@@ -362,19 +536,83 @@ def test_scan_partition_latencies_pauses_each_partition_once_resolved() -> None:
 
 def test_scan_partition_latencies_records_timeout_for_unread_partitions() -> None:
     consumer = Mock()
-    consumer.poll.return_value = None
+    consumer.consume.return_value = []
 
-    with patch("time.monotonic", side_effect=[0.0, 0.5, 100.0]):
-        latencies, errors = scan_partition_latencies(consumer, [_scan()], timeout=10)
+    latencies, errors = scan_partition_latencies(consumer, [_scan()], timeout=0)
 
     assert latencies == {}
     assert len(errors) == 1
     assert isinstance(errors[0], TimeoutError)
 
 
+def test_scan_partition_latencies_reports_high_watermarks_seen_by_consumer() -> None:
+    consumer = Mock()
+    consumer.consume.return_value = [
+        _make_message(timestamp=(TIMESTAMP_CREATE_TIME, 800), partition=0),
+        _make_message(error=KafkaError(KafkaError._PARTITION_EOF), partition=1),
+        _make_message(timestamp=(TIMESTAMP_CREATE_TIME, 900), partition=2),
+    ]
+    consumer.get_watermark_offsets.side_effect = lambda tp, cached: {
+        0: (0, 60),
+        1: (0, 42),
+        # Not fetched yet, as librdkafka reports it.
+        2: (-1001, -1001),
+    }[tp.partition]
+    high_watermarks: dict[tuple[str, int], int] = {}
+
+    scan_partition_latencies(
+        consumer,
+        [_scan(partition=0), _scan(partition=1), _scan(partition=2)],
+        timeout=10,
+        high_watermarks=high_watermarks,
+    )
+
+    assert high_watermarks == {("topic-a", 0): 60, ("topic-a", 1): 42}
+    assert all(call.kwargs["cached"] for call in consumer.get_watermark_offsets.call_args_list)
+
+
+@pytest.mark.parametrize("concurrency", list(Concurrency))
+@patch("sentry_kafka_management.actions.latency.consumer_pool.Consumer")
+@patch("sentry_kafka_management.actions.latency.consumer_latency.get_admin_client")
+def test_get_cluster_latency_reports_offset_lag_for_every_group_at_an_offset(
+    mock_get_admin: MagicMock,
+    mock_consumer_cls: MagicMock,
+    concurrency: Concurrency,
+) -> None:
+    admin = Mock()
+    mock_get_admin.return_value = admin
+    admin.list_consumer_groups.return_value = _make_list_groups_result(
+        valid=[_make_group_listing("group-a"), _make_group_listing("group-b")],
+    )
+    admin.list_consumer_group_offsets.side_effect = lambda partitions: {
+        group_id: _make_committed_offsets_future(group_id, [TopicPartition("topic-a", 0, 50)])
+        for group_id in [partitions[0].group_id]
+    }
+    consumer = mock_consumer_cls.return_value
+    consumer.consume.return_value = [_make_message(timestamp=(TIMESTAMP_CREATE_TIME, 800))]
+    consumer.get_watermark_offsets.return_value = (0, 65)
+
+    with patch("time.time", return_value=1.0):
+        result = get_cluster_latency(
+            "cluster1",
+            CLUSTER_CONFIG,
+            topics={"topic-a": _topic_config(partitions=1)},
+            timeout=10,
+            concurrency=concurrency,
+        )
+
+    assert sorted(result.scans, key=lambda scan: scan.group_id) == [
+        TopicConsumerLatency(
+            "cluster1", "topic-a", group_id, 200.0, partition=0, offset_lag=15, high_watermark=65
+        )
+        for group_id in ["group-a", "group-b"]
+    ]
+    admin.list_offsets.assert_not_called()
+
+
 def test_scan_partition_latencies_returns_early_when_stopped() -> None:
     consumer = Mock()
-    consumer.poll.return_value = None
+    consumer.consume.return_value = []
     stop_event = threading.Event()
     stop_event.set()
 
@@ -384,11 +622,64 @@ def test_scan_partition_latencies_returns_early_when_stopped() -> None:
 
     assert latencies == {}
     assert errors == []
-    consumer.poll.assert_not_called()
+    consumer.consume.assert_not_called()
+
+
+def test_scan_partition_latencies_async_sleeps_between_empty_batches() -> None:
+    consumer = Mock()
+    consumer.consume.side_effect = [
+        [],
+        [],
+        [_make_message(timestamp=(TIMESTAMP_CREATE_TIME, 1_700_000_000_000))],
+    ]
+    sleep = AsyncMock()
+
+    with (
+        patch("time.time", return_value=1_700_000_000.5),
+        patch("asyncio.sleep", sleep),
+    ):
+        latencies, errors = asyncio.run(
+            scan_partition_latencies_async(consumer, [_scan()], timeout=10)
+        )
+
+    assert latencies == {("topic-a", 0): 500.0}
+    assert errors == []
+    assert [c.kwargs["timeout"] for c in consumer.consume.call_args_list] == [0, 0, 0]
+    assert [c.args[0] for c in sleep.call_args_list] == [
+        pytest.approx(ASYNC_MIN_IDLE_SLEEP),
+        pytest.approx(ASYNC_MIN_IDLE_SLEEP * 2),
+    ]
+    consumer.pause.assert_called_once_with([TopicPartition("topic-a", 0)])
+
+
+def test_scan_partition_latencies_async_records_timeout_for_unread_partitions() -> None:
+    consumer = Mock()
+    consumer.consume.return_value = []
+
+    latencies, errors = asyncio.run(scan_partition_latencies_async(consumer, [_scan()], timeout=0))
+
+    assert latencies == {}
+    assert len(errors) == 1
+    assert isinstance(errors[0], TimeoutError)
+
+
+@patch("sentry_kafka_management.actions.latency.consumer_latency.get_cluster_latency")
+def test_record_consumer_group_latency_skips_scan_when_already_stopped(
+    mock_get_cluster_latency: MagicMock,
+) -> None:
+    config = Mock()
+    config.get_clusters.return_value = {"cluster1": CLUSTER_CONFIG}
+    stop_event = threading.Event()
+    stop_event.set()
+
+    result = record_consumer_group_latency(config, FakeMetricsBackend(), stop_event=stop_event)
+
+    mock_get_cluster_latency.assert_not_called()
+    assert result.scans == []
 
 
 @patch("sentry_kafka_management.actions.latency.consumer_latency.get_cluster_latency")
-def test_record_consumer_group_latency_stops_between_clusters(
+def test_record_consumer_group_latency_stops_every_cluster_on_shutdown(
     mock_get_cluster_latency: MagicMock,
 ) -> None:
     config = Mock()
@@ -398,139 +689,580 @@ def test_record_consumer_group_latency_stops_between_clusters(
     }
     config.get_topics_config.return_value = {"topic-a": {}}
     stop_event = threading.Event()
-
-    def stop_after_first(
-        cluster_name: str, *_args: object, **_kwargs: object
+    cluster_stops: dict[str, threading.Event] = {}
+
+    def stop_then_wait(
+        cluster_name: str,
+        _config: object,
+        _topics: object,
+        _timeout: int,
+        _workers: int,
+        cluster_stop: threading.Event,
+        *_args: object,
+        **kwargs: object,
     ) -> ConsumerLatencyResult:
-        stop_event.set()
-        return ConsumerLatencyResult(
-            scans=[TopicConsumerLatency(cluster_name, "topic-a", "group-a", 1.0, partition=0)],
+        cluster_stops[cluster_name] = cluster_stop
+        if cluster_name == "cluster1":
+            stop_event.set()
+        assert cluster_stop.wait(5)
+        return _stream(
+            ConsumerLatencyResult(
+                scans=[TopicConsumerLatency(cluster_name, "topic-a", "group-a", 1.0, partition=0)],
+            ),
+            **kwargs,
         )
 
-    mock_get_cluster_latency.side_effect = stop_after_first
+    mock_get_cluster_latency.side_effect = stop_then_wait
     metrics = FakeMetricsBackend()
 
-    result = record_consumer_group_latency(config, metrics, stop_event=stop_event)
+    result = record_consumer_group_latency(config, metrics, stop_event=stop_event)
+
+    assert set(cluster_stops) == {"cluster1", "cluster2"}
+    assert all(cluster_stop.is_set() for cluster_stop in cluster_stops.values())
+    assert sorted(scan.cluster_name for scan in result.scans) == ["cluster1", "cluster2"]
+    assert result.errors == []
+
+
+@patch("sentry_kafka_management.actions.latency.consumer_latency.get_cluster_latency")
+def test_record_consumer_group_latency_does_not_wait_past_cluster_timeout(
+    mock_get_cluster_latency: MagicMock,
+) -> None:
+    config = Mock()
+    config.get_clusters.return_value = {
+        "fast": CLUSTER_CONFIG,
+        "slow": CLUSTER_CONFIG,
+    }
+    config.get_topics_config.return_value = {"topic-a": {}}
+    release = threading.Event()
+    slow_done = threading.Event()
+
+    def scan(cluster_name: str, *_args: object, **kwargs: object) -> ConsumerLatencyResult:
+        if cluster_name == "slow":
+            release.wait(5)
+        result = _stream(
+            ConsumerLatencyResult(
+                scans=[TopicConsumerLatency(cluster_name, "topic-a", "group-a", 1.0, partition=0)],
+            ),
+            **kwargs,
+        )
+        if cluster_name == "slow":
+            slow_done.set()
+        return result
+
+    mock_get_cluster_latency.side_effect = scan
+    metrics = FakeMetricsBackend()
+
+    try:
+        result = record_consumer_group_latency(config, metrics, cluster_timeout=0.2)
+    finally:
+        release.set()
+
+    assert [scan.cluster_name for scan in result.scans] == ["fast"]
+    assert len(result.errors) == 1
+    assert isinstance(result.errors[0], TimeoutError)
+    assert "slow" in str(result.errors[0])
+    # The slow cluster finishing after the deadline emits nothing.
+    assert slow_done.wait(5)
+    assert {tags["cluster"] for _, _, tags in metrics.histograms if tags} == {"fast"}
+
+
+@patch("sentry_kafka_management.actions.latency.consumer_latency.get_cluster_latency")
+def test_record_consumer_group_latency_shares_scan_workers_across_clusters(
+    mock_get_cluster_latency: MagicMock,
+) -> None:
+    config = Mock()
+    config.get_clusters.return_value = {
+        "cluster1": CLUSTER_CONFIG,
+        "cluster2": CLUSTER_CONFIG,
+    }
+    config.get_topics_config.return_value = {"topic-a": {}}
+    mock_get_cluster_latency.return_value = ConsumerLatencyResult(scans=[])
+
+    record_consumer_group_latency(config, FakeMetricsBackend(), total_workers=8)
+
+    executors = [call.kwargs["executor"] for call in mock_get_cluster_latency.call_args_list]
+    assert len(executors) == 2
+    assert executors[0] is not None
+    assert executors[0] is executors[1]
+
+
+@patch("sentry_kafka_management.actions.latency.consumer_pool.Consumer")
+@patch("sentry_kafka_management.actions.latency.consumer_latency.get_admin_client")
+def test_get_cluster_latency_skips_own_consumer_group(
+    mock_get_admin: MagicMock,
+    mock_consumer_cls: MagicMock,
+) -> None:
+    admin = Mock()
+    mock_get_admin.return_value = admin
+    own_group = "consumer-latency-group-cluster1"
+    admin.list_consumer_groups.return_value = _make_list_groups_result(
+        valid=[_make_group_listing(own_group)],
+    )
+
+    result = get_cluster_latency(
+        "cluster1", CLUSTER_CONFIG, topics={"topic-a": _topic_config()}, timeout=10
+    )
+
+    assert result.scans == []
+    assert len(result.errors) == 0
+    admin.list_consumer_group_offsets.assert_not_called()
+    mock_consumer_cls.assert_not_called()
+
+
+@patch("sentry_kafka_management.actions.latency.consumer_pool.Consumer")
+@patch("sentry_kafka_management.actions.latency.consumer_latency.get_admin_client")
+def test_get_cluster_latency_lists_groups_through_group_cache(
+    mock_get_admin: MagicMock,
+    mock_consumer_cls: MagicMock,
+) -> None:
+    admin = Mock()
+    mock_get_admin.return_value = admin
+    admin.list_consumer_groups.return_value = _make_list_groups_result(
+        valid=[
+            _make_group_listing("group-a", ConsumerGroupState.STABLE),
+            _make_group_listing("group-b", ConsumerGroupState.EMPTY),
+        ],
+    )
+    admin.list_consumer_group_offsets.side_effect = lambda partitions: {
+        partitions[0].group_id: _make_committed_offsets_future(partitions[0].group_id, [])
+    }
+    group_cache = ConsumerGroupCache(refresh_interval=60.0)
+    stats = [ScanStats(), ScanStats()]
+
+    for scan_stats in stats:
+        result = get_cluster_latency(
+            "cluster1",
+            CLUSTER_CONFIG,
+            topics={"topic-a": _topic_config()},
+            timeout=10,
+            stats=scan_stats,
+            group_cache=group_cache,
+            skip_group_states={ConsumerGroupState.EMPTY},
+        )
+        assert result.errors == []
+
+    admin.list_consumer_groups.assert_called_once()
+    assert [
+        call.args[0][0].group_id for call in admin.list_consumer_group_offsets.call_args_list
+    ] == [
+        "group-a",
+        "group-a",
+    ]
+    assert [scan_stats.admin_requests for scan_stats in stats] == [2, 1]
+
+
+@patch("sentry_kafka_management.actions.latency.consumer_pool.Consumer")
+@patch("sentry_kafka_management.actions.latency.consumer_latency.get_admin_client")
+def test_get_cluster_latency_applies_scan_filter_before_fetching_offsets(
+    mock_get_admin: MagicMock,
+    mock_consumer_cls: MagicMock,
+) -> None:
+    admin = Mock()
+    mock_get_admin.return_value = admin
+    admin.list_consumer_groups.return_value = _make_list_groups_result(
+        valid=[
+            _make_group_listing("snuba-consumers"),
+            _make_group_listing("snuba-replay-1"),
+            _make_group_listing("ingest-consumer"),
+        ],
+    )
+    admin.list_consumer_group_offsets.return_value = {
+        "snuba-consumers": _make_committed_offsets_future(
+            "snuba-consumers",
+            [TopicPartition("events", 0, 50), TopicPartition("transactions", 0, 50)],
+        ),
+    }
+    consumer = mock_consumer_cls.return_value
+    consumer.consume.return_value = [
+        _make_message(timestamp=(TIMESTAMP_CREATE_TIME, 800), topic="events", partition=0)
+    ]
+
+    with patch("time.time", return_value=1.0):
+        result = get_cluster_latency(
+            "cluster1",
+            CLUSTER_CONFIG,
+            topics={"events": _topic_config(), "transactions": _topic_config()},
+            timeout=10,
+            scan_filter=ScanFilter(
+                groups=NameFilter(include=["snuba-*"], exclude=["*-replay-*"]),
+                topics=NameFilter(exclude=["transactions"]),
+            ),
+        )
+
+    admin.list_consumer_group_offsets.assert_called_once()
+    assert admin.list_consumer_group_offsets.call_args.args[0][0].group_id == "snuba-consumers"
+    assert result.scans == [
+        TopicConsumerLatency("cluster1", "events", "snuba-consumers", 200.0, partition=0)
+    ]
+    assert result.errors == []
+
+
+@pytest.mark.parametrize("concurrency", list(Concurrency))
+@patch("sentry_kafka_management.actions.latency.consumer_pool.Consumer")
+@patch("sentry_kafka_management.actions.latency.consumer_latency.get_admin_client")
+def test_get_cluster_latency_scans_what_the_sampler_selects(
+    mock_get_admin: MagicMock,
+    mock_consumer_cls: MagicMock,
+    concurrency: Concurrency,
+) -> None:
+    admin = Mock()
+    mock_get_admin.return_value = admin
+    admin.list_consumer_groups.return_value = _make_list_groups_result(
+        valid=[_make_group_listing("group-a"), _make_group_listing("group-b")],
+    )
+    admin.list_consumer_group_offsets.side_effect = lambda partitions: {
+        partitions[0].group_id: _make_committed_offsets_future(
+            partitions[0].group_id,
+            [TopicPartition("topic-a", 0, 50), TopicPartition("topic-a", 1, 50)],
+        )
+    }
+    consumer = mock_consumer_cls.return_value
+    consumer.consume.side_effect = lambda **_kwargs: [
+        _make_message(timestamp=(TIMESTAMP_CREATE_TIME, 800), partition=0)
+    ]
+    sampler = ScanSampler(SamplingPolicy(group_budget=1, max_partitions_per_group=1))
+
+    with patch("time.time", return_value=1.0):
+        result = get_cluster_latency(
+            "cluster1",
+            CLUSTER_CONFIG,
+            topics={"topic-a": _topic_config(partitions=2)},
+            timeout=10,
+            concurrency=concurrency,
+            sampler=sampler,
+        )
+
+    assert result.scans == [
+        TopicConsumerLatency("cluster1", "topic-a", "group-a", 200.0, partition=0)
+    ]
+    admin.list_consumer_group_offsets.assert_called_once()
+    consumer.assign.assert_called_once_with([TopicPartition("topic-a", 0, 50)])
+
+
+@patch("sentry_kafka_management.actions.latency.consumer_pool.Consumer")
+@patch("sentry_kafka_management.actions.latency.consumer_latency.get_admin_client")
+def test_get_cluster_latency_filters_unconfigured_topics(
+    mock_get_admin: MagicMock,
+    mock_consumer_cls: MagicMock,
+) -> None:
+    admin = Mock()
+    mock_get_admin.return_value = admin
+    admin.list_consumer_groups.return_value = _make_list_groups_result(
+        valid=[_make_group_listing("group-a")],
+    )
+    admin.list_consumer_group_offsets.return_value = {
+        "group-a": _make_committed_offsets_future(
+            "group-a",
+            [
+                TopicPartition("topic-a", 0, 50),
+                TopicPartition("other-topic", 0, 100),
+            ],
+        ),
+    }
+
+    consumer = mock_consumer_cls.return_value
+    consumer.consume.return_value = [_make_message(timestamp=(TIMESTAMP_CREATE_TIME, 0))]
+
+    with patch("time.time", return_value=1.0):
+        result = get_cluster_latency(
+            "cluster1", CLUSTER_CONFIG, topics={"topic-a": _topic_config()}, timeout=10
+        )
+
+    assert [scan.topic_name for scan in result.scans] == ["topic-a"]
+    assert len(result.errors) == 0
+    for call in consumer.assign.call_args_list:
+        for assigned in call.args[0]:
+            assert assigned.topic == "topic-a"
+
+
+@patch("sentry_kafka_management.actions.latency.consumer_pool.Consumer")
+@patch("sentry_kafka_management.actions.latency.consumer_latency.get_admin_client")
+def test_get_cluster_latency_reports_latency_per_partition(
+    mock_get_admin: MagicMock,
+    mock_consumer_cls: MagicMock,
+) -> None:
+    admin = Mock()
+    mock_get_admin.return_value = admin
+    admin.list_consumer_groups.return_value = _make_list_groups_result(
+        valid=[_make_group_listing("group-a")],
+    )
+    admin.list_consumer_group_offsets.return_value = {
+        "group-a": _make_committed_offsets_future(
+            "group-a",
+            [
+                TopicPartition("topic-a", 0, 50),
+                TopicPartition("topic-a", 1, 50),
+            ],
+        ),
+    }
+
+    consumer = mock_consumer_cls.return_value
+    consumer.consume.side_effect = [
+        [_make_message(timestamp=(TIMESTAMP_CREATE_TIME, 800), partition=0)],
+        [_make_message(timestamp=(TIMESTAMP_CREATE_TIME, 0), partition=1)],
+    ]
+
+    with patch("time.time", return_value=1.0):
+        result = get_cluster_latency(
+            "cluster1",
+            CLUSTER_CONFIG,
+            topics={"topic-a": _topic_config(partitions=1)},
+            timeout=10,
+        )
+
+    assert result.scans == [
+        TopicConsumerLatency(
+            cluster_name="cluster1",
+            group_id="group-a",
+            topic_name="topic-a",
+            latency_ms=200.0,
+            partition=0,
+        ),
+        TopicConsumerLatency(
+            cluster_name="cluster1",
+            group_id="group-a",
+            topic_name="topic-a",
+            latency_ms=1000.0,
+            partition=1,
+        ),
+    ]
+    assert len(result.errors) == 0
+
+
+@pytest.mark.parametrize("concurrency", list(Concurrency))
+@patch("sentry_kafka_management.actions.latency.consumer_pool.Consumer")
+@patch("sentry_kafka_management.actions.latency.consumer_latency.get_admin_client")
+def test_get_cluster_latency_records_scan_stats(
+    mock_get_admin: MagicMock,
+    mock_consumer_cls: MagicMock,
+    concurrency: Concurrency,
+) -> None:
+    admin = Mock()
+    mock_get_admin.return_value = admin
+    admin.list_consumer_groups.return_value = _make_list_groups_result(
+        valid=[_make_group_listing("group-a"), _make_group_listing("group-b")],
+    )
+    admin.list_consumer_group_offsets.side_effect = lambda partitions: {
+        group_id: _make_committed_offsets_future(
+            group_id,
+            [TopicPartition("topic-a", 0, 50), TopicPartition("topic-a", 1, 50)],
+        )
+        for group_id in [partitions[0].group_id]
+    }
+    admin.list_offsets.return_value = {
+        TopicPartition("topic-a", 0): _make_list_offsets_future(60),
+        TopicPartition("topic-a", 1): _make_list_offsets_future(50),
+    }
+
+    consumer = mock_consumer_cls.return_value
+    consumer.consume.side_effect = [
+        [_make_message(error=KafkaError(KafkaError.REQUEST_TIMED_OUT, "request timed out"))],
+        [_make_message(timestamp=(TIMESTAMP_CREATE_TIME, 800), partition=0)],
+    ]
+    stats = ScanStats()
+
+    with patch("time.time", return_value=1.0):
+        result = get_cluster_latency(
+            "cluster1",
+            CLUSTER_CONFIG,
+            topics={"topic-a": _topic_config(partitions=2)},
+            timeout=10,
+            scan_engine=ScanEngine.LIST_OFFSETS,
+            concurrency=concurrency,
+            stats=stats,
+        )
+
+    assert result.errors == []
+    assert stats.groups == 2
+    assert stats.partitions == 4
+    # One ListConsumerGroups, one OffsetFetch per group and one ListOffsets.
+    assert stats.admin_requests == 4
+    assert stats.polls == 2
+    assert stats.retryable_errors == 1
+    assert stats.timeouts == 0
+    assert stats.consumers_created == 1
+    assert stats.consumers_closed == 1
+    assert set(stats.phase_durations) == set(ScanPhase)
+    assert stats.duration >= stats.phase_durations[ScanPhase.READ_PARTITIONS]
+
+
+@pytest.mark.parametrize("concurrency", list(Concurrency))
+@patch("sentry_kafka_management.actions.latency.consumer_pool.Consumer")
+@patch("sentry_kafka_management.actions.latency.consumer_latency.get_admin_client")
+def test_get_cluster_latency_backs_off_limiter_on_timeouts(
+    mock_get_admin: MagicMock,
+    mock_consumer_cls: MagicMock,
+    concurrency: Concurrency,
+) -> None:
+    admin = Mock()
+    mock_get_admin.return_value = admin
+    admin.list_consumer_groups.return_value = _make_list_groups_result(
+        valid=[_make_group_listing("group-a")],
+    )
+    admin.list_consumer_group_offsets.return_value = {
+        "group-a": _make_committed_offsets_future("group-a", [TopicPartition("topic-a", 0, 50)]),
+    }
+    mock_consumer_cls.return_value.consume.return_value = []
+    limiter = AimdLimiter(max_limit=8)
+    stats = ScanStats()
+
+    result = get_cluster_latency(
+        "cluster1",
+        CLUSTER_CONFIG,
+        topics={"topic-a": _topic_config(partitions=1)},
+        timeout=0,
+        max_workers=8,
+        concurrency=concurrency,
+        stats=stats,
+        limiter=limiter,
+    )
+
+    assert isinstance(result.errors[0], TimeoutError)
+    assert limiter.limit == 4
+    assert stats.concurrency_limit == 4
+    assert limiter.try_acquire() is not None
+
+
+def test_scan_partition_latencies_counts_timeouts_in_stats() -> None:
+    consumer = Mock()
+    consumer.consume.return_value = []
+    stats = ScanStats()
+
+    _, errors = scan_partition_latencies(
+        consumer, [_scan(partition=0), _scan(partition=1)], 0, stats=stats
+    )
 
-    assert mock_get_cluster_latency.call_count == 1
-    assert len(result.scans) == 1
+    assert len(errors) == 2
+    assert stats.timeouts == 2
+    assert stats.polls == 0
 
 
-@patch("sentry_kafka_management.actions.latency.consumer_latency.Consumer")
+@patch("sentry_kafka_management.actions.latency.consumer_latency.ThreadPoolExecutor")
+@patch("sentry_kafka_management.actions.latency.consumer_pool.Consumer")
 @patch("sentry_kafka_management.actions.latency.consumer_latency.get_admin_client")
-def test_get_cluster_latency_skips_own_consumer_group(
+def test_get_cluster_latency_asyncio_scans_batches_on_event_loop(
     mock_get_admin: MagicMock,
     mock_consumer_cls: MagicMock,
+    mock_executor_cls: MagicMock,
 ) -> None:
     admin = Mock()
     mock_get_admin.return_value = admin
-    own_group = "consumer-latency-group-cluster1"
     admin.list_consumer_groups.return_value = _make_list_groups_result(
-        valid=[_make_group_listing(own_group)],
+        valid=[_make_group_listing("group-a")],
     )
+    admin.list_consumer_group_offsets.return_value = {
+        "group-a": _make_committed_offsets_future(
+            "group-a",
+            [TopicPartition("topic-a", 0, 50), TopicPartition("topic-a", 1, 50)],
+        ),
+    }
+    consumer = mock_consumer_cls.return_value
+    consumer.consume.side_effect = [
+        [_make_message(timestamp=(TIMESTAMP_CREATE_TIME, 800), partition=0)],
+        [_make_message(timestamp=(TIMESTAMP_CREATE_TIME, 0), partition=1)],
+    ]
 
-    result = get_cluster_latency(
-        "cluster1", CLUSTER_CONFIG, topics={"topic-a": _topic_config()}, timeout=10
-    )
+    with patch("time.time", return_value=1.0):
+        result = get_cluster_latency(
+            "cluster1",
+            CLUSTER_CONFIG,
+            topics={"topic-a": _topic_config()},
+            timeout=10,
+            concurrency=Concurrency.ASYNCIO,
+        )
 
-    assert result.scans == []
-    assert len(result.errors) == 0
-    admin.list_consumer_group_offsets.assert_not_called()
-    mock_consumer_cls.assert_not_called()
+    assert sorted(result.scans, key=lambda scan: scan.partition) == [
+        TopicConsumerLatency("cluster1", "topic-a", "group-a", 200.0, partition=0),
+        TopicConsumerLatency("cluster1", "topic-a", "group-a", 1000.0, partition=1),
+    ]
+    assert result.errors == []
+    assert [c.kwargs for c in consumer.consume.call_args_list] == [
+        {"num_messages": 2, "timeout": 0},
+        {"num_messages": 1, "timeout": 0},
+    ]
+    mock_executor_cls.assert_not_called()
 
 
-@patch("sentry_kafka_management.actions.latency.consumer_latency.Consumer")
+@pytest.mark.parametrize("concurrency", list(Concurrency))
+@patch("sentry_kafka_management.actions.latency.consumer_pool.Consumer")
 @patch("sentry_kafka_management.actions.latency.consumer_latency.get_admin_client")
-def test_get_cluster_latency_filters_unconfigured_topics(
+def test_get_cluster_latency_streams_each_batch_to_on_scans(
     mock_get_admin: MagicMock,
     mock_consumer_cls: MagicMock,
+    concurrency: Concurrency,
 ) -> None:
     admin = Mock()
     mock_get_admin.return_value = admin
     admin.list_consumer_groups.return_value = _make_list_groups_result(
-        valid=[_make_group_listing("group-a")],
+        valid=[_make_group_listing("group-a"), _make_group_listing("group-b")],
     )
-    admin.list_consumer_group_offsets.return_value = {
-        "group-a": _make_committed_offsets_future(
-            "group-a",
-            [
-                TopicPartition("topic-a", 0, 50),
-                TopicPartition("other-topic", 0, 100),
-            ],
-        ),
+    # The two groups sit at different offsets of one partition, so they are read in
+    # separate batches.
+    admin.list_consumer_group_offsets.side_effect = lambda reqs: {
+        reqs[0].group_id: _make_committed_offsets_future(
+            reqs[0].group_id,
+            [TopicPartition("topic-a", 0, 50 if reqs[0].group_id == "group-a" else 60)],
+        )
     }
-
-    consumer = mock_consumer_cls.return_value
-    consumer.poll.return_value = _make_message(timestamp=(TIMESTAMP_CREATE_TIME, 0))
+    mock_consumer_cls.return_value.consume.side_effect = lambda **_kwargs: [
+        _make_message(timestamp=(TIMESTAMP_CREATE_TIME, 800))
+    ]
+    streamed: list[list[TopicConsumerLatency]] = []
 
     with patch("time.time", return_value=1.0):
         result = get_cluster_latency(
-            "cluster1", CLUSTER_CONFIG, topics={"topic-a": _topic_config()}, timeout=10
+            "cluster1",
+            CLUSTER_CONFIG,
+            topics={"topic-a": _topic_config()},
+            timeout=10,
+            concurrency=concurrency,
+            on_scans=streamed.append,
         )
 
-    assert [scan.topic_name for scan in result.scans] == ["topic-a"]
-    assert len(result.errors) == 0
-    for call in consumer.assign.call_args_list:
-        for assigned in call.args[0]:
-            assert assigned.topic == "topic-a"
+    assert result.scans == []
+    assert result.errors == []
+    assert sorted([scan.group_id for scan in batch] for batch in streamed) == [
+        ["group-a"],
+        ["group-b"],
+    ]
 
 
-@patch("sentry_kafka_management.actions.latency.consumer_latency.Consumer")
+@patch("sentry_kafka_management.actions.latency.consumer_pool.Consumer")
 @patch("sentry_kafka_management.actions.latency.consumer_latency.get_admin_client")
-def test_get_cluster_latency_reports_latency_per_partition(
+def test_get_cluster_latency_reads_shared_offsets_once(
     mock_get_admin: MagicMock,
     mock_consumer_cls: MagicMock,
 ) -> None:
     admin = Mock()
     mock_get_admin.return_value = admin
     admin.list_consumer_groups.return_value = _make_list_groups_result(
-        valid=[_make_group_listing("group-a")],
+        valid=[_make_group_listing("group-a"), _make_group_listing("group-b")],
     )
-    admin.list_consumer_group_offsets.return_value = {
-        "group-a": _make_committed_offsets_future(
-            "group-a",
-            [
-                TopicPartition("topic-a", 0, 50),
-                TopicPartition("topic-a", 1, 50),
-            ],
-        ),
+    admin.list_consumer_group_offsets.side_effect = lambda reqs: {
+        reqs[0].group_id: _make_committed_offsets_future(
+            reqs[0].group_id, [TopicPartition("topic-a", 0, 50)]
+        )
     }
 
     consumer = mock_consumer_cls.return_value
-    consumer.poll.side_effect = [
-        _make_message(timestamp=(TIMESTAMP_CREATE_TIME, 800), partition=0),
-        _make_message(timestamp=(TIMESTAMP_CREATE_TIME, 0), partition=1),
-    ]
+    consumer.consume.return_value = [_make_message(timestamp=(TIMESTAMP_CREATE_TIME, 800))]
 
     with patch("time.time", return_value=1.0):
         result = get_cluster_latency(
-            "cluster1",
-            CLUSTER_CONFIG,
-            topics={"topic-a": _topic_config(partitions=1)},
-            timeout=10,
+            "cluster1", CLUSTER_CONFIG, topics={"topic-a": _topic_config()}, timeout=10
         )
 
     assert result.scans == [
-        TopicConsumerLatency(
-            cluster_name="cluster1",
-            group_id="group-a",
-            topic_name="topic-a",
-            latency_ms=200.0,
-            partition=0,
-        ),
-        TopicConsumerLatency(
-            cluster_name="cluster1",
-            group_id="group-a",
-            topic_name="topic-a",
-            latency_ms=1000.0,
-            partition=1,
-        ),
+        TopicConsumerLatency("cluster1", "topic-a", "group-a", 200.0, partition=0),
+        TopicConsumerLatency("cluster1", "topic-a", "group-b", 200.0, partition=0),
     ]
     assert len(result.errors) == 0
+    mock_consumer_cls.assert_called_once()
+    consumer.consume.assert_called_once()
 
 
 @patch("sentry_kafka_management.actions.latency.consumer_latency.ThreadPoolExecutor")
-@patch("sentry_kafka_management.actions.latency.consumer_latency.Consumer")
+@patch("sentry_kafka_management.actions.latency.consumer_pool.Consumer")
 @patch("sentry_kafka_management.actions.latency.consumer_latency.get_admin_client")
 def test_get_cluster_latency_caps_scan_workers(
     mock_get_admin: MagicMock,
@@ -548,7 +1280,7 @@ def test_get_cluster_latency_caps_scan_workers(
     }
 
     consumer = mock_consumer_cls.return_value
-    consumer.poll.return_value = _make_message(timestamp=(TIMESTAMP_CREATE_TIME, 800))
+    consumer.consume.return_value = [_make_message(timestamp=(TIMESTAMP_CREATE_TIME, 800))]
 
     executor = MagicMock()
     mock_executor_cls.return_value.__enter__.return_value = executor
@@ -585,7 +1317,62 @@ def test_get_cluster_latency_caps_scan_workers(
     assert scan_call.kwargs["max_workers"] == 4
 
 
-@patch("sentry_kafka_management.actions.latency.consumer_latency.Consumer")
+@pytest.mark.parametrize("limiter_max, max_in_flight, expected_peak", [(None, 3, 3), (2, 4, 2)])
+def test_scan_partition_batches_submits_within_window(
+    limiter_max: int | None, max_in_flight: int, expected_peak: int
+) -> None:
+    """Test a cluster only submits batches it has room for to a shared executor."""
+    limiter = AimdLimiter(limiter_max, latency_target=10.0) if limiter_max is not None else None
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def read_batch(*args: object) -> ConsumerLatencyResult:
+        nonlocal running, peak
+        *_, batch_limiter, acquired = args
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+        if limiter is not None:
+            assert batch_limiter is limiter and isinstance(acquired, float)
+            limiter.release(acquired)
+        return ConsumerLatencyResult(scans=[], errors=[ValueError("batch read")])
+
+    with (
+        patch(
+            "sentry_kafka_management.actions.latency.consumer_latency.get_partition_batch_latency",
+            read_batch,
+        ),
+        ThreadPoolExecutor(max_workers=8) as executor,
+    ):
+        result = scan_partition_batches(
+            executor,
+            Mock(),
+            "cluster1",
+            [[_scan(partition=p)] for p in range(6)],
+            timeout=10,
+            max_in_flight=max_in_flight,
+            limiter=limiter,
+        )
+
+    assert len(result.errors) == 6
+    assert peak == expected_peak
+
+
+def test_get_partition_batch_latency_gives_back_unused_limiter_slot() -> None:
+    limiter = AimdLimiter(max_limit=1)
+    acquired = limiter.try_acquire()
+
+    get_partition_batch_latency(Mock(), "cluster1", [], 10, limiter=limiter, acquired=acquired)
+
+    assert limiter.try_acquire() is not None
+    assert limiter.limit == 1
+
+
+@patch("sentry_kafka_management.actions.latency.consumer_pool.Consumer")
 @patch("sentry_kafka_management.actions.latency.consumer_latency.get_admin_client")
 def test_get_cluster_latency_skips_uncommitted_partitions(
     mock_get_admin: MagicMock,
@@ -604,9 +1391,11 @@ def test_get_cluster_latency_skips_uncommitted_partitions(
     }
 
     consumer = mock_consumer_cls.return_value
-    consumer.poll.return_value = _make_message(
-        error=KafkaError(KafkaError._PARTITION_EOF, "reached end of partition"),
-    )
+    consumer.consume.return_value = [
+        _make_message(
+            error=KafkaError(KafkaError._PARTITION_EOF, "reached end of partition"),
+        )
+    ]
 
     result = get_cluster_latency(
         "cluster1",
@@ -628,7 +1417,7 @@ def test_get_cluster_latency_skips_uncommitted_partitions(
     consumer.assign.assert_called_once()
 
 
-@patch("sentry_kafka_management.actions.latency.consumer_latency.Consumer")
+@patch("sentry_kafka_management.actions.latency.consumer_pool.Consumer")
 @patch("sentry_kafka_management.actions.latency.consumer_latency.get_admin_client")
 def test_get_cluster_latency_skips_groups_with_no_matching_topics(
     mock_get_admin: MagicMock,
@@ -652,10 +1441,10 @@ def test_get_cluster_latency_skips_groups_with_no_matching_topics(
 
     assert result.scans == []
     assert len(result.errors) == 0
-    mock_consumer_cls.return_value.poll.assert_not_called()
+    mock_consumer_cls.return_value.consume.assert_not_called()
 
 
-@patch("sentry_kafka_management.actions.latency.consumer_latency.Consumer")
+@patch("sentry_kafka_management.actions.latency.consumer_pool.Consumer")
 @patch("sentry_kafka_management.actions.latency.consumer_latency.get_admin_client")
 def test_get_cluster_latency_closes_consumer_on_error(
     mock_get_admin: MagicMock,
@@ -677,7 +1466,7 @@ def test_get_cluster_latency_closes_consumer_on_error(
     mock_consumer_cls.assert_not_called()
 
 
-@patch("sentry_kafka_management.actions.latency.consumer_latency.Consumer")
+@patch("sentry_kafka_management.actions.latency.consumer_pool.Consumer")
 @patch("sentry_kafka_management.actions.latency.consumer_latency.get_admin_client")
 def test_get_cluster_latency_continues_after_committed_offsets_error(
     mock_get_admin: MagicMock,
@@ -702,7 +1491,7 @@ def test_get_cluster_latency_continues_after_committed_offsets_error(
     admin.list_consumer_group_offsets.side_effect = list_offsets
 
     consumer = mock_consumer_cls.return_value
-    consumer.poll.return_value = _make_message(timestamp=(TIMESTAMP_CREATE_TIME, 800))
+    consumer.consume.return_value = [_make_message(timestamp=(TIMESTAMP_CREATE_TIME, 800))]
 
     with patch("time.time", return_value=1.0):
         result = get_cluster_latency(
@@ -723,7 +1512,7 @@ def test_get_cluster_latency_continues_after_committed_offsets_error(
     mock_consumer_cls.return_value.close.assert_called_once()
 
 
-@patch("sentry_kafka_management.actions.latency.consumer_latency.Consumer")
+@patch("sentry_kafka_management.actions.latency.consumer_pool.Consumer")
 @patch("sentry_kafka_management.actions.latency.consumer_latency.get_admin_client")
 def test_get_cluster_latency_continues_after_partition_latency_error(
     mock_get_admin: MagicMock,
@@ -745,9 +1534,9 @@ def test_get_cluster_latency_continues_after_partition_latency_error(
     }
 
     consumer = mock_consumer_cls.return_value
-    consumer.poll.side_effect = [
-        _make_message(timestamp=(TIMESTAMP_CREATE_TIME, 800), partition=0),
-        _make_message(error=KafkaError(KafkaError.UNKNOWN, "fetch failed"), partition=1),
+    consumer.consume.side_effect = [
+        [_make_message(timestamp=(TIMESTAMP_CREATE_TIME, 800), partition=0)],
+        [_make_message(error=KafkaError(KafkaError.UNKNOWN, "fetch failed"), partition=1)],
     ]
 
     with patch("time.time", return_value=1.0):
@@ -772,7 +1561,7 @@ def test_get_cluster_latency_continues_after_partition_latency_error(
     ]
 
 
-@patch("sentry_kafka_management.actions.latency.consumer_latency.Consumer")
+@patch("sentry_kafka_management.actions.latency.consumer_pool.Consumer")
 @patch("sentry_kafka_management.actions.latency.consumer_latency.get_admin_client")
 def test_get_cluster_latency_uses_per_topic_retention_when_aged_out(
     mock_get_admin: MagicMock,
@@ -792,17 +1581,21 @@ def test_get_cluster_latency_uses_per_topic_retention_when_aged_out(
             ],
         ),
     }
-    mock_consumer_cls.return_value.poll.side_effect = [
-        _make_message(
-            error=KafkaError(KafkaError._AUTO_OFFSET_RESET, "Offset out of range"),
-            topic="topic-short",
-            partition=0,
-        ),
-        _make_message(
-            error=KafkaError(KafkaError._AUTO_OFFSET_RESET, "Offset out of range"),
-            topic="topic-long",
-            partition=0,
-        ),
+    mock_consumer_cls.return_value.consume.side_effect = [
+        [
+            _make_message(
+                error=KafkaError(KafkaError._AUTO_OFFSET_RESET, "Offset out of range"),
+                topic="topic-short",
+                partition=0,
+            )
+        ],
+        [
+            _make_message(
+                error=KafkaError(KafkaError._AUTO_OFFSET_RESET, "Offset out of range"),
+                topic="topic-long",
+                partition=0,
+            )
+        ],
     ]
 
     result = get_cluster_latency(
@@ -822,7 +1615,7 @@ def test_get_cluster_latency_uses_per_topic_retention_when_aged_out(
     }
 
 
-@patch("sentry_kafka_management.actions.latency.consumer_latency.Consumer")
+@patch("sentry_kafka_management.actions.latency.consumer_pool.Consumer")
 @patch("sentry_kafka_management.actions.latency.consumer_latency.get_admin_client")
 def test_get_cluster_latency_uses_default_retention_when_unset(
     mock_get_admin: MagicMock,
@@ -839,11 +1632,13 @@ def test_get_cluster_latency_uses_default_retention_when_unset(
             [TopicPartition("topic-no-retention", 0, 5)],
         ),
     }
-    mock_consumer_cls.return_value.poll.return_value = _make_message(
-        error=KafkaError(KafkaError._AUTO_OFFSET_RESET, "Offset out of range"),
-        topic="topic-no-retention",
-        partition=0,
-    )
+    mock_consumer_cls.return_value.consume.return_value = [
+        _make_message(
+            error=KafkaError(KafkaError._AUTO_OFFSET_RESET, "Offset out of range"),
+            topic="topic-no-retention",
+            partition=0,
+        )
+    ]
     no_retention_topic = TopicConfig(
         partitions=1,
         placement=1,
@@ -896,18 +1691,23 @@ def test_record_consumer_group_latency_emits_one_histogram_per_scan(
             ],
         ),
     }
-    mock_get_cluster_latency.side_effect = lambda name, *a, **k: cluster_results[name]
+    mock_get_cluster_latency.side_effect = lambda name, *a, **k: _stream(cluster_results[name], **k)
     metrics = FakeMetricsBackend()
 
     result = record_consumer_group_latency(config, metrics)
 
     assert len(result.scans) == 3
     assert len(result.errors) == 0
-    assert [latency for _, latency, _ in metrics.histograms] == [100.0, 200.0, 50.0]
-    cluster_tags = [tags["cluster"] for _, _, tags in metrics.histograms if tags]
-    assert cluster_tags == ["cluster1", "cluster1", "cluster2"]
-    partition_tags = [tags["partition"] for _, _, tags in metrics.histograms if tags]
-    assert partition_tags == ["0", "1", "2"]
+    emitted = sorted(
+        (tags["cluster"], tags["partition"], latency)
+        for _, latency, tags in metrics.histograms
+        if tags
+    )
+    assert emitted == [
+        ("cluster1", "0", 100.0),
+        ("cluster1", "1", 200.0),
+        ("cluster2", "2", 50.0),
+    ]
 
 
 @patch("sentry_kafka_management.actions.latency.consumer_latency.get_cluster_latency")
@@ -920,8 +1720,11 @@ def test_record_consumer_group_latency_scans_only_selected_clusters(
         "cluster2": CLUSTER_CONFIG,
     }
     config.get_topics_config.return_value = {"topic-a": {}}
-    mock_get_cluster_latency.side_effect = lambda name, *a, **k: ConsumerLatencyResult(
-        scans=[TopicConsumerLatency(name, "topic-a", "group-a", 1.0, partition=0)],
+    mock_get_cluster_latency.side_effect = lambda name, *a, **k: _stream(
+        ConsumerLatencyResult(
+            scans=[TopicConsumerLatency(name, "topic-a", "group-a", 1.0, partition=0)],
+        ),
+        **k,
     )
     metrics = FakeMetricsBackend()
 
@@ -992,20 +1795,19 @@ def test_record_consumer_group_latency_emits_good_clusters_with_errors(
             errors=[KafkaException("boom")],
         ),
     }
-    mock_get_cluster_latency.side_effect = lambda name, *a, **k: cluster_results[name]
+    mock_get_cluster_latency.side_effect = lambda name, *a, **k: _stream(cluster_results[name], **k)
     metrics = FakeMetricsBackend()
 
     result = record_consumer_group_latency(config, metrics)
 
     assert result.errors is not None
     assert len(result.errors) == 1
-    assert result.scans == [
+    assert sorted(result.scans, key=lambda scan: scan.cluster_name) == [
         TopicConsumerLatency("cluster1", "topic-a", "group-a", 100.0, partition=0),
         TopicConsumerLatency("cluster2", "topic-b", "group-b", 50.0, partition=1),
     ]
-    assert [latency for _, latency, _ in metrics.histograms] == [100.0, 50.0]
-    cluster_tags = [tags["cluster"] for _, _, tags in metrics.histograms if tags]
-    assert cluster_tags == ["cluster1", "cluster2"]
+    emitted = sorted((tags["cluster"], latency) for _, latency, tags in metrics.histograms if tags)
+    assert emitted == [("cluster1", 100.0), ("cluster2", 50.0)]
 
 
 @patch("sentry_kafka_management.actions.latency.consumer_latency.get_cluster_latency")
@@ -1027,7 +1829,7 @@ def test_record_consumer_group_latency_emits_good_clusters_on_total_cluster_fail
         ),
         "cluster2": ConsumerLatencyResult(scans=[], errors=[KafkaException("cluster unreachable")]),
     }
-    mock_get_cluster_latency.side_effect = lambda name, *a, **k: cluster_results[name]
+    mock_get_cluster_latency.side_effect = lambda name, *a, **k: _stream(cluster_results[name], **k)
     metrics = FakeMetricsBackend()
 
     result = record_consumer_group_latency(config, metrics)
@@ -1038,3 +1840,227 @@ def test_record_consumer_group_latency_emits_good_clusters_on_total_cluster_fail
         TopicConsumerLatency("cluster1", "topic-a", "group-a", 100.0, partition=0),
     ]
     assert [latency for _, latency, _ in metrics.histograms] == [100.0]
+
+
+@patch("sentry_kafka_management.actions.latency.consumer_latency.get_cluster_latency")
+def test_record_consumer_group_latency_reuses_consumer_pools_across_calls(
+    mock_get_cluster_latency: MagicMock,
+) -> None:
+    config = Mock()
+    config.get_clusters.return_value = {"cluster1": CLUSTER_CONFIG}
+    config.get_topics_config.return_value = {"topic-a": {}}
+    mock_get_cluster_latency.return_value = ConsumerLatencyResult(scans=[])
+    consumer_pools: dict[str, ConsumerPool] = {}
+
+    record_consumer_group_latency(config, FakeMetricsBackend(), consumer_pools=consumer_pools)
+    record_consumer_group_latency(config, FakeMetricsBackend(), consumer_pools=consumer_pools)
+
+    assert list(consumer_pools) == ["cluster1"]
+    pools = [call.args[6] for call in mock_get_cluster_latency.call_args_list]
+    assert pools == [consumer_pools["cluster1"], consumer_pools["cluster1"]]
+
+
+@patch("sentry_kafka_management.actions.latency.consumer_pool.Consumer")
+@patch("sentry_kafka_management.actions.latency.consumer_latency.get_admin_client")
+def test_get_cluster_latency_skips_reading_cached_offsets(
+    mock_get_admin: MagicMock,
+    mock_consumer_cls: MagicMock,
+) -> None:
+    admin = Mock()
+    mock_get_admin.return_value = admin
+    admin.list_consumer_groups.return_value = _make_list_groups_result(
+        valid=[_make_group_listing("group-a")],
+    )
+    admin.list_consumer_group_offsets.return_value = {
+        "group-a": _make_committed_offsets_future("group-a", [TopicPartition("topic-a", 0, 50)]),
+    }
+    admin.list_offsets.return_value = {TopicPartition("topic-a", 0): _make_list_offsets_future(60)}
+    consumer = mock_consumer_cls.return_value
+    consumer.consume.return_value = [_make_message(timestamp=(TIMESTAMP_CREATE_TIME, 800))]
+    timestamp_cache = OffsetTimestampCache()
+
+    with patch("time.time", return_value=1.0):
+        first = get_cluster_latency(
+            "cluster1",
+            CLUSTER_CONFIG,
+            topics={"topic-a": _topic_config()},
+            timeout=10,
+            timestamp_cache=timestamp_cache,
+        )
+    with patch("time.time", return_value=2.0):
+        second = get_cluster_latency(
+            "cluster1",
+            CLUSTER_CONFIG,
+            topics={"topic-a": _topic_config()},
+            timeout=10,
+            timestamp_cache=timestamp_cache,
+        )
+
+    assert [scan.latency_ms for scan in first.scans] == [200.0]
+    assert [scan.latency_ms for scan in second.scans] == [1200.0]
+    assert timestamp_cache.get("cluster1", "topic-a", 0, 50) == 800
+    consumer.consume.assert_called_once()
+
+
+@patch("sentry_kafka_management.actions.latency.consumer_pool.Consumer")
+@patch("sentry_kafka_management.actions.latency.consumer_latency.get_admin_client")
+def test_get_cluster_latency_reports_offset_lag_of_cached_offsets(
+    mock_get_admin: MagicMock,
+    mock_consumer_cls: MagicMock,
+) -> None:
+    admin = Mock()
+    mock_get_admin.return_value = admin
+    admin.list_consumer_groups.return_value = _make_list_groups_result(
+        valid=[_make_group_listing("group-a")],
+    )
+    admin.list_consumer_group_offsets.return_value = {
+        "group-a": _make_committed_offsets_future("group-a", [TopicPartition("topic-a", 0, 100)]),
+    }
+    admin.list_offsets.return_value = {
+        TopicPartition("topic-a", 0): _make_list_offsets_future(950),
+    }
+    consumer = mock_consumer_cls.return_value
+    consumer.consume.return_value = [_make_message(timestamp=(TIMESTAMP_CREATE_TIME, 800))]
+    consumer.get_watermark_offsets.return_value = (0, 900)
+    timestamp_cache = OffsetTimestampCache()
+
+    first, second = [
+        get_cluster_latency(
+            "cluster1",
+            CLUSTER_CONFIG,
+            topics={"topic-a": _topic_config()},
+            timeout=10,
+            timestamp_cache=timestamp_cache,
+        )
+        for _ in range(2)
+    ]
+
+    # The stalled group is only read once, and its lag is looked up once it is cached.
+    assert [(scan.offset_lag, scan.high_watermark) for scan in first.scans] == [(800, 900)]
+    assert [(scan.offset_lag, scan.high_watermark) for scan in second.scans] == [(850, 950)]
+    consumer.consume.assert_called_once()
+    (requested,) = admin.list_offsets.call_args.args
+    assert set(requested) == {TopicPartition("topic-a", 0)}
+    admin.list_offsets.assert_called_once()
+
+
+def test_scan_partition_latencies_reports_message_timestamps() -> None:
+    consumer = Mock()
+    consumer.consume.side_effect = [
+        [_make_message(timestamp=(TIMESTAMP_CREATE_TIME, 10), partition=0)],
+        [
+            _make_message(
+                error=KafkaError(KafkaError._PARTITION_EOF, "reached end of partition"), partition=1
+            )
+        ],
+    ]
+    seen: list[tuple[int, int]] = []
+
+    scans = [_scan(partition=0), _scan(partition=1)]
+    with patch("time.time", return_value=1.0):
+        scan_partition_latencies(
+            consumer,
+            scans,
+            timeout=10,
+            on_timestamp=lambda scan, ts_ms: seen.append((scan.partition, ts_ms)),
+        )
+
+    assert seen == [(0, 10)]
+
+
+def test_get_high_watermarks_skips_failed_partitions() -> None:
+    admin = Mock()
+    admin.list_offsets.return_value = {
+        TopicPartition("topic-a", 0): _make_list_offsets_future(100),
+        TopicPartition("topic-a", 1): _make_errored_committed_offsets_future(
+            KafkaException("boom")
+        ),
+    }
+
+    high_watermarks = get_high_watermarks(admin, {("topic-a", 0), ("topic-a", 1)}, timeout=10)
+
+    assert high_watermarks == {("topic-a", 0): 100}
+    admin.list_offsets.assert_called_once()
+
+
+def test_get_high_watermarks_skips_request_without_partitions() -> None:
+    admin = Mock()
+
+    assert get_high_watermarks(admin, set(), timeout=10) == {}
+    admin.list_offsets.assert_not_called()
+
+
+def test_split_caught_up_partitions() -> None:
+    committed_by_group = {
+        "group-a": [TopicPartition("topic-a", 0, 100), TopicPartition("topic-a", 1, 40)],
+        "group-b": [TopicPartition("topic-a", 2, 7)],
+    }
+
+    caught_up, lagging = split_caught_up_partitions(
+        "cluster1", committed_by_group, {("topic-a", 0): 100, ("topic-a", 1): 50}
+    )
+
+    assert caught_up == [
+        TopicConsumerLatency(
+            "cluster1", "topic-a", "group-a", 0.0, partition=0, offset_lag=0, high_watermark=100
+        )
+    ]
+    assert lagging == {
+        "group-a": [TopicPartition("topic-a", 1, 40)],
+        "group-b": [TopicPartition("topic-a", 2, 7)],
+    }
+
+
+@patch("sentry_kafka_management.actions.latency.consumer_pool.Consumer")
+@patch("sentry_kafka_management.actions.latency.consumer_latency.get_admin_client")
+def test_get_cluster_latency_list_offsets_engine_only_reads_lagging_partitions(
+    mock_get_admin: MagicMock,
+    mock_consumer_cls: MagicMock,
+) -> None:
+    admin = Mock()
+    mock_get_admin.return_value = admin
+    admin.list_consumer_groups.return_value = _make_list_groups_result(
+        valid=[_make_group_listing("group-a")],
+    )
+    admin.list_consumer_group_offsets.return_value = {
+        "group-a": _make_committed_offsets_future(
+            "group-a",
+            [
+                TopicPartition("topic-a", 0, 100),
+                TopicPartition("topic-a", 1, 40),
+                TopicPartition("other-topic", 0, 1),
+            ],
+        ),
+    }
+    admin.list_offsets.return_value = {
+        TopicPartition("topic-a", 0): _make_list_offsets_future(100),
+        TopicPartition("topic-a", 1): _make_list_offsets_future(50),
+    }
+    consumer = mock_consumer_cls.return_value
+    consumer.consume.return_value = [
+        _make_message(timestamp=(TIMESTAMP_CREATE_TIME, 800), partition=1)
+    ]
+
+    with patch("time.time", return_value=1.0):
+        result = get_cluster_latency(
+            "cluster1",
+            CLUSTER_CONFIG,
+            topics={"topic-a": _topic_config(partitions=2)},
+            timeout=10,
+            scan_engine=ScanEngine.LIST_OFFSETS,
+        )
+
+    # The lagging partition's offset lag comes from the same ListOffsets lookup.
+    assert result.scans == [
+        TopicConsumerLatency(
+            "cluster1", "topic-a", "group-a", 0.0, partition=0, offset_lag=0, high_watermark=100
+        ),
+        TopicConsumerLatency(
+            "cluster1", "topic-a", "group-a", 200.0, partition=1, offset_lag=10, high_watermark=50
+        ),
+    ]
+    assert len(result.errors) == 0
+    (requested,) = admin.list_offsets.call_args.args
+    assert set(requested) == {TopicPartition("topic-a", 0), TopicPartition("topic-a", 1)}
+    (assigned,) = consumer.assign.call_args.args
+    assert assigned == [TopicPartition("topic-a", 1, 40)]
@@ -0,0 +1,99 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sentry_kafka_management.actions.latency.consumer_pool import (
+    ConsumerPool,
+    ConsumerPoolStats,
+)
+
+CONSUMER_CONFIG = {"bootstrap.servers": "broker1:9092", "group.id": "group-a"}
+
+
+@patch("sentry_kafka_management.actions.latency.consumer_pool.Consumer")
+def test_consumer_pool_reuses_returned_consumers(mock_consumer_cls: MagicMock) -> None:
+    pool = ConsumerPool(CONSUMER_CONFIG, max_size=2)
+
+    with pool.acquire() as first:
+        pass
+    with pool.acquire() as second:
+        pass
+
+    assert first is second
+    mock_consumer_cls.assert_called_once_with(CONSUMER_CONFIG)
+    assert first.unassign.call_count == 2
+    first.close.assert_not_called()
+    assert pool.stats() == ConsumerPoolStats(idle=1, in_use=0, created=1, evicted=0)
+
+
+@patch("sentry_kafka_management.actions.latency.consumer_pool.Consumer")
+def test_consumer_pool_creates_one_consumer_per_concurrent_borrower(
+    mock_consumer_cls: MagicMock,
+) -> None:
+    mock_consumer_cls.side_effect = lambda _config: MagicMock()
+    pool = ConsumerPool(CONSUMER_CONFIG, max_size=2)
+
+    with pool.acquire() as first, pool.acquire() as second:
+        assert first is not second
+        assert pool.stats().in_use == 2
+
+    assert pool.stats() == ConsumerPoolStats(idle=2, in_use=0, created=2, evicted=0)
+
+
+@patch("sentry_kafka_management.actions.latency.consumer_pool.Consumer")
+def test_consumer_pool_evicts_consumer_that_raised(mock_consumer_cls: MagicMock) -> None:
+    pool = ConsumerPool(CONSUMER_CONFIG)
+
+    with pytest.raises(RuntimeError):
+        with pool.acquire():
+            raise RuntimeError("boom")
+
+    mock_consumer_cls.return_value.close.assert_called_once()
+    assert pool.stats() == ConsumerPoolStats(idle=0, in_use=0, created=1, evicted=1)
+
+
+@patch("sentry_kafka_management.actions.latency.consumer_pool.Consumer")
+def test_consumer_pool_evicts_consumer_that_fails_to_unassign(
+    mock_consumer_cls: MagicMock,
+) -> None:
+    mock_consumer_cls.return_value.unassign.side_effect = RuntimeError("boom")
+    pool = ConsumerPool(CONSUMER_CONFIG)
+
+    with pool.acquire():
+        pass
+
+    mock_consumer_cls.return_value.close.assert_called_once()
+    assert pool.stats().idle == 0
+
+
+@patch("sentry_kafka_management.actions.latency.consumer_pool.Consumer")
+def test_consumer_pool_evicts_idle_consumers(mock_consumer_cls: MagicMock) -> None:
+    pool = ConsumerPool(CONSUMER_CONFIG, max_idle_seconds=60.0)
+
+    with patch("time.monotonic", return_value=0.0):
+        with pool.acquire():
+            pass
+    with patch("time.monotonic", return_value=61.0):
+        pool.evict_idle()
+
+    mock_consumer_cls.return_value.close.assert_called_once()
+    assert pool.stats() == ConsumerPoolStats(idle=0, in_use=0, created=1, evicted=1)
+
+
+@patch("sentry_kafka_management.actions.latency.consumer_pool.Consumer")
+def test_consumer_pool_close_closes_idle_and_returned_consumers(
+    mock_consumer_cls: MagicMock,
+) -> None:
+    idle, busy = MagicMock(), MagicMock()
+    mock_consumer_cls.side_effect = [busy, idle]
+    pool = ConsumerPool(CONSUMER_CONFIG)
+
+    with pool.acquire():
+        with pool.acquire():
+            pass
+        pool.close()
+        idle.close.assert_called_once()
+        busy.close.assert_not_called()
+
+    busy.close.assert_called_once()
+    assert pool.stats().idle == 0
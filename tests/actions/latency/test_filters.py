@@ -0,0 +1,28 @@
+from sentry_kafka_management.actions.latency.filters import NameFilter
+
+
+def test_name_filter_matches_everything_without_patterns() -> None:
+    assert NameFilter().matches("anything")
+
+
+def test_name_filter_requires_an_include_match() -> None:
+    name_filter = NameFilter(include=["snuba-*", "getsentry"])
+
+    assert name_filter.matches("snuba-consumers")
+    assert name_filter.matches("getsentry")
+    assert not name_filter.matches("getsentry-replay")
+    assert not name_filter.matches("ingest-consumer")
+
+
+def test_name_filter_exclude_wins_over_include() -> None:
+    name_filter = NameFilter(include=["snuba-*"], exclude=["*-replay-*", "snuba-test?"])
+
+    assert name_filter.matches("snuba-consumers")
+    assert not name_filter.matches("snuba-replay-20240101")
+    assert not name_filter.matches("snuba-test1")
+    assert name_filter.matches("snuba-test10")
+
+
+def test_name_filter_compares_by_patterns() -> None:
+    assert NameFilter(["a*"], ["b*"]) == NameFilter(("a*",), ("b*",))
+    assert NameFilter(["a*"]) != NameFilter(exclude=["a*"])
@@ -0,0 +1,47 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from sentry_kafka_management.actions.latency.group_cache import ConsumerGroupCache
+
+
+def test_consumer_group_cache_lists_again_after_refresh_interval() -> None:
+    cache = ConsumerGroupCache(refresh_interval=60.0)
+    list_group_ids = Mock(side_effect=[["group-a"], ["group-a", "group-b"]])
+
+    with patch("time.monotonic", return_value=100.0):
+        assert cache.get("cluster1", list_group_ids) == ["group-a"]
+    with patch("time.monotonic", return_value=159.0):
+        assert cache.get("cluster1", list_group_ids) == ["group-a"]
+    with patch("time.monotonic", return_value=160.0):
+        assert cache.get("cluster1", list_group_ids) == ["group-a", "group-b"]
+
+    assert list_group_ids.call_count == 2
+
+
+def test_consumer_group_cache_keeps_clusters_apart() -> None:
+    cache = ConsumerGroupCache()
+
+    cache.get("cluster1", lambda: ["group-a"])
+
+    assert cache.get("cluster2", lambda: ["group-b"]) == ["group-b"]
+
+
+def test_consumer_group_cache_does_not_cache_failed_listings() -> None:
+    cache = ConsumerGroupCache()
+    list_group_ids = Mock(side_effect=[RuntimeError("coordinator unavailable"), ["group-a"]])
+
+    with pytest.raises(RuntimeError):
+        cache.get("cluster1", list_group_ids)
+
+    assert cache.get("cluster1", list_group_ids) == ["group-a"]
+
+
+def test_consumer_group_cache_disabled_when_interval_is_zero() -> None:
+    cache = ConsumerGroupCache(refresh_interval=0.0)
+    list_group_ids = Mock(return_value=["group-a"])
+
+    cache.get("cluster1", list_group_ids)
+    cache.get("cluster1", list_group_ids)
+
+    assert list_group_ids.call_count == 2
@@ -0,0 +1,86 @@
+import time
+from unittest.mock import patch
+
+from sentry_kafka_management.actions.latency.instrumentation import (
+    ScanPhase,
+    ScanStats,
+    emit_scan_stats,
+)
+from sentry_kafka_management.actions.latency.metrics import Metric, MetricsBackend, Tags
+
+
+class FakeMetricsBackend(MetricsBackend):
+    def __init__(self, queue_depth: int | None = None) -> None:
+        self.gauges: list[tuple[str, int | float, Tags | None]] = []
+        self.__queue_depth = queue_depth
+
+    def histogram(self, name: str, value: int | float, tags: Tags | None = None) -> None:
+        raise AssertionError("unexpected histogram")
+
+    def gauge(self, name: str, value: int | float, tags: Tags | None = None) -> None:
+        self.gauges.append((name, value, tags))
+
+    def sender_queue_depth(self) -> int | None:
+        return self.__queue_depth
+
+
+def test_scan_stats_accumulates_phases_and_longest_batch_wait() -> None:
+    stats = ScanStats()
+
+    with patch.object(time, "monotonic", side_effect=[0.0, 1.5, 10.0, 10.25]):
+        with stats.phase(ScanPhase.FETCH_OFFSETS):
+            pass
+        with stats.phase(ScanPhase.FETCH_OFFSETS):
+            pass
+    stats.add(polls=2, retryable_errors=1)
+    stats.add(polls=3, timeouts=4)
+    stats.record_batch_wait(0.5)
+    stats.record_batch_wait(0.25)
+
+    assert stats.phase_durations == {ScanPhase.FETCH_OFFSETS: 1.75}
+    assert (stats.polls, stats.timeouts, stats.retryable_errors) == (5, 4, 1)
+    assert stats.max_batch_wait == 0.5
+
+
+def test_emit_scan_stats() -> None:
+    stats = ScanStats()
+    stats.duration = 2.0
+    stats.phase_durations[ScanPhase.LIST_GROUPS] = 0.5
+    stats.groups = 3
+    stats.partitions = 12
+    stats.timeouts = 1
+    metrics = FakeMetricsBackend(queue_depth=7)
+
+    emit_scan_stats(metrics, "cluster1", stats)
+
+    gauges = {
+        (name, tuple(sorted((tags or {}).items()))): value for name, value, tags in metrics.gauges
+    }
+    cluster = (("cluster", "cluster1"),)
+    assert gauges[(Metric.SCAN_DURATION.value, cluster)] == 2000.0
+    assert (
+        gauges[(Metric.SCAN_PHASE_DURATION.value, cluster + (("phase", "list_groups"),))] == 500.0
+    )
+    assert gauges[(Metric.SCAN_GROUPS.value, cluster)] == 3
+    assert gauges[(Metric.SCAN_PARTITIONS.value, cluster)] == 12
+    assert gauges[(Metric.SCAN_TIMEOUTS.value, cluster)] == 1
+    assert gauges[(Metric.SENDER_QUEUE_DEPTH.value, ())] == 7
+
+
+def test_emit_scan_stats_skips_queue_depth_without_a_sender_queue() -> None:
+    metrics = FakeMetricsBackend()
+
+    emit_scan_stats(metrics, "cluster1", ScanStats())
+
+    assert Metric.SENDER_QUEUE_DEPTH.value not in {name for name, _, _ in metrics.gauges}
+
+
+def test_emit_scan_stats_reports_concurrency_limit_when_adaptive() -> None:
+    metrics = FakeMetricsBackend()
+    emit_scan_stats(metrics, "cluster1", ScanStats())
+    assert Metric.SCAN_CONCURRENCY_LIMIT.value not in {name for name, _, _ in metrics.gauges}
+
+    stats = ScanStats()
+    stats.concurrency_limit = 16
+    emit_scan_stats(metrics, "cluster1", stats)
+    assert (Metric.SCAN_CONCURRENCY_LIMIT.value, 16, {"cluster": "cluster1"}) in metrics.gauges
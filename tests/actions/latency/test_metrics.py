@@ -1,6 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from unittest.mock import MagicMock, patch
 
 from sentry_kafka_management.actions.latency.metrics import (
+    DatadogMetricsBackend,
     Metric,
     MetricsBackend,
     Tags,
@@ -16,15 +18,26 @@ class FakeTopicConsumerLatency:
     group_id: str
     latency_ms: float
     partition: int
+    offset_lag: int | None = None
+    high_watermark: int | None = None
+
+
+@dataclass
+class FakeConsumerLatencyResult:
+    scans: list[FakeTopicConsumerLatency] = field(default_factory=list)
 
 
 class FakeMetricsBackend(MetricsBackend):
     def __init__(self) -> None:
         self.histograms: list[tuple[str, int | float, Tags | None]] = []
+        self.gauges: list[tuple[str, int | float, Tags | None]] = []
 
     def histogram(self, name: str, value: int | float, tags: Tags | None = None) -> None:
         self.histograms.append((name, value, tags))
 
+    def gauge(self, name: str, value: int | float, tags: Tags | None = None) -> None:
+        self.gauges.append((name, value, tags))
+
 
 def test_create_topic_consumer_latency_tags() -> None:
     scan = FakeTopicConsumerLatency(
@@ -67,3 +80,86 @@ def test_emit_topic_consumer_latency() -> None:
             },
         )
     ]
+    assert metrics.gauges == []
+
+
+def test_emit_topic_consumer_latency_emits_offset_lag_when_known() -> None:
+    scan = FakeTopicConsumerLatency(
+        "cluster1", "topic1", "group1", 100.0, 3, offset_lag=12, high_watermark=512
+    )
+    metrics = FakeMetricsBackend()
+
+    emit_topic_consumer_latency(metrics, scan)
+
+    assert metrics.gauges == [
+        (Metric.CONSUMER_OFFSET_LAG.value, 12, create_topic_consumer_latency_tags(scan))
+    ]
+
+
+def test_consumer_latency_histograms_emits_every_scan() -> None:
+    metrics = FakeMetricsBackend()
+    result = FakeConsumerLatencyResult(
+        scans=[
+            FakeTopicConsumerLatency("cluster1", "topic1", "group1", 100.0, 0),
+            FakeTopicConsumerLatency("cluster1", "topic1", "group1", 200.0, 1),
+        ]
+    )
+
+    metrics.consumer_latency_histograms(result)
+
+    assert [(name, value) for name, value, _ in metrics.histograms] == [
+        (Metric.CONSUMER_LATENCY.value, 100.0),
+        (Metric.CONSUMER_LATENCY.value, 200.0),
+    ]
+
+
+@patch("sentry_kafka_management.actions.latency.metrics.DogStatsd")
+def test_datadog_consumer_latency_histograms_reuses_formatted_tags(
+    mock_dogstatsd_cls: MagicMock,
+) -> None:
+    client = mock_dogstatsd_cls.return_value
+    backend = DatadogMetricsBackend("localhost", 8126, tags={"env": "test"})
+    scan = FakeTopicConsumerLatency("cluster1", "topic1", "group1", 100.0, 3)
+
+    backend.consumer_latency_histograms(FakeConsumerLatencyResult(scans=[scan]))
+    scan.latency_ms = 150.0
+    backend.consumer_latency_histograms(FakeConsumerLatencyResult(scans=[scan]))
+
+    assert mock_dogstatsd_cls.call_args.kwargs["disable_buffering"] is False
+    first, second = client.histogram.call_args_list
+    assert first.args == (Metric.CONSUMER_LATENCY.value, 100.0)
+    assert second.args == (Metric.CONSUMER_LATENCY.value, 150.0)
+    assert first.kwargs["tags"] == [
+        "env:test",
+        "cluster:cluster1",
+        "consumer_group:group1",
+        "topic:topic1",
+        "partition:3",
+    ]
+    assert second.kwargs["tags"] is first.kwargs["tags"]
+    assert client.flush.call_count == 2
+    client.gauge.assert_not_called()
+
+
+@patch("sentry_kafka_management.actions.latency.metrics.DogStatsd")
+def test_datadog_consumer_latency_histograms_emits_offset_lag(
+    mock_dogstatsd_cls: MagicMock,
+) -> None:
+    client = mock_dogstatsd_cls.return_value
+    backend = DatadogMetricsBackend("localhost", 8126)
+    scan = FakeTopicConsumerLatency("cluster1", "topic1", "group1", 100.0, 3, offset_lag=7)
+
+    backend.consumer_latency_histograms(FakeConsumerLatencyResult(scans=[scan]))
+
+    (histogram,) = client.histogram.call_args_list
+    (gauge,) = client.gauge.call_args_list
+    assert gauge.args == (Metric.CONSUMER_OFFSET_LAG.value, 7)
+    assert gauge.kwargs["tags"] is histogram.kwargs["tags"]
+
+
+def test_datadog_sender_queue_depth() -> None:
+    backend = DatadogMetricsBackend("localhost", 8126)
+    try:
+        assert backend.sender_queue_depth() == 0
+    finally:
+        backend.datadog_client.disable_background_sender()  # type: ignore[no-untyped-call]
@@ -0,0 +1,104 @@
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sentry_kafka_management.actions.latency.otlp import OtlpMetricsBackend
+
+
+@dataclass
+class FakeTopicConsumerLatency:
+    cluster_name: str
+    topic_name: str
+    group_id: str
+    latency_ms: float
+    partition: int
+    offset_lag: int | None = None
+    high_watermark: int | None = None
+
+
+@dataclass
+class FakeConsumerLatencyResult:
+    scans: list[FakeTopicConsumerLatency] = field(default_factory=list)
+
+
+def _metrics(request: dict[str, Any]) -> list[dict[str, Any]]:
+    (resource_metrics,) = request["resourceMetrics"]
+    (scope_metrics,) = resource_metrics["scopeMetrics"]
+    metrics: list[dict[str, Any]] = scope_metrics["metrics"]
+    return metrics
+
+
+def test_requires_exactly_one_destination(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        OtlpMetricsBackend()
+    with pytest.raises(ValueError):
+        OtlpMetricsBackend(endpoint="http://localhost:4318/v1/metrics", path=tmp_path / "m")
+
+
+def test_exports_buffered_points_to_file_on_close(tmp_path: Path) -> None:
+    path = tmp_path / "metrics.jsonl"
+    backend = OtlpMetricsBackend(path=path, export_interval=3600)
+    result = FakeConsumerLatencyResult(
+        scans=[
+            FakeTopicConsumerLatency("c1", "t1", "g1", 100.0, 0, offset_lag=5),
+            FakeTopicConsumerLatency("c1", "t1", "g1", 200.0, 1),
+        ]
+    )
+
+    backend.consumer_latency_histograms(result)
+    assert not path.exists()
+    backend.gauge("latency.group.max", 200.0, tags={"cluster": "c1", "consumer_group": "g1"})
+    backend.gauge("collector.scan.groups", 1, tags={"cluster": "c1"})
+    backend.close()
+
+    (request,) = [json.loads(line) for line in path.read_text().splitlines()]
+    latency, offset_lag, group_max, groups = _metrics(request)
+    assert latency["name"] == "kafka.topic.latency"
+    assert latency["unit"] == "ms"
+    assert [point["asDouble"] for point in latency["gauge"]["dataPoints"]] == [100.0, 200.0]
+    assert latency["gauge"]["dataPoints"][1]["attributes"] == [
+        {"key": "cluster", "value": {"stringValue": "c1"}},
+        {"key": "consumer_group", "value": {"stringValue": "g1"}},
+        {"key": "topic", "value": {"stringValue": "t1"}},
+        {"key": "partition", "value": {"stringValue": "1"}},
+    ]
+    assert offset_lag["name"] == "kafka.topic.offset_lag"
+    assert offset_lag["unit"] == "{message}"
+    assert group_max["name"] == "kafka.topic.latency.group.max"
+    assert group_max["unit"] == "ms"
+    assert groups["name"] == "kafka.topic.collector.scan.groups"
+    assert "unit" not in groups
+
+
+def test_exports_when_batch_is_full(tmp_path: Path) -> None:
+    path = tmp_path / "metrics.jsonl"
+    backend = OtlpMetricsBackend(path=path, max_batch_size=2, export_interval=3600)
+
+    backend.gauge("a", 1)
+    assert not path.exists()
+    backend.gauge("a", 2)
+    assert len(path.read_text().splitlines()) == 1
+
+    backend.close()
+
+
+@patch("sentry_kafka_management.actions.latency.otlp.urllib.request.urlopen")
+def test_posts_to_endpoint_and_survives_failures(mock_urlopen: MagicMock) -> None:
+    backend = OtlpMetricsBackend(endpoint="http://collector:4318/v1/metrics", export_interval=3600)
+
+    backend.gauge("a", 1)
+    backend.flush()
+    mock_urlopen.side_effect = OSError("connection refused")
+    backend.gauge("a", 2)
+    backend.close()
+
+    assert mock_urlopen.call_count == 2
+    request = mock_urlopen.call_args_list[0].args[0]
+    assert request.full_url == "http://collector:4318/v1/metrics"
+    assert request.get_header("Content-type") == "application/json"
+    (metric,) = _metrics(json.loads(request.data))
+    assert metric["gauge"]["dataPoints"][0]["asDouble"] == 1.0
@@ -0,0 +1,64 @@
+import urllib.error
+import urllib.request
+from unittest.mock import patch
+
+import pytest
+
+from sentry_kafka_management.actions.latency.metrics import Metric
+from sentry_kafka_management.actions.latency.prometheus import PrometheusMetricsBackend
+
+
+def test_render_keeps_latest_value_per_series() -> None:
+    backend = PrometheusMetricsBackend()
+    tags = {"cluster": "c1", "consumer_group": "g1", "topic": "t1", "partition": "0"}
+
+    backend.histogram(Metric.CONSUMER_LATENCY.value, 100, tags=tags)
+    backend.histogram(Metric.CONSUMER_LATENCY.value, 250.5, tags=tags)
+    backend.gauge(Metric.CONSUMER_LATENCY_GROUP_MAX.value, 7, tags={"cluster": 'a"b\\c'})
+
+    assert backend.render().splitlines() == [
+        "# TYPE kafka_topic_latency gauge",
+        'kafka_topic_latency{cluster="c1",consumer_group="g1",topic="t1",partition="0"} 250.5',
+        "# TYPE kafka_topic_latency_group_max gauge",
+        'kafka_topic_latency_group_max{cluster="a\\"b\\\\c"} 7.0',
+    ]
+
+
+def test_render_drops_stale_series() -> None:
+    backend = PrometheusMetricsBackend(stale_seconds=30.0)
+
+    with patch(
+        "sentry_kafka_management.actions.latency.prometheus.time.monotonic", return_value=100.0
+    ):
+        backend.gauge("old", 1, tags={"topic": "t1"})
+        backend.gauge("fresh", 1, tags={"topic": "t1"})
+    with patch(
+        "sentry_kafka_management.actions.latency.prometheus.time.monotonic", return_value=120.0
+    ):
+        backend.gauge("fresh", 2, tags={"topic": "t1"})
+    with patch(
+        "sentry_kafka_management.actions.latency.prometheus.time.monotonic", return_value=140.0
+    ):
+        rendered = backend.render()
+
+    assert "kafka_topic_old" not in rendered
+    assert 'kafka_topic_fresh{topic="t1"} 2.0' in rendered
+
+
+def test_serves_metrics_endpoint() -> None:
+    backend = PrometheusMetricsBackend(host="127.0.0.1", port=0)
+    backend.gauge("depth", 3)
+    backend.start()
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{backend.port}/metrics") as response:
+            assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+            assert (
+                response.read().decode()
+                == "# TYPE kafka_topic_depth gauge\nkafka_topic_depth 3.0\n"
+            )
+
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            urllib.request.urlopen(f"http://127.0.0.1:{backend.port}/other")
+        assert exc_info.value.code == 404
+    finally:
+        backend.close()
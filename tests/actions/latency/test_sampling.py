@@ -0,0 +1,108 @@
+from confluent_kafka import TopicPartition  # type: ignore[import-untyped]
+
+from sentry_kafka_management.actions.latency.consumer_latency import (
+    TopicConsumerLatency,
+)
+from sentry_kafka_management.actions.latency.filters import NameFilter
+from sentry_kafka_management.actions.latency.sampling import SamplingPolicy, ScanSampler
+
+
+def _partitions(result: dict[str, list[TopicPartition]], group_id: str) -> list[int]:
+    return [tp.partition for tp in result[group_id]]
+
+
+def test_scan_sampler_keeps_everything_without_limits() -> None:
+    sampler = ScanSampler(SamplingPolicy())
+    committed = {"group-a": [TopicPartition("topic-a", p, 1) for p in range(10)]}
+
+    assert sampler.select_groups(["b", "a"]) == ["b", "a"]
+    assert sampler.select_partitions(committed) == committed
+
+
+def test_scan_sampler_round_robins_groups_under_budget_and_always_keeps_critical() -> None:
+    sampler = ScanSampler(
+        SamplingPolicy(critical_groups=NameFilter(include=["critical-*"]), group_budget=2)
+    )
+    groups = ["d", "critical-1", "a", "c", "b", "e"]
+
+    scans = [sampler.select_groups(groups) for _ in range(3)]
+
+    assert scans == [
+        ["critical-1", "a", "b"],
+        ["critical-1", "c", "d"],
+        ["critical-1", "e", "a"],
+    ]
+
+
+def test_scan_sampler_resumes_after_last_group_when_groups_change() -> None:
+    sampler = ScanSampler(SamplingPolicy(group_budget=2))
+
+    assert sampler.select_groups(["a", "b", "c", "d"]) == ["a", "b"]
+    # "b" was deleted and "bb" created; the next scan picks up after "b".
+    assert sampler.select_groups(["a", "bb", "c", "d"]) == ["bb", "c"]
+
+
+def test_scan_sampler_round_robins_wide_groups_and_rescans_hottest_partition() -> None:
+    sampler = ScanSampler(SamplingPolicy(max_partitions_per_group=3))
+    committed = {
+        "wide": [TopicPartition("topic-a", p, 1) for p in range(6)],
+        "narrow": [TopicPartition("topic-a", p, 1) for p in range(2)],
+    }
+
+    first = sampler.select_partitions(committed)
+    assert _partitions(first, "wide") == [0, 1, 2]
+    assert _partitions(first, "narrow") == [0, 1]
+    sampler.record(
+        [
+            TopicConsumerLatency("cluster1", "topic-a", "wide", 10.0, partition=0),
+            TopicConsumerLatency("cluster1", "topic-a", "wide", 900.0, partition=1),
+            TopicConsumerLatency("cluster1", "topic-a", "wide", 50.0, partition=2),
+        ]
+    )
+
+    second = sampler.select_partitions(committed)
+    assert _partitions(second, "wide") == [1, 3, 4]
+    sampler.record([TopicConsumerLatency("cluster1", "topic-a", "wide", 900.0, partition=1)])
+
+    third = sampler.select_partitions(committed)
+    assert _partitions(third, "wide") == [1, 5, 0]
+
+    # A scan that reads nothing keeps the hottest partition from before it.
+    fourth = sampler.select_partitions(committed)
+    assert _partitions(fourth, "wide") == [1, 2, 3]
+
+
+def test_scan_sampler_keeps_rescanning_hottest_partition_with_room_for_one() -> None:
+    sampler = ScanSampler(SamplingPolicy(max_partitions_per_group=1))
+    committed = {"wide": [TopicPartition("topic-a", p, 1) for p in range(3)]}
+
+    assert _partitions(sampler.select_partitions(committed), "wide") == [0]
+    sampler.record([TopicConsumerLatency("cluster1", "topic-a", "wide", 5.0, partition=0)])
+
+    assert _partitions(sampler.select_partitions(committed), "wide") == [0]
+
+
+def test_scan_sampler_keeps_hottest_partition_of_groups_that_sat_out_a_scan() -> None:
+    sampler = ScanSampler(SamplingPolicy(group_budget=1, max_partitions_per_group=2))
+    committed = {group_id: [TopicPartition("topic-a", p, 1) for p in range(6)] for group_id in "ab"}
+
+    def scan(hottest: int) -> tuple[str, list[int]]:
+        (group_id,) = sampler.select_groups(["a", "b"])
+        partitions = _partitions(
+            sampler.select_partitions({group_id: committed[group_id]}), group_id
+        )
+        sampler.record(
+            [
+                TopicConsumerLatency(
+                    "cluster1", "topic-a", group_id, 900.0 if p == hottest else 5.0, partition=p
+                )
+                for p in partitions
+            ]
+        )
+        return group_id, partitions
+
+    assert scan(hottest=1) == ("a", [0, 1])
+    assert scan(hottest=0) == ("b", [0, 1])
+    # "a" sat out the last scan, but still rescans its hottest partition.
+    assert scan(hottest=1) == ("a", [1, 2])
+    assert scan(hottest=0) == ("b", [0, 2])
@@ -0,0 +1,279 @@
+import threading
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from confluent_kafka import KafkaException  # type: ignore[import-untyped]
+
+from sentry_kafka_management.actions.latency.consumer_latency import (
+    ConsumerGroupListingError,
+    ConsumerLatencyResult,
+    ScansCallback,
+    TopicConsumerLatency,
+)
+from sentry_kafka_management.actions.latency.filters import NameFilter, ScanFilter
+from sentry_kafka_management.actions.latency.metrics import MetricsBackend, Tags
+from sentry_kafka_management.actions.latency.sampling import SamplingPolicy
+from sentry_kafka_management.actions.latency.scheduler import (
+    ClusterSchedule,
+    resolve_cluster_schedule,
+    run_cluster_latency_loop,
+    run_consumer_latency_scheduler,
+)
+from sentry_kafka_management.brokers import ClusterConfig, LatencyConfig
+
+CLUSTER_CONFIG = ClusterConfig(
+    brokers=["broker1:9092"],
+    security_protocol=None,
+    sasl_mechanism=None,
+    sasl_username=None,
+    sasl_password=None,
+    password_is_plaintext=False,
+)
+
+
+class FakeMetricsBackend(MetricsBackend):
+    def __init__(self) -> None:
+        self.histograms: list[tuple[str, int | float, Tags | None]] = []
+        self.gauges: list[tuple[str, int | float, Tags | None]] = []
+
+    def histogram(self, name: str, value: int | float, tags: Tags | None = None) -> None:
+        self.histograms.append((name, value, tags))
+
+    def gauge(self, name: str, value: int | float, tags: Tags | None = None) -> None:
+        self.gauges.append((name, value, tags))
+
+
+def test_cluster_schedule_backs_off_exponentially_up_to_max() -> None:
+    schedule = ClusterSchedule(interval=10.0, timeout=10, max_workers=1, max_backoff=60.0)
+
+    delays = [schedule.next_delay(failures) for failures in range(5)]
+
+    assert delays == [10.0, 20.0, 40.0, 60.0, 60.0]
+
+
+def test_resolve_cluster_schedule_prefers_cluster_overrides() -> None:
+    cluster_config = ClusterConfig(
+        **CLUSTER_CONFIG, latency=LatencyConfig(interval=30.0, max_workers=8)
+    )
+
+    schedule = resolve_cluster_schedule(
+        cluster_config, interval=10.0, timeout=5, max_workers=128, max_backoff=300.0
+    )
+
+    assert schedule == ClusterSchedule(interval=30.0, timeout=5, max_workers=8, max_backoff=300.0)
+
+
+def test_resolve_cluster_schedule_uses_defaults_without_latency_config() -> None:
+    schedule = resolve_cluster_schedule(
+        CLUSTER_CONFIG, interval=10.0, timeout=5, max_workers=128, max_backoff=300.0
+    )
+
+    assert schedule == ClusterSchedule(interval=10.0, timeout=5, max_workers=128, max_backoff=300.0)
+
+
+def test_resolve_cluster_schedule_compiles_cluster_patterns_over_defaults() -> None:
+    cluster_config = ClusterConfig(
+        **CLUSTER_CONFIG, latency=LatencyConfig(exclude_groups=["replay-*"])
+    )
+
+    schedule = resolve_cluster_schedule(
+        cluster_config, exclude_groups=["test-*"], include_topics=["events"]
+    )
+
+    assert schedule.scan_filter == ScanFilter(
+        groups=NameFilter(exclude=["replay-*"]), topics=NameFilter(include=["events"])
+    )
+
+
+def test_resolve_cluster_schedule_prefers_cluster_sampling_policy() -> None:
+    cluster_config = ClusterConfig(
+        **CLUSTER_CONFIG, latency=LatencyConfig(critical_groups=["snuba-*"], group_budget=50)
+    )
+
+    schedule = resolve_cluster_schedule(
+        cluster_config, group_budget=100, max_partitions_per_group=16
+    )
+
+    assert schedule.sampling == SamplingPolicy(
+        critical_groups=NameFilter(include=["snuba-*"]),
+        group_budget=50,
+        max_partitions_per_group=16,
+    )
+
+
+@pytest.mark.parametrize(
+    "latency, field",
+    [
+        (LatencyConfig(include_groups="snuba-*"), "include_groups"),
+        (LatencyConfig(exclude_topics=["ok-*", 1]), "exclude_topics"),  # type: ignore[list-item]
+        (LatencyConfig(critical_groups="snuba-*"), "critical_groups"),
+    ],
+)
+def test_resolve_cluster_schedule_rejects_patterns_that_are_not_string_lists(
+    latency: LatencyConfig, field: str
+) -> None:
+    cluster_config = ClusterConfig(**CLUSTER_CONFIG, latency=latency)
+
+    with pytest.raises(ValueError, match=field):
+        resolve_cluster_schedule(cluster_config)
+
+
+@pytest.mark.parametrize(
+    "latency, limit",
+    [
+        (LatencyConfig(group_budget=0), "group_budget"),
+        (LatencyConfig(max_partitions_per_group=0), "max_partitions_per_group"),
+    ],
+)
+def test_resolve_cluster_schedule_rejects_sampling_limits_below_one(
+    latency: LatencyConfig, limit: str
+) -> None:
+    cluster_config = ClusterConfig(**CLUSTER_CONFIG, latency=latency)
+
+    with pytest.raises(ValueError, match=limit):
+        resolve_cluster_schedule(cluster_config)
+
+
+@patch("sentry_kafka_management.actions.latency.consumer_latency.get_cluster_latency")
+def test_run_cluster_latency_loop_backs_off_after_failures_and_recovers(
+    mock_get_cluster_latency: MagicMock,
+) -> None:
+    config = Mock()
+    config.get_clusters.return_value = {"cluster1": CLUSTER_CONFIG}
+    config.get_topics_config.return_value = {"topic-a": {}}
+    calls = 0
+
+    def scan(*_args: object, on_scans: ScansCallback, **_kwargs: object) -> ConsumerLatencyResult:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("boom")
+        if calls == 2:
+            return ConsumerLatencyResult(scans=[], errors=[RuntimeError("partial")])
+        on_scans([TopicConsumerLatency("cluster1", "topic-a", "group-a", 5.0, partition=0)])
+        return ConsumerLatencyResult(scans=[])
+
+    mock_get_cluster_latency.side_effect = scan
+    schedule = ClusterSchedule(interval=1.0, timeout=10, max_workers=1, max_backoff=60.0)
+    stop_event = Mock(spec=threading.Event)
+    results: list[ConsumerLatencyResult] = []
+    stop_event.is_set.side_effect = lambda: len(results) == 3
+    metrics = FakeMetricsBackend()
+
+    run_cluster_latency_loop(
+        config,
+        "cluster1",
+        schedule,
+        metrics,
+        stop_event,
+        on_result=lambda _name, result: results.append(result),
+    )
+
+    assert [len(result.errors) for result in results] == [1, 1, 0]
+    assert [call.args[0] for call in stop_event.wait.call_args_list] == [2.0, 4.0, 1.0]
+    assert [value for _, value, _ in metrics.histograms] == [5.0]
+
+
+@patch("sentry_kafka_management.actions.latency.consumer_latency.get_cluster_latency")
+def test_run_cluster_latency_loop_only_backs_off_when_whole_scan_fails(
+    mock_get_cluster_latency: MagicMock,
+) -> None:
+    config = Mock()
+    config.get_clusters.return_value = {"cluster1": CLUSTER_CONFIG}
+    config.get_topics_config.return_value = {"topic-a": {}}
+    calls = 0
+
+    def scan(*_args: object, on_scans: ScansCallback, **_kwargs: object) -> ConsumerLatencyResult:
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            listing_error = ConsumerGroupListingError([KafkaException("coordinator")], valid=[])
+            return ConsumerLatencyResult(scans=[], errors=[listing_error])
+        on_scans([TopicConsumerLatency("cluster1", "topic-a", "group-a", 5.0, partition=0)])
+        return ConsumerLatencyResult(scans=[], errors=[TimeoutError("topic-a[1]")])
+
+    mock_get_cluster_latency.side_effect = scan
+    schedule = ClusterSchedule(interval=1.0, timeout=10, max_workers=1, max_backoff=60.0)
+    stop_event = Mock(spec=threading.Event)
+    results: list[ConsumerLatencyResult] = []
+    stop_event.is_set.side_effect = lambda: len(results) == 3
+
+    run_cluster_latency_loop(
+        config,
+        "cluster1",
+        schedule,
+        FakeMetricsBackend(),
+        stop_event,
+        on_result=lambda _name, result: results.append(result),
+    )
+
+    # A partition timing out is reported, but only the failed group listing backs off.
+    assert [len(result.errors) for result in results] == [1, 1, 1]
+    assert [call.args[0] for call in stop_event.wait.call_args_list] == [1.0, 2.0, 1.0]
+
+
+class FailingGaugeMetricsBackend(FakeMetricsBackend):
+    def gauge(self, name: str, value: int | float, tags: Tags | None = None) -> None:
+        raise RuntimeError("metrics backend down")
+
+
+@patch("sentry_kafka_management.actions.latency.consumer_latency.get_cluster_latency")
+def test_run_cluster_latency_loop_survives_failing_scan_metrics(
+    mock_get_cluster_latency: MagicMock,
+) -> None:
+    config = Mock()
+    config.get_clusters.return_value = {"cluster1": CLUSTER_CONFIG}
+    config.get_topics_config.return_value = {"topic-a": {}}
+
+    def scan(*_args: object, on_scans: ScansCallback, **_kwargs: object) -> ConsumerLatencyResult:
+        on_scans([TopicConsumerLatency("cluster1", "topic-a", "group-a", 5.0, partition=0)])
+        return ConsumerLatencyResult(scans=[])
+
+    mock_get_cluster_latency.side_effect = scan
+    schedule = ClusterSchedule(interval=1.0, timeout=10, max_workers=1, max_backoff=60.0)
+    stop_event = Mock(spec=threading.Event)
+    results: list[ConsumerLatencyResult] = []
+    stop_event.is_set.side_effect = lambda: len(results) == 2
+
+    run_cluster_latency_loop(
+        config,
+        "cluster1",
+        schedule,
+        FailingGaugeMetricsBackend(),
+        stop_event,
+        on_result=lambda _name, result: results.append(result),
+    )
+
+    assert len(results) == 2
+    assert [call.args[0] for call in stop_event.wait.call_args_list] == [1.0, 1.0]
+
+
+@patch("sentry_kafka_management.actions.latency.consumer_latency.get_cluster_latency")
+def test_run_consumer_latency_scheduler_isolates_failing_clusters(
+    mock_get_cluster_latency: MagicMock,
+) -> None:
+    config = Mock()
+    config.get_clusters.return_value = {"good": CLUSTER_CONFIG, "bad": CLUSTER_CONFIG}
+    config.get_topics_config.return_value = {"topic-a": {}}
+    stop_event = threading.Event()
+    good_scans: list[str] = []
+
+    def scan(cluster_name: str, *_args: object, **_kwargs: object) -> ConsumerLatencyResult:
+        if cluster_name == "bad":
+            raise RuntimeError("unreachable")
+        good_scans.append(cluster_name)
+        if len(good_scans) == 3:
+            stop_event.set()
+        return ConsumerLatencyResult(
+            scans=[TopicConsumerLatency(cluster_name, "topic-a", "group-a", 1.0, partition=0)]
+        )
+
+    mock_get_cluster_latency.side_effect = scan
+    schedules = {
+        "good": ClusterSchedule(interval=0.01, timeout=10, max_workers=1, max_backoff=0.01),
+        "bad": ClusterSchedule(interval=0.01, timeout=10, max_workers=1, max_backoff=0.01),
+    }
+
+    run_consumer_latency_scheduler(config, FakeMetricsBackend(), stop_event, schedules)
+
+    assert good_scans == ["good", "good", "good"]
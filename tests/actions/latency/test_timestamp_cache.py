@@ -0,0 +1,33 @@
+from sentry_kafka_management.actions.latency.timestamp_cache import OffsetTimestampCache
+
+
+def test_offset_timestamp_cache_returns_stored_timestamp() -> None:
+    cache = OffsetTimestampCache()
+
+    cache.put("cluster1", "topic-a", 0, 42, 1_000)
+
+    assert cache.get("cluster1", "topic-a", 0, 42) == 1_000
+    assert cache.get("cluster1", "topic-a", 0, 43) is None
+    assert cache.get("cluster2", "topic-a", 0, 42) is None
+
+
+def test_offset_timestamp_cache_evicts_least_recently_used() -> None:
+    cache = OffsetTimestampCache(max_size=2)
+
+    cache.put("cluster1", "topic-a", 0, 1, 100)
+    cache.put("cluster1", "topic-a", 0, 2, 200)
+    assert cache.get("cluster1", "topic-a", 0, 1) == 100
+    cache.put("cluster1", "topic-a", 0, 3, 300)
+
+    assert len(cache) == 2
+    assert cache.get("cluster1", "topic-a", 0, 2) is None
+    assert cache.get("cluster1", "topic-a", 0, 1) == 100
+    assert cache.get("cluster1", "topic-a", 0, 3) == 300
+
+
+def test_offset_timestamp_cache_disabled_when_size_is_zero() -> None:
+    cache = OffsetTimestampCache(max_size=0)
+
+    cache.put("cluster1", "topic-a", 0, 1, 100)
+
+    assert cache.get("cluster1", "topic-a", 0, 1) is None
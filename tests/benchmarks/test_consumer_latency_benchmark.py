@@ -0,0 +1,60 @@
+from click.testing import CliRunner
+
+from benchmarks.consumer_latency import main, run_consumer_latency_benchmark
+from sentry_kafka_management.actions.latency.consumer_latency import ScanEngine
+from sentry_kafka_management.actions.latency.sampling import SamplingPolicy
+
+
+def test_benchmark_scans_every_group_partition() -> None:
+    (result,) = run_consumer_latency_benchmark(
+        groups=5, partitions=4, topics=2, max_workers=4, request_latency=0.0
+    )
+
+    assert result.points == 5 * 4 * 2
+    assert result.errors == 0
+    assert result.requests["ListGroups"] == 1
+    assert result.requests["OffsetFetch"] == 5
+    assert result.peak_threads >= 1
+    assert result.peak_memory_bytes > 0
+
+
+def test_benchmark_reuses_pools_and_cache_across_iterations() -> None:
+    first, second = run_consumer_latency_benchmark(
+        groups=3,
+        partitions=4,
+        clusters=2,
+        request_latency=0.0,
+        lag_fraction=1.0,
+        scan_engine=ScanEngine.LIST_OFFSETS,
+        iterations=2,
+    )
+
+    assert first.points == second.points == 2 * 3 * 4
+    assert first.requests["Fetch"] > 0
+    assert "ConsumerCreate" not in second.requests
+    assert "Fetch" not in second.requests
+
+
+def test_benchmark_scans_through_sampling_and_adaptive_limits() -> None:
+    first, second = run_consumer_latency_benchmark(
+        groups=5,
+        partitions=4,
+        request_latency=0.0,
+        iterations=2,
+        sampling=SamplingPolicy(group_budget=2),
+        adaptive_latency_target=1.0,
+    )
+
+    assert first.points == second.points == 2 * 4
+    assert first.requests["OffsetFetch"] == second.requests["OffsetFetch"] == 2
+    assert first.errors == second.errors == 0
+
+
+def test_benchmark_cli_reports_each_iteration() -> None:
+    result = CliRunner().invoke(
+        main, ["--groups", "2", "--partitions", "2", "--request-latency", "0", "--iterations", "1"]
+    )
+
+    assert result.exit_code == 0
+    assert "iteration=0" in result.output
+    assert "OffsetFetch=2" in result.output
@@ -1,10 +1,12 @@
 import json
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from typing import Any
 from unittest.mock import Mock, patch
 
 from click.testing import CliRunner
 
+from sentry_kafka_management.actions.brokers.configs import DescribeBrokerConfigsError
 from sentry_kafka_management.scripts.brokers.configs import (
     apply_configs,
     describe_broker_configs,
@@ -40,6 +42,69 @@ def test_describe_broker_configs(temp_config: Path) -> None:
         assert parsed_output == mock_configs
 
 
+def test_describe_broker_configs_prints_described_brokers_on_partial_failure(
+    temp_config: Path,
+) -> None:
+    with patch(
+        "sentry_kafka_management.scripts.brokers.configs.describe_broker_configs_action",
+    ) as mock_action:
+        mock_configs = [{"config": "num.network.threads", "value": "3", "broker": "0"}]
+        mock_action.side_effect = DescribeBrokerConfigsError(
+            {"1": Exception("broker 1 unavailable")}, mock_configs
+        )
+
+        result = CliRunner().invoke(
+            describe_broker_configs, ["--config", str(temp_config), "--cluster", "cluster1"]
+        )
+
+        assert result.exit_code == 1
+        assert "broker 1: broker 1 unavailable" in result.output
+        assert json.loads(result.output[: result.output.index("Error:")]) == mock_configs
+
+
+def test_apply_config_command_streams_json_lines(temp_config: Path) -> None:
+    rows = [
+        {"broker_id": "0", "config_name": "message.max.bytes", "status": "success"},
+        {"broker_id": "1", "config_name": "message.max.bytes", "status": "error"},
+    ]
+
+    def apply_config_action(*args: object, **kwargs: Any) -> tuple[list[Any], list[Any]]:
+        for row in rows:
+            kwargs["on_result"](row)
+        return rows[:1], rows[1:]
+
+    with (
+        patch("sentry_kafka_management.scripts.brokers.configs.get_admin_client"),
+        patch(
+            "sentry_kafka_management.scripts.brokers.configs.apply_config_action",
+            side_effect=apply_config_action,
+        ) as mock_action,
+    ):
+        result = CliRunner().invoke(
+            apply_configs,
+            [
+                "-c",
+                str(temp_config),
+                "-n",
+                "cluster1",
+                "--config-changes",
+                '{"message.max.bytes": "2000000"}',
+                "--max-in-flight",
+                "4",
+                "--max-requests-per-second",
+                "20",
+                "--stream",
+            ],
+        )
+
+    assert result.exit_code == 1
+    lines = result.output.splitlines()
+    assert [json.loads(line) for line in lines[:2]] == rows
+    assert lines[2] == "Error: One or more config changes failed"
+    assert mock_action.call_args.kwargs["max_in_flight"] == 4
+    assert mock_action.call_args.kwargs["max_requests_per_second"] == 20.0
+
+
 def test_apply_config_command_success() -> None:
     """Test the CLI command with successful config application."""
     runner = CliRunner()
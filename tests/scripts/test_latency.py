@@ -5,11 +5,17 @@ from typing import Callable
 from unittest.mock import MagicMock, patch
 
 from click.testing import CliRunner, Result
+from confluent_kafka import ConsumerGroupState  # type: ignore[import-untyped]
 
+from sentry_kafka_management.actions.latency.aggregation import Rollup
 from sentry_kafka_management.actions.latency.consumer_latency import (
+    Concurrency,
     ConsumerLatencyResult,
     TopicConsumerLatency,
 )
+from sentry_kafka_management.actions.latency.filters import NameFilter, ScanFilter
+from sentry_kafka_management.actions.latency.group_cache import ConsumerGroupCache
+from sentry_kafka_management.actions.latency.scheduler import ClusterSchedule
 from sentry_kafka_management.scripts.latency.consumer_latency import consumer_latency
 
 
@@ -22,77 +28,104 @@ def test_consumer_latency_requires_statsd_options(temp_config: Path) -> None:
     assert "statsd-host" in result.output
 
 
-def _stop_after(iterations: int) -> Callable[..., bool]:
-    """Build a ``threading.Event.wait`` side effect that stops after N waits.
+def _stop_after(calls: int) -> Callable[..., ConsumerLatencyResult]:
+    """Build a ``get_cluster_latency`` side effect that stops collection after N scans.
 
-    Mirrors how a SIGINT/SIGTERM handler sets the shutdown event: the loop's
+    Mirrors how a SIGINT/SIGTERM handler sets the shutdown event: every cluster's
     interruptible sleep returns and the process exits cleanly.
     """
+    lock = threading.Lock()
+    seen: list[str] = []
+
+    def scan(cluster_name: str, *args: object, **kwargs: object) -> ConsumerLatencyResult:
+        stop_event = args[4]
+        assert isinstance(stop_event, threading.Event)
+        with lock:
+            seen.append(cluster_name)
+            if len(seen) >= calls:
+                stop_event.set()
+        on_scans = kwargs["on_scans"]
+        assert callable(on_scans)
+        on_scans(
+            [
+                TopicConsumerLatency(
+                    cluster_name=cluster_name,
+                    group_id="group-a",
+                    topic_name="topic1",
+                    latency_ms=123.0,
+                    partition=0,
+                )
+            ]
+        )
+        return ConsumerLatencyResult(scans=[])
 
-    def wait_side_effect(self: threading.Event, _timeout: float | None = None) -> bool:
-        if wait_side_effect.calls >= iterations:  # type: ignore[attr-defined]
-            self.set()
-        wait_side_effect.calls += 1  # type: ignore[attr-defined]
-        return self.is_set()
-
-    wait_side_effect.calls = 1  # type: ignore[attr-defined]
-    return wait_side_effect
+    return scan
 
 
 @patch("sentry_kafka_management.scripts.latency.consumer_latency.DatadogMetricsBackend")
 @patch("sentry_kafka_management.actions.latency.consumer_latency.get_cluster_latency")
-@patch.object(threading.Event, "wait", autospec=True)
-def test_consumer_latency_runs_collection_loop_and_emits_metrics(
-    mock_wait: MagicMock,
+def test_consumer_latency_runs_every_cluster_on_its_own_loop(
     mock_get_cluster_latency: MagicMock,
     mock_metrics_backend_cls: MagicMock,
     temp_config: Path,
 ) -> None:
     metrics_backend = mock_metrics_backend_cls.return_value
-    mock_get_cluster_latency.side_effect = (
-        lambda cluster_name, *_args, **_kwargs: ConsumerLatencyResult(
-            scans=[
-                TopicConsumerLatency(
-                    cluster_name=cluster_name,
-                    group_id="group-a",
-                    topic_name="topic1",
-                    latency_ms=123.0,
-                    partition=0,
-                )
-            ],
-        )
-    )
-
-    mock_wait.side_effect = _stop_after(2)
+    mock_get_cluster_latency.side_effect = _stop_after(4)
 
-    result = runner_invoke_with_statsd(temp_config, interval="0.25")
+    result = runner_invoke_with_statsd(temp_config, interval="0.01")
 
     assert result.exit_code == 0
-
     mock_metrics_backend_cls.assert_called_once_with("localhost", 8126)
-    assert mock_wait.call_args.args[1] == 0.25
-    assert mock_wait.call_count == 2
 
-    assert mock_get_cluster_latency.call_count == 4
+    assert mock_get_cluster_latency.call_count >= 4
     called_clusters = {call.args[0] for call in mock_get_cluster_latency.call_args_list}
     assert called_clusters == {"cluster1", "cluster2"}
-    assert metrics_backend.histogram.call_count == 4
+    assert (
+        metrics_backend.consumer_latency_histograms.call_count
+        == mock_get_cluster_latency.call_count
+    )
+    assert "Collected latency cluster=cluster1" in result.output
+    assert "stopped" in result.output
+
+
+@patch("sentry_kafka_management.scripts.latency.consumer_latency.DatadogMetricsBackend")
+@patch("sentry_kafka_management.actions.latency.consumer_latency.get_cluster_latency")
+def test_consumer_latency_keeps_running_after_cluster_errors(
+    mock_get_cluster_latency: MagicMock,
+    mock_metrics_backend_cls: MagicMock,
+    temp_config: Path,
+) -> None:
+    stop_after = _stop_after(4)
+
+    def scan(cluster_name: str, *args: object, **kwargs: object) -> ConsumerLatencyResult:
+        result = stop_after(cluster_name, *args, **kwargs)
+        if cluster_name == "cluster2":
+            raise RuntimeError("cluster unreachable")
+        return result
+
+    mock_get_cluster_latency.side_effect = scan
+
+    with patch(
+        "sentry_kafka_management.actions.latency.scheduler.ClusterSchedule.next_delay",
+        return_value=0.01,
+    ):
+        result = runner_invoke_with_statsd(temp_config)
+
+    assert result.exit_code == 0
+    assert "Error on cluster cluster2: cluster unreachable" in result.output
+    assert "Collected latency cluster=cluster1" in result.output
 
 
 @patch("sentry_kafka_management.scripts.latency.consumer_latency.DatadogMetricsBackend")
 @patch(
-    "sentry_kafka_management.scripts.latency.consumer_latency.record_consumer_group_latency_action"
+    "sentry_kafka_management.scripts.latency.consumer_latency."
+    "run_consumer_latency_scheduler_action"
 )
-@patch.object(threading.Event, "wait", autospec=True)
-def test_consumer_latency_passes_max_workers(
-    mock_wait: MagicMock,
-    mock_record: MagicMock,
+def test_consumer_latency_passes_worker_options(
+    mock_scheduler: MagicMock,
     mock_metrics_backend_cls: MagicMock,
     temp_config: Path,
 ) -> None:
-    mock_record.return_value = ConsumerLatencyResult(scans=[])
-    mock_wait.side_effect = _stop_after(1)
-
     result = CliRunner().invoke(
         consumer_latency,
         [
@@ -104,61 +137,200 @@ def test_consumer_latency_passes_max_workers(
             "8126",
             "--max-workers",
             "32",
+            "--total-workers",
+            "64",
         ],
     )
 
     assert result.exit_code == 0
-    mock_record.assert_called_once()
-    assert mock_record.call_args.args[3] == 32
+    mock_scheduler.assert_called_once()
+    schedules = mock_scheduler.call_args.args[3]
+    assert {schedule.max_workers for schedule in schedules.values()} == {32}
+    assert mock_scheduler.call_args.kwargs["total_workers"] == 64
+    assert mock_scheduler.call_args.kwargs["concurrency"] == Concurrency.THREADS
 
 
 @patch("sentry_kafka_management.scripts.latency.consumer_latency.DatadogMetricsBackend")
-@patch("sentry_kafka_management.actions.latency.consumer_latency.get_cluster_latency")
-@patch.object(threading.Event, "wait", autospec=True)
-def test_consumer_latency_handles_iterations_with_no_scans(
-    mock_wait: MagicMock,
-    mock_get_cluster_latency: MagicMock,
+@patch(
+    "sentry_kafka_management.scripts.latency.consumer_latency."
+    "run_consumer_latency_scheduler_action"
+)
+def test_consumer_latency_passes_concurrency(
+    mock_scheduler: MagicMock,
     mock_metrics_backend_cls: MagicMock,
     temp_config: Path,
 ) -> None:
-    metrics_backend = mock_metrics_backend_cls.return_value
-    mock_get_cluster_latency.return_value = ConsumerLatencyResult(scans=[])
-    mock_wait.side_effect = _stop_after(1)
+    result = CliRunner().invoke(
+        consumer_latency,
+        [
+            "--config",
+            str(temp_config),
+            "--statsd-host",
+            "localhost",
+            "--statsd-port",
+            "8126",
+            "--concurrency",
+            "asyncio",
+            "--adaptive-latency-target",
+            "2.5",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert mock_scheduler.call_args.kwargs["concurrency"] == Concurrency.ASYNCIO
+    assert mock_scheduler.call_args.kwargs["adaptive_latency_target"] == 2.5
+
+
+@patch("sentry_kafka_management.scripts.latency.consumer_latency.DatadogMetricsBackend")
+@patch(
+    "sentry_kafka_management.scripts.latency.consumer_latency."
+    "run_consumer_latency_scheduler_action"
+)
+def test_consumer_latency_passes_rollups(
+    mock_scheduler: MagicMock,
+    mock_metrics_backend_cls: MagicMock,
+    temp_config: Path,
+) -> None:
+    default = runner_invoke_with_statsd(temp_config)
+    assert default.exit_code == 0
+    assert mock_scheduler.call_args.kwargs["rollups"] == {Rollup.PARTITION}
+
+    result = CliRunner().invoke(
+        consumer_latency,
+        [
+            "--config",
+            str(temp_config),
+            "--statsd-host",
+            "localhost",
+            "--statsd-port",
+            "8126",
+            "--rollup",
+            "topic",
+            "--rollup",
+            "group",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert mock_scheduler.call_args.kwargs["rollups"] == {Rollup.TOPIC, Rollup.GROUP}
+
+
+@patch("sentry_kafka_management.scripts.latency.consumer_latency.DatadogMetricsBackend")
+@patch(
+    "sentry_kafka_management.scripts.latency.consumer_latency."
+    "run_consumer_latency_scheduler_action"
+)
+def test_consumer_latency_uses_per_cluster_overrides(
+    mock_scheduler: MagicMock,
+    mock_metrics_backend_cls: MagicMock,
+    tmp_path: Path,
+) -> None:
+    config = tmp_path / "config.yaml"
+    config.write_text("""
+- name: cluster1
+  brokers: [broker1:9092]
+  latency:
+    interval: 30
+    max_backoff: 600
+    exclude_groups: [replay-*]
+  topics: []
+- name: cluster2
+  brokers: [broker2:9092]
+  topics: []
+""")
+
+    result = CliRunner().invoke(
+        consumer_latency,
+        [
+            "--config",
+            str(config),
+            "--statsd-host",
+            "localhost",
+            "--statsd-port",
+            "8126",
+            "--interval",
+            "5",
+            "--timeout",
+            "3",
+            "--exclude-group",
+            "test-*",
+            "--include-topic",
+            "events",
+        ],
+    )
+
+    assert result.exit_code == 0
+    schedules = mock_scheduler.call_args.args[3]
+    assert schedules == {
+        "cluster1": ClusterSchedule(
+            interval=30.0,
+            timeout=3,
+            max_workers=128,
+            max_backoff=600.0,
+            scan_filter=ScanFilter(
+                groups=NameFilter(exclude=["replay-*"]), topics=NameFilter(include=["events"])
+            ),
+        ),
+        "cluster2": ClusterSchedule(
+            interval=5.0,
+            timeout=3,
+            max_workers=128,
+            max_backoff=300.0,
+            scan_filter=ScanFilter(
+                groups=NameFilter(exclude=["test-*"]), topics=NameFilter(include=["events"])
+            ),
+        ),
+    }
+
+
+@patch("sentry_kafka_management.scripts.latency.consumer_latency.DatadogMetricsBackend")
+@patch(
+    "sentry_kafka_management.scripts.latency.consumer_latency."
+    "run_consumer_latency_scheduler_action"
+)
+def test_consumer_latency_reports_iterations_with_no_scans(
+    mock_scheduler: MagicMock,
+    mock_metrics_backend_cls: MagicMock,
+    temp_config: Path,
+) -> None:
+    def run(*_args: object, on_result: Callable[..., None], **_kwargs: object) -> None:
+        on_result("cluster1", ConsumerLatencyResult(scans=[]))
+
+    mock_scheduler.side_effect = run
 
     result = runner_invoke_with_statsd(temp_config)
 
     assert result.exit_code == 0
-    assert "No consumer latency collected" in result.output
-    metrics_backend.histogram.assert_not_called()
+    assert "No consumer latency collected for cluster cluster1" in result.output
 
 
 @patch("sentry_kafka_management.scripts.latency.consumer_latency.DatadogMetricsBackend")
 @patch(
-    "sentry_kafka_management.scripts.latency.consumer_latency.record_consumer_group_latency_action"
+    "sentry_kafka_management.scripts.latency.consumer_latency."
+    "run_consumer_latency_scheduler_action"
 )
 @patch("signal.signal")
 def test_consumer_latency_stops_gracefully_on_signal(
     mock_signal: MagicMock,
-    mock_record: MagicMock,
+    mock_scheduler: MagicMock,
     mock_metrics_backend_cls: MagicMock,
     temp_config: Path,
 ) -> None:
     handlers: dict[int, Callable[[int, object], None]] = {}
     mock_signal.side_effect = lambda signum, handler: handlers.__setitem__(signum, handler)
 
-    def record_then_signal(*_args: object, **_kwargs: object) -> ConsumerLatencyResult:
+    def run_then_signal(*_args: object, **_kwargs: object) -> None:
         # Simulate SIGTERM (e.g. a Kubernetes pod stop) landing mid-loop.
         handlers[signal.SIGTERM](signal.SIGTERM, None)
-        return ConsumerLatencyResult(scans=[])
 
-    mock_record.side_effect = record_then_signal
+    mock_scheduler.side_effect = run_then_signal
 
     result = runner_invoke_with_statsd(temp_config)
 
     assert result.exit_code == 0
     assert signal.SIGINT in handlers and signal.SIGTERM in handlers
-    mock_record.assert_called_once()
-    stop_event = mock_record.call_args.args[4]
+    mock_scheduler.assert_called_once()
+    stop_event = mock_scheduler.call_args.args[2]
     assert stop_event.is_set()
     assert "shutting down" in result.output
     assert "stopped" in result.output
@@ -166,18 +338,14 @@ def test_consumer_latency_stops_gracefully_on_signal(
 
 @patch("sentry_kafka_management.scripts.latency.consumer_latency.DatadogMetricsBackend")
 @patch(
-    "sentry_kafka_management.scripts.latency.consumer_latency.record_consumer_group_latency_action"
+    "sentry_kafka_management.scripts.latency.consumer_latency."
+    "run_consumer_latency_scheduler_action"
 )
-@patch.object(threading.Event, "wait", autospec=True)
-def test_consumer_latency_passes_selected_clusters(
-    mock_wait: MagicMock,
-    mock_record: MagicMock,
+def test_consumer_latency_schedules_selected_clusters(
+    mock_scheduler: MagicMock,
     mock_metrics_backend_cls: MagicMock,
     temp_config: Path,
 ) -> None:
-    mock_record.return_value = ConsumerLatencyResult(scans=[])
-    mock_wait.side_effect = _stop_after(1)
-
     result = CliRunner().invoke(
         consumer_latency,
         [
@@ -193,16 +361,17 @@ def test_consumer_latency_passes_selected_clusters(
     )
 
     assert result.exit_code == 0
-    mock_record.assert_called_once()
-    assert mock_record.call_args.kwargs["clusters"] == ("cluster2",)
+    mock_scheduler.assert_called_once()
+    assert list(mock_scheduler.call_args.args[3]) == ["cluster2"]
 
 
 @patch("sentry_kafka_management.scripts.latency.consumer_latency.DatadogMetricsBackend")
 @patch(
-    "sentry_kafka_management.scripts.latency.consumer_latency.record_consumer_group_latency_action"
+    "sentry_kafka_management.scripts.latency.consumer_latency."
+    "run_consumer_latency_scheduler_action"
 )
 def test_consumer_latency_rejects_unknown_cluster(
-    mock_record: MagicMock,
+    mock_scheduler: MagicMock,
     mock_metrics_backend_cls: MagicMock,
     temp_config: Path,
 ) -> None:
@@ -222,7 +391,7 @@ def test_consumer_latency_rejects_unknown_cluster(
 
     assert result.exit_code != 0
     assert "Unknown cluster(s): does-not-exist" in result.output
-    mock_record.assert_not_called()
+    mock_scheduler.assert_not_called()
 
 
 def runner_invoke_with_statsd(temp_config: Path, interval: str | None = None) -> Result:
@@ -237,3 +406,107 @@ def runner_invoke_with_statsd(temp_config: Path, interval: str | None = None) ->
     if interval is not None:
         args += ["--interval", interval]
     return CliRunner().invoke(consumer_latency, args)
+
+
+@patch("sentry_kafka_management.scripts.latency.consumer_latency.PrometheusMetricsBackend")
+@patch(
+    "sentry_kafka_management.scripts.latency.consumer_latency."
+    "run_consumer_latency_scheduler_action"
+)
+def test_consumer_latency_serves_prometheus_metrics(
+    mock_scheduler: MagicMock,
+    mock_prometheus_cls: MagicMock,
+    temp_config: Path,
+) -> None:
+    result = CliRunner().invoke(
+        consumer_latency,
+        [
+            "--config",
+            str(temp_config),
+            "--metrics-backend",
+            "prometheus",
+            "--prometheus-port",
+            "9100",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    mock_prometheus_cls.assert_called_once_with("0.0.0.0", 9100, stale_seconds=300.0)
+    backend = mock_prometheus_cls.return_value
+    backend.start.assert_called_once()
+    assert mock_scheduler.call_args.args[1] is backend
+    backend.close.assert_called_once()
+
+
+@patch("sentry_kafka_management.scripts.latency.consumer_latency.OtlpMetricsBackend")
+@patch(
+    "sentry_kafka_management.scripts.latency.consumer_latency."
+    "run_consumer_latency_scheduler_action"
+)
+def test_consumer_latency_exports_otlp_metrics(
+    mock_scheduler: MagicMock,
+    mock_otlp_cls: MagicMock,
+    temp_config: Path,
+) -> None:
+    missing = CliRunner().invoke(
+        consumer_latency, ["--config", str(temp_config), "--metrics-backend", "otlp"]
+    )
+    assert missing.exit_code != 0
+    assert "--otlp-endpoint" in missing.output
+
+    result = CliRunner().invoke(
+        consumer_latency,
+        [
+            "--config",
+            str(temp_config),
+            "--metrics-backend",
+            "otlp",
+            "--otlp-endpoint",
+            "http://collector:4318/v1/metrics",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    mock_otlp_cls.assert_called_once_with(endpoint="http://collector:4318/v1/metrics", path=None)
+    assert mock_scheduler.call_args.args[1] is mock_otlp_cls.return_value
+    mock_otlp_cls.return_value.close.assert_called_once()
+
+
+@patch("sentry_kafka_management.scripts.latency.consumer_latency.DatadogMetricsBackend")
+@patch(
+    "sentry_kafka_management.scripts.latency.consumer_latency."
+    "run_consumer_latency_scheduler_action"
+)
+def test_consumer_latency_passes_group_discovery_options(
+    mock_scheduler: MagicMock,
+    mock_metrics_backend_cls: MagicMock,
+    temp_config: Path,
+) -> None:
+    default = runner_invoke_with_statsd(temp_config)
+    assert default.exit_code == 0
+    assert isinstance(mock_scheduler.call_args.kwargs["group_cache"], ConsumerGroupCache)
+    assert mock_scheduler.call_args.kwargs["skip_group_states"] == frozenset()
+
+    result = CliRunner().invoke(
+        consumer_latency,
+        [
+            "--config",
+            str(temp_config),
+            "--statsd-host",
+            "localhost",
+            "--statsd-port",
+            "8126",
+            "--group-refresh-interval",
+            "300",
+            "--skip-group-state",
+            "empty",
+            "--skip-group-state",
+            "dead",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert mock_scheduler.call_args.kwargs["skip_group_states"] == {
+        ConsumerGroupState.EMPTY,
+        ConsumerGroupState.DEAD,
+    }
@@ -77,3 +77,26 @@ def test_load_clusters_and_topics(temp_config: Path) -> None:
     assert topic3["placement"] == {"zone": "zone1"}
     assert topic3["replication_factor"] == 2
     assert topic3["settings"] == {"compression.type": "snappy"}
+
+
+def test_load_cluster_latency_config(tmp_path: Path) -> None:
+    conf_path = tmp_path / "config.yaml"
+    conf_path.write_text("""
+- name: cluster1
+  brokers: [broker1:9092]
+  latency:
+    interval: 30
+    max_workers: 16
+    exclude_groups: ["replay-*", "test-*"]
+- name: cluster2
+  brokers: [broker2:9092]
+""")
+
+    clusters = YamlKafkaConfig(conf_path).get_clusters()
+
+    assert clusters["cluster1"]["latency"] == {
+        "interval": 30,
+        "max_workers": 16,
+        "exclude_groups": ["replay-*", "test-*"],
+    }
+    assert clusters["cluster2"]["latency"] == {}
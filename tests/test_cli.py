@@ -1,13 +1,9 @@
 import json
-import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import click.testing
 
-from sentry_kafka_management.actions.latency.consumer_latency import (
-    ConsumerLatencyResult,
-)
 from sentry_kafka_management.cli import main as cli
 
 
@@ -62,23 +58,14 @@ def test_cli_brokers_describe_configs(
 
 @patch("sentry_kafka_management.scripts.latency.consumer_latency.DatadogMetricsBackend")
 @patch(
-    "sentry_kafka_management.scripts.latency.consumer_latency.record_consumer_group_latency_action"
+    "sentry_kafka_management.scripts.latency.consumer_latency."
+    "run_consumer_latency_scheduler_action"
 )
-@patch.object(threading.Event, "wait", autospec=True)
 def test_cli_consumer_latency(
-    mock_wait: MagicMock,
-    mock_record_consumer_group_latency: MagicMock,
+    mock_run_consumer_latency_scheduler: MagicMock,
     mock_metrics_backend: MagicMock,
     temp_config: Path,
 ) -> None:
-    mock_record_consumer_group_latency.return_value = ConsumerLatencyResult(scans=[])
-
-    def stop_loop(event: threading.Event, _timeout: float | None = None) -> bool:
-        event.set()
-        return True
-
-    mock_wait.side_effect = stop_loop
-
     runner = click.testing.CliRunner()
     result = runner.invoke(
         cli,
@@ -95,4 +82,4 @@ def test_cli_consumer_latency(
 
     assert result.exit_code == 0
     mock_metrics_backend.assert_called_once_with("localhost", 8125)
-    mock_record_consumer_group_latency.assert_called_once()
+    mock_run_consumer_latency_scheduler.assert_called_once()